@@ -0,0 +1,140 @@
+"""
+All-Play
+Every team against every other team, every week, computed once per league
+
+Card 4's schedule luck and the spider chart's luck dimension asked "how many
+teams would this score have beaten?" by comparing a team's score with every
+other team's, week by week, for each team they were generated for. That is
+O(T^2 x W) per pass. Sorting each week's scores once answers it with a binary
+search instead: a score's position in the sorted week is the number of teams
+it beat, and the teams above and level with it are its losses and ties.
+
+The table holds, per team over the regular season:
+
+- all-play wins, losses and ties
+- expected wins: teams beaten / (teams - 1) each week, summed (ties count as neither)
+- median differential: score minus the median of the other teams' scores, summed
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Tuple
+
+
+def all_play_counts(week_scores: List[float], score: float) -> Tuple[int, int, int]:
+    """
+    A score's all-play result against the rest of its week
+
+    Args:
+        week_scores: Every team's score that week (including this one), sorted
+        score: The team's score
+
+    Returns:
+        (wins, losses, ties)
+    """
+    below = bisect_left(week_scores, score)
+    above = len(week_scores) - bisect_right(week_scores, score)
+    return below, above, len(week_scores) - below - above - 1
+
+
+class AllPlay:
+    """
+    All-play records and expected wins for every team in a league
+    """
+
+    def __init__(self, model, team_keys: Iterable[str], weeks: Iterable[int]):
+        """
+        Sort each week's scores and build every team's record
+
+        Args:
+            model: LeagueModel (team x week score matrix)
+            team_keys: Teams in the league
+            weeks: Weeks to count (e.g. the regular season)
+        """
+        self.team_keys = list(team_keys)
+        self.weeks = list(weeks)
+        self.num_teams = len(self.team_keys)
+
+        # week -> scores of every team that played it, sorted
+        self.week_scores: Dict[int, List[float]] = {
+            week: sorted(model.scores[model.team_index[tk]][week] for tk in self.team_keys
+                         if model.team_played(tk, week))
+            for week in self.weeks
+        }
+
+        self.records: Dict[str, Dict] = {}
+        for tk in self.team_keys:
+            record = {'wins': 0, 'losses': 0, 'ties': 0, 'expected_wins': 0, 'median_differential': 0.0}
+            for week in self.weeks:
+                if not model.team_played(tk, week):
+                    continue
+                score = model.scores[model.team_index[tk]][week]
+                wins, losses, ties = all_play_counts(self.week_scores[week], score)
+                record['wins'] += wins
+                record['losses'] += losses
+                record['ties'] += ties
+                if self.num_teams > 1:
+                    record['expected_wins'] += wins / (self.num_teams - 1)
+                record['median_differential'] += score - self.median_opponent(week, score)
+            self.records[tk] = record
+
+    def teams_below(self, week: int, score: float) -> int:
+        """Number of teams that scored less than score in a week"""
+        return bisect_left(self.week_scores.get(week, []), score)
+
+    def median_opponent(self, week: int, score: float) -> float:
+        """
+        Median score of the other teams in a week
+
+        Args:
+            week: Week number
+            score: The team's own score (one copy is left out of the week)
+
+        Returns:
+            Median of the remaining scores (0 if no other team played)
+        """
+        week_scores = self.week_scores.get(week, [])
+        own = bisect_left(week_scores, score)
+        others = len(week_scores) - 1
+        if others <= 0:
+            return 0.0
+
+        def other(k):
+            return week_scores[k if k < own else k + 1]
+
+        middle = others // 2
+        if others % 2:
+            return other(middle)
+        return (other(middle - 1) + other(middle)) / 2
+
+    def record(self, team_key: str) -> Dict:
+        """A team's all-play wins, losses, ties, expected wins and median differential"""
+        return self.records[team_key]
+
+    def expected_wins(self, team_key: str) -> float:
+        """Wins expected from a team's scores against the whole league"""
+        return self.records[team_key]['expected_wins']
+
+    def standings(self) -> List[Dict]:
+        """
+        All-play standings, best all-play win percentage first
+
+        Returns:
+            List of dicts with rank, team_key, wins, losses, ties, win_pct,
+            expected_wins and median_differential
+        """
+        rows = []
+        for tk, record in self.records.items():
+            games = record['wins'] + record['losses'] + record['ties']
+            rows.append({
+                'team_key': tk,
+                'wins': record['wins'],
+                'losses': record['losses'],
+                'ties': record['ties'],
+                'win_pct': round((record['wins'] + record['ties'] / 2) / games * 100, 1) if games else 0.0,
+                'expected_wins': round(record['expected_wins'], 2),
+                'median_differential': round(record['median_differential'], 2),
+            })
+        rows.sort(key=lambda row: (row['win_pct'], row['median_differential']), reverse=True)
+        for rank, row in enumerate(rows, 1):
+            row['rank'] = rank
+        return rows
@@ -0,0 +1,355 @@
+"""
+API Record/Replay Harness
+Capture real Yahoo/Sleeper responses into a fixture bundle and serve them back locally
+
+Puller changes can otherwise only be timed against the live APIs, which are
+rate limited and change week to week. Record a league once, then replay it
+from a local stand-in server with configurable latency, rate limiting and
+error injection to benchmark throughput, concurrency and retry behavior
+with no network.
+
+Usage:
+    # Record (live APIs)
+    python api_replay.py record-sleeper --league-id 123456789 --bundle fixtures/my_league
+    python api_replay.py record-yahoo --bundle fixtures/my_league --work-dir . [--batched]
+
+    # Serve the bundle
+    python api_replay.py serve --bundle fixtures/my_league --port 8765 --latency 0.15 --rate-limit 4
+
+    # Point the pullers at it
+    python sleeper_data_puller.py --league-id 123456789 --api-base http://127.0.0.1:8765/sleeper/v1
+    python data_puller.py --api-base http://127.0.0.1:8765/yahoo/fantasy/v2
+"""
+
+import os
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from rate_limiter import TokenBucket
+
+# URL prefixes the stand-in serves each API under
+YAHOO_PREFIX = '/yahoo/fantasy/v2'
+SLEEPER_PREFIX = '/sleeper/v1'
+
+# How each API answers when the stand-in rate limit is exceeded
+THROTTLE_RESPONSES = {
+    'yahoo': (999, b'Request denied'),
+    'sleeper': (429, b'Too Many Requests'),
+}
+
+
+class FixtureBundle:
+    """
+    Directory of recorded API responses, one JSON file per request path
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Bundle directory (created on first save)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _file_for(self, api, request_path):
+        digest = hashlib.sha256(request_path.encode('utf-8')).hexdigest()
+        return os.path.join(self.path, api, f"{digest}.json")
+
+    def save(self, api, request_path, body):
+        """
+        Record a response
+
+        Args:
+            api: 'yahoo' or 'sleeper'
+            request_path: Yahoo URI or Sleeper endpoint (without the base URL)
+            body: Decoded JSON response
+        """
+        file_path = self._file_for(api, request_path)
+        with self._lock:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'w') as f:
+                json.dump({'path': request_path, 'body': body}, f)
+
+    def load(self, api, request_path):
+        """
+        Look up a recorded response
+
+        Returns:
+            (found, body) tuple
+        """
+        file_path = self._file_for(api, request_path)
+        if not os.path.exists(file_path):
+            return False, None
+        with open(file_path, 'r') as f:
+            return True, json.load(f)['body']
+
+    def paths(self, api):
+        """List the request paths recorded for an API"""
+        api_dir = os.path.join(self.path, api)
+        if not os.path.isdir(api_dir):
+            return []
+        paths = []
+        for name in sorted(os.listdir(api_dir)):
+            with open(os.path.join(api_dir, name), 'r') as f:
+                paths.append(json.load(f)['path'])
+        return sorted(paths)
+
+
+def record_yahoo(bundle):
+    """
+    Record every Yahoo response made through yahoo-fantasy-api
+
+    Game, League and Team objects each build their own YHandler, so the class
+    method is wrapped rather than a single instance.
+
+    Args:
+        bundle: FixtureBundle to record into
+
+    Returns:
+        Function that stops recording
+    """
+    from yahoo_fantasy_api import yhandler
+
+    original_get = yhandler.YHandler.get
+
+    def recording_get(handler, uri):
+        body = original_get(handler, uri)
+        bundle.save('yahoo', uri, body)
+        return body
+
+    yhandler.YHandler.get = recording_get
+
+    def stop():
+        yhandler.YHandler.get = original_get
+
+    return stop
+
+
+def record_sleeper(puller, bundle):
+    """
+    Record every Sleeper response a puller fetches
+
+    Args:
+        puller: SleeperDataPuller instance
+        bundle: FixtureBundle to record into
+    """
+    original_fetch = puller._fetch
+
+    def recording_fetch(endpoint):
+        body = original_fetch(endpoint)
+        if body is not None:
+            bundle.save('sleeper', endpoint, body)
+        return body
+
+    puller._fetch = recording_fetch
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves recorded responses for /yahoo/fantasy/v2/... and /sleeper/v1/..."""
+
+    def log_message(self, format, *args):
+        # Request logging would dominate benchmark output
+        pass
+
+    def _send(self, status, body, content_type='application/json'):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        path = unquote(urlsplit(self.path).path)
+
+        if path.startswith(YAHOO_PREFIX + '/'):
+            api, request_path = 'yahoo', path[len(YAHOO_PREFIX) + 1:]
+        elif path.startswith(SLEEPER_PREFIX + '/'):
+            api, request_path = 'sleeper', path[len(SLEEPER_PREFIX):]
+        else:
+            server.count('not_found')
+            self._send(404, b'Unknown API prefix', 'text/plain')
+            return
+
+        server.count('requests')
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        if server.rate_limiter is not None and not server.rate_limiter.try_acquire():
+            server.count('throttled')
+            status, body = THROTTLE_RESPONSES[api]
+            self._send(status, body, 'text/plain')
+            return
+
+        if server.error_rate and server.random() < server.error_rate:
+            server.count('errors')
+            self._send(503, b'503 Service Unavailable', 'text/plain')
+            return
+
+        found, body = server.bundle.load(api, request_path)
+        if not found:
+            server.count('not_found')
+            self._send(404, f'No recording for {api} {request_path}'.encode('utf-8'), 'text/plain')
+            return
+
+        server.count('served')
+        self._send(200, json.dumps(body).encode('utf-8'))
+
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    Local HTTP stand-in for the Yahoo and Sleeper APIs
+    """
+
+    daemon_threads = True
+
+    def __init__(self, bundle, host='127.0.0.1', port=0, latency=0.0,
+                 rate_limit=None, burst=None, error_rate=0.0, seed=0):
+        """
+        Args:
+            bundle: FixtureBundle (or bundle directory) to serve
+            host, port: Address to bind (port 0 picks a free port)
+            latency: Seconds added to every response
+            rate_limit: Requests per second before throttle responses (None = unlimited)
+            burst: Requests allowed in a burst (default: rate_limit)
+            error_rate: Fraction of requests answered with a 503
+            seed: Seed for error injection so runs are reproducible
+        """
+        super().__init__((host, port), StandInHandler)
+        self.bundle = bundle if isinstance(bundle, FixtureBundle) else FixtureBundle(bundle)
+        self.latency = latency
+        self.rate_limiter = TokenBucket(rate_limit, burst) if rate_limit else None
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+        self.counters = {'requests': 0, 'served': 0, 'throttled': 0, 'errors': 0, 'not_found': 0}
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def yahoo_base(self):
+        return self.url + YAHOO_PREFIX
+
+    @property
+    def sleeper_base(self):
+        return self.url + SLEEPER_PREFIX
+
+    def random(self):
+        with self._lock:
+            return self._random.random()
+
+    def count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def start(self):
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port"""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def summary(self):
+        c = self.counters
+        return (f"Stand-in: {c['requests']} requests, {c['served']} served, "
+                f"{c['throttled']} throttled, {c['errors']} errors, {c['not_found']} not found")
+
+
+def main():
+    """
+    Command line entry point: record a league or serve a bundle
+    """
+    parser = argparse.ArgumentParser(description='Record/replay Yahoo and Sleeper API responses')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve = sub.add_parser('serve', help='Serve a fixture bundle')
+    serve.add_argument('--bundle', required=True, help='Fixture bundle directory')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    serve.add_argument('--rate-limit', type=float, default=None, help='Requests per second before throttling')
+    serve.add_argument('--burst', type=float, default=None, help='Burst size for the rate limit')
+    serve.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with a 503')
+    serve.add_argument('--seed', type=int, default=0, help='Seed for error injection')
+
+    rec_sleeper = sub.add_parser('record-sleeper', help='Pull a Sleeper league live and record it')
+    rec_sleeper.add_argument('--league-id', required=True, help='Sleeper league ID')
+    rec_sleeper.add_argument('--bundle', required=True, help='Fixture bundle directory')
+
+    rec_yahoo = sub.add_parser('record-yahoo', help='Pull a Yahoo league live and record it')
+    rec_yahoo.add_argument('--bundle', required=True, help='Fixture bundle directory')
+    rec_yahoo.add_argument('--work-dir', default='.', help='Directory with .env and oauth2.json')
+    rec_yahoo.add_argument('--batched', action='store_true',
+                           help='Record the league-wide roster requests (replay with --batched)')
+
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        server = StandInServer(args.bundle, args.host, args.port, args.latency,
+                               args.rate_limit, args.burst, args.error_rate, args.seed)
+        print(f"Serving {args.bundle}")
+        print(f"  Yahoo:   {server.yahoo_base}")
+        print(f"  Sleeper: {server.sleeper_base}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            print(f"\n{server.summary()}")
+
+    elif args.command == 'record-sleeper':
+        from sleeper_data_puller import SleeperDataPuller
+        from response_cache import ResponseCache
+
+        bundle = FixtureBundle(args.bundle)
+        # Bypass the response cache so every request reaches the API and gets recorded
+        puller = SleeperDataPuller(args.league_id, response_cache=ResponseCache(None))
+        record_sleeper(puller, bundle)
+        puller.pull_complete_season_data()
+
+        # The shared player store may have been fresh, so record the dump explicitly
+        if '/players/nfl' not in bundle.paths('sleeper'):
+            puller._fetch("/players/nfl")
+        print(f"✓ Recorded {len(bundle.paths('sleeper'))} Sleeper responses to {args.bundle}")
+
+    elif args.command == 'record-yahoo':
+        from dotenv import load_dotenv
+        from data_puller import FantasyWrappedDataPuller
+        from response_cache import ResponseCache
+
+        load_dotenv(os.path.join(args.work_dir, '.env'))
+        league_id = os.getenv('LEAGUE_ID')
+        season = int(os.getenv('SEASON_YEAR', 2024))
+
+        bundle = FixtureBundle(args.bundle)
+        stop = record_yahoo(bundle)
+        try:
+            puller = FantasyWrappedDataPuller(league_id, season, work_dir=args.work_dir,
+                                              batched=args.batched, response_cache=ResponseCache(None))
+            puller.authenticate()
+            puller.pull_complete_season_data(resume=False)
+        finally:
+            stop()
+        print(f"✓ Recorded {len(bundle.paths('yahoo'))} Yahoo responses to {args.bundle}")
+
+
+if __name__ == '__main__':
+    main()
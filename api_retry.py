@@ -0,0 +1,167 @@
+"""
+API Retry Layer
+Classified errors, exponential backoff with jitter, and a per-pull retry budget
+
+Yahoo signals throttling with a 999 "Request denied" response and expired
+OAuth tokens with a 401 "token_expired" problem; yahoo-fantasy-api surfaces
+both as a RuntimeError carrying the response body. Network failures surface
+as OSError subclasses (requests exceptions included). Throttles, expired
+tokens and network failures are retried; anything else is a real failure
+and is raised to the caller immediately.
+"""
+
+import random
+import threading
+import time
+
+
+class ApiError(Exception):
+    """Base class for classified API failures"""
+
+
+class ThrottledError(ApiError):
+    """The API is rate limiting us - back off before retrying"""
+
+
+class AuthExpiredError(ApiError):
+    """The OAuth access token expired - refresh before retrying"""
+
+
+class TransientError(ApiError):
+    """Network or server hiccup - retry shortly"""
+
+
+class RetryBudgetExhausted(ApiError):
+    """Too many retries this pull - stop instead of grinding toward the timeout"""
+
+
+# Backoff settings per error class: (base delay seconds, max delay seconds)
+BACKOFF_SECONDS = {
+    ThrottledError: (5.0, 60.0),
+    AuthExpiredError: (1.0, 4.0),  # give the token refresh a moment to land
+    TransientError: (1.0, 15.0),
+}
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_BUDGET = 50
+
+
+def classify_yahoo_error(exc):
+    """
+    Map an exception from a Yahoo API call to a retryable error class
+
+    Args:
+        exc: Exception raised by yahoo-fantasy-api / yahoo_oauth / requests
+
+    Returns:
+        ThrottledError, AuthExpiredError or TransientError class, or None if
+        the failure should not be retried
+    """
+    if isinstance(exc, ApiError):
+        return type(exc) if type(exc) in BACKOFF_SECONDS else None
+
+    text = str(exc).lower()
+
+    if 'token_expired' in text or 'oauth_problem' in text or 'invalid_token' in text:
+        return AuthExpiredError
+    if 'request denied' in text or 'rate limit' in text or 'too many requests' in text:
+        return ThrottledError
+    if any(code in text for code in ('bad gateway', 'service unavailable', 'gateway timeout',
+                                     'temporarily unavailable')):
+        return TransientError
+    # requests' exceptions derive from IOError, as do socket timeouts and resets
+    if isinstance(exc, OSError):
+        return TransientError
+
+    return None
+
+
+class RetryBudget:
+    """
+    Thread-safe count of retries left for one pull
+    """
+
+    def __init__(self, total=DEFAULT_RETRY_BUDGET):
+        """
+        Args:
+            total: Retries allowed across every call in the pull
+        """
+        self.total = total
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def take(self):
+        """
+        Spend one retry
+
+        Returns:
+            True if a retry was available
+        """
+        with self._lock:
+            if self.used >= self.total:
+                return False
+            self.used += 1
+            return True
+
+    @property
+    def remaining(self):
+        with self._lock:
+            return self.total - self.used
+
+
+def backoff_delay(error_class, attempt):
+    """
+    Full-jitter exponential backoff
+
+    Args:
+        error_class: Classified error (selects base/max delay)
+        attempt: Retry number, starting at 0
+
+    Returns:
+        Seconds to sleep
+    """
+    base, cap = BACKOFF_SECONDS.get(error_class, (1.0, 15.0))
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def call_with_retry(func, *args, classify=classify_yahoo_error, budget=None,
+                    max_attempts=DEFAULT_MAX_ATTEMPTS, on_auth_expired=None, **kwargs):
+    """
+    Call func, retrying classified failures with backoff
+
+    Args:
+        func: Function that makes the API call
+        *args, **kwargs: Arguments to pass to function
+        classify: Maps an exception to a retryable error class (or None)
+        budget: RetryBudget shared across the pull (optional)
+        max_attempts: Attempts per call, including the first
+        on_auth_expired: Called before retrying an expired-token failure
+
+    Returns:
+        Result of function call
+
+    Raises:
+        The original exception for unclassified failures, the classified
+        ApiError once attempts run out, or RetryBudgetExhausted
+    """
+    attempt = 0
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            error_class = classify(e)
+            if error_class is None:
+                raise
+
+            if attempt + 1 >= max_attempts:
+                raise error_class(f"{e} (gave up after {max_attempts} attempts)") from e
+            if budget is not None and not budget.take():
+                raise RetryBudgetExhausted(f"{e} (retry budget of {budget.total} used up)") from e
+
+            if error_class is AuthExpiredError and on_auth_expired is not None:
+                on_auth_expired()
+
+            delay = backoff_delay(error_class, attempt)
+            print(f"      {error_class.__name__}: {e} - retrying in {delay:.1f}s")
+            time.sleep(delay)
+            attempt += 1
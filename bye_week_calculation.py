@@ -126,18 +126,6 @@ def calculate_league_bye_week_percentile(calc, team_key: str) -> float:
     Returns:
         Percentile (0-100) for bye week management
     """
-    # Calculate bye week scores for all teams
-    team_scores = {}
-
-    for tk in calc.teams.keys():
-        bye_data = calculate_bye_week_management(calc, tk)
-        # Use average replacement points as the score
-        # Higher is better (better replacements during bye weeks)
-        team_scores[tk] = bye_data['avg_replacement_points']
-
-    # Calculate percentile based on ranking
-    this_team_score = team_scores[team_key]
-    teams_below = sum(1 for score in team_scores.values() if score < this_team_score)
-    percentile = (teams_below / (len(team_scores) - 1)) * 100 if len(team_scores) > 1 else 50
-
-    return percentile
+    # Bye week scores for all teams are computed once per league
+    # Higher average replacement points = better bye week management
+    return calc.get_league_context().percentile('bye_week_scores', team_key)
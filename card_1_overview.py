@@ -51,23 +51,8 @@ def calculate_card_1_overview(calc, team_key: str, other_cards: dict = None, ass
     bye_week_percentile = calculate_league_bye_week_percentile(calc, team_key)
 
     # 4. WAIVER ACTIVITY
-    # Calculate waiver scores for all teams once (cached)
-    if not hasattr(calc, '_waiver_scores_cache'):
-        from card_2_ledger import calculate_card_2_ledger
-        calc._waiver_scores_cache = {}
-
-        for tk in calc.teams.keys():
-            tk_card2 = calculate_card_2_ledger(calc, tk)
-            tk_waiver_pts = tk_card2.get('waivers', {}).get('total_points_started', 0)
-            tk_costly_drops = tk_card2.get('costly_drops', {}).get('total_value_given_away', 0)
-            # Net waiver score = points added - points given away
-            tk_waiver_score = tk_waiver_pts - tk_costly_drops
-            calc._waiver_scores_cache[tk] = tk_waiver_score
-
-    # Calculate percentile based on ranking
-    this_team_score = calc._waiver_scores_cache[team_key]
-    teams_below = sum(1 for score in calc._waiver_scores_cache.values() if score < this_team_score)
-    waiver_percentile = (teams_below / (num_teams - 1)) * 100 if num_teams > 1 else 50
+    # Net waiver score (points added - points given away) ranked across the league
+    waiver_percentile = calc.get_league_context().percentile('waiver_scores', team_key)
 
     # ================================================================
     # Calculate overall percentile as average of 4 skill dimensions
@@ -18,32 +18,17 @@ def _count_injured_weeks(calc, player_id: str) -> int:
     """
     Count how many weeks a player had an injured status (O, IR, D).
 
-    Searches all teams' weekly rosters to find the player and check their status.
+    Looks up the player's roster listing each week in the league model's
+    occupancy index (the first team in league order that rostered them).
     Returns the number of weeks with injured status.
     """
     injured_weeks = 0
     regular_season_weeks = calc.get_regular_season_weeks()
 
     for week in regular_season_weeks:
-        week_key = f'week_{week}'
-
-        # Search all teams' rosters for this player
-        for tk in calc.teams.keys():
-            if week_key not in calc.weekly_data.get(tk, {}):
-                continue
-
-            roster = calc.weekly_data[tk][week_key].get('roster', {})
-            all_players = roster.get('starters', []) + roster.get('bench', [])
-
-            for player in all_players:
-                if str(player.get('player_id', '')) == player_id:
-                    status = player.get('status', '')
-                    if status in ['O', 'IR', 'D']:
-                        injured_weeks += 1
-                    break  # Found player this week, move to next week
-            else:
-                continue
-            break  # Found player on a team, move to next week
+        listing = calc.model.occupant(player_id, week)
+        if listing is not None and listing.team_key in calc.teams and listing.status in ['O', 'IR', 'D']:
+            injured_weeks += 1
 
     return injured_weeks
 
@@ -57,21 +42,16 @@ def calculate_card_2_ledger(calc, team_key: str) -> dict:
     """
     team = calc.teams[team_key]
     manager_name = team.get('manager_name', 'Unknown')
-    num_teams = len(calc.teams)
 
-    # Get the last regular season week (calculations should NOT include playoff weeks)
-    playoff_start = int(calc.league.get('playoff_start_week', 15))
-    current_week = int(calc.league.get('current_week', 14))
-    last_reg_season_week = min(playoff_start - 1, current_week)
+    # League-wide vectors (draft, waiver, trade and drop values for every team) are computed once
+    context = calc.get_league_context()
 
     # ================================================================
     # DRAFT ANALYSIS
     # ================================================================
 
     # Detect draft type: auction (varied costs) vs snake (costs are 0 or uniform)
-    all_costs = [p.get('cost', 0) for p in calc.draft]
-    unique_costs = len(set(all_costs))
-    is_auction = unique_costs > 3 and max(all_costs) > 0
+    is_auction = context.is_auction
 
     # Get all draft picks for this team
     team_draft_picks = [p for p in calc.draft if p.get('team_key') == team_key]
@@ -101,17 +81,7 @@ def calculate_card_2_ledger(calc, team_key: str) -> dict:
         })
 
     # Rank by draft points
-    all_team_draft_points = {}
-    for tk in calc.teams.keys():
-        tk_picks = [p for p in calc.draft if p.get('team_key') == tk]
-        tk_total = 0
-        for pick in tk_picks:
-            player_id = str(pick.get('player_id', ''))
-            tk_total += sum(calc.player_points_by_week.get(player_id, {}).values())
-        all_team_draft_points[tk] = tk_total
-
-    sorted_teams = sorted(all_team_draft_points.items(), key=lambda x: x[1], reverse=True)
-    draft_rank = next((i + 1 for i, (tk, _) in enumerate(sorted_teams) if tk == team_key), num_teams)
+    draft_rank = context.rank('draft_points', team_key)
 
     # Calculate best value and biggest bust based on draft type
     if draft_player_scores:
@@ -139,7 +109,7 @@ def calculate_card_2_ledger(calc, team_key: str) -> dict:
             # Filter out injured players
             eligible_busts = [
                 p for p in expensive_players
-                if _count_injured_weeks(calc, p['player_id']) < INJURY_EXCLUSION_THRESHOLD
+                if context.injured_weeks(p['player_id']) < INJURY_EXCLUSION_THRESHOLD
             ]
             if eligible_busts:
                 eligible_busts.sort(key=lambda x: x['points'])
@@ -152,20 +122,8 @@ def calculate_card_2_ledger(calc, team_key: str) -> dict:
                 biggest_bust = {}
         else:
             # SNAKE: Use Points Above Round Average (vs Rd Avg)
-            # Calculate average points per round across all teams
-            # NOTE: Exclude keepers from round average calculation - their round values are artificial
-            round_points = {}  # {round: [points]}
-            for pick in calc.draft:
-                rnd = pick.get('round', 0)
-                is_keeper = pick.get('is_keeper', False)
-                if rnd > 0 and not is_keeper:  # Exclude keepers from averages
-                    pid = str(pick.get('player_id', ''))
-                    pts = sum(calc.player_points_by_week.get(pid, {}).values())
-                    if rnd not in round_points:
-                        round_points[rnd] = []
-                    round_points[rnd].append(pts)
-
-            round_avg = {rnd: sum(pts) / len(pts) for rnd, pts in round_points.items() if pts}
+            # Average points per round across all teams (keepers excluded - their round values are artificial)
+            round_avg = context.round_averages
 
             # Calculate vs Rd Avg for each player
             for p in draft_player_scores:
@@ -195,7 +153,7 @@ def calculate_card_2_ledger(calc, team_key: str) -> dict:
             # Filter out injured players
             eligible_busts = [
                 p for p in early_picks
-                if _count_injured_weeks(calc, p['player_id']) < INJURY_EXCLUSION_THRESHOLD
+                if context.injured_weeks(p['player_id']) < INJURY_EXCLUSION_THRESHOLD
             ]
             if eligible_busts:
                 eligible_busts.sort(key=lambda x: x['value'])
@@ -214,99 +172,11 @@ def calculate_card_2_ledger(calc, team_key: str) -> dict:
     # RANK BEST VALUE AND BIGGEST BUST ACROSS LEAGUE
     # ================================================================
 
-    # Calculate best value for each team and rank
-    all_team_best_values = {}
-    all_team_biggest_busts = {}
-
-    for tk in calc.teams.keys():
-        tk_picks = [p for p in calc.draft if p.get('team_key') == tk]
-        if not tk_picks:
-            all_team_best_values[tk] = float('-inf')
-            all_team_biggest_busts[tk] = float('inf')
-            continue
-
-        tk_scores = []
-        for pick in tk_picks:
-            pid = str(pick.get('player_id', ''))
-            pts = sum(calc.player_points_by_week.get(pid, {}).values())
-            tk_scores.append({
-                'player_id': pid,
-                'points': pts,
-                'cost': pick.get('cost', 0),
-                'round': pick.get('round', 0),
-                'is_keeper': pick.get('is_keeper', False),
-            })
-
-        if is_auction:
-            # Auction: value = pts/$
-            for p in tk_scores:
-                p['value'] = p['points'] / max(p['cost'], 1)
-
-            # Exclude keepers from value ranking (their cost is artificial)
-            non_keepers = [p for p in tk_scores if not p.get('is_keeper')]
-            if non_keepers:
-                non_keepers.sort(key=lambda x: x['value'], reverse=True)
-                all_team_best_values[tk] = non_keepers[0]['value']
-            elif tk_scores:
-                tk_scores.sort(key=lambda x: x['value'], reverse=True)
-                all_team_best_values[tk] = tk_scores[0]['value']
-            else:
-                all_team_best_values[tk] = 0
-
-            # Bust: lowest points among $5+ picks (excluding injured players and keepers)
-            expensive = [p for p in tk_scores if p['cost'] >= 5 and not p.get('is_keeper')]
-            eligible = [
-                p for p in expensive
-                if _count_injured_weeks(calc, p['player_id']) < INJURY_EXCLUSION_THRESHOLD
-            ]
-            if eligible:
-                eligible.sort(key=lambda x: x['points'])
-                all_team_biggest_busts[tk] = eligible[0]['points']
-            elif expensive:
-                expensive.sort(key=lambda x: x['points'])
-                all_team_biggest_busts[tk] = expensive[0]['points']
-            else:
-                all_team_biggest_busts[tk] = float('inf')
-        else:
-            # Snake: value = PARA (vs Rd Avg)
-            for p in tk_scores:
-                rnd = p['round']
-                avg = round_avg.get(rnd, 0)
-                p['value'] = p['points'] - avg
-
-            # Exclude keepers from value ranking (their round is artificial)
-            non_keepers = [p for p in tk_scores if not p.get('is_keeper')]
-            if non_keepers:
-                non_keepers.sort(key=lambda x: x['value'], reverse=True)
-                all_team_best_values[tk] = non_keepers[0]['value']
-            elif tk_scores:
-                tk_scores.sort(key=lambda x: x['value'], reverse=True)
-                all_team_best_values[tk] = tk_scores[0]['value']
-            else:
-                all_team_best_values[tk] = 0
-
-            # Bust: lowest PARA among Rd 1-4 picks (excluding injured players and keepers)
-            early = [p for p in tk_scores if p['round'] <= 4 and not p.get('is_keeper')]
-            eligible = [
-                p for p in early
-                if _count_injured_weeks(calc, p['player_id']) < INJURY_EXCLUSION_THRESHOLD
-            ]
-            if eligible:
-                eligible.sort(key=lambda x: x['value'])
-                all_team_biggest_busts[tk] = eligible[0]['value']
-            elif early:
-                early.sort(key=lambda x: x['value'])
-                all_team_biggest_busts[tk] = early[0]['value']
-            else:
-                all_team_biggest_busts[tk] = float('inf')
-
     # Rank best values (higher is better)
-    sorted_values = sorted(all_team_best_values.items(), key=lambda x: x[1], reverse=True)
-    best_value_rank = next((i + 1 for i, (tk, _) in enumerate(sorted_values) if tk == team_key), num_teams)
+    best_value_rank = context.rank('best_draft_values', team_key)
 
     # Rank biggest busts (lower/more negative is worse = rank 1)
-    sorted_busts = sorted(all_team_biggest_busts.items(), key=lambda x: x[1])
-    biggest_bust_rank = next((i + 1 for i, (tk, _) in enumerate(sorted_busts) if tk == team_key), num_teams)
+    biggest_bust_rank = context.rank('biggest_draft_busts', team_key, reverse=False)
 
     # Add ranks to the best_value and biggest_bust dicts
     if best_value:
@@ -324,64 +194,20 @@ def calculate_card_2_ledger(calc, team_key: str) -> dict:
     waiver_total_points_started = 0
     waiver_adds_list = []
 
-    for transaction in waiver_adds:
-        # Player info is now flattened at transaction level
-        player_id = str(transaction.get('player_id', ''))
-        player_name = transaction.get('player_name', 'Unknown')
-        if not player_id:
-            continue
-
-        # Calculate points scored by this player as a starter for this team
-        total_points_started = 0
-        weeks_started = 0
-
-        regular_season_weeks = calc.get_regular_season_weeks()
-        for week in regular_season_weeks:
-            week_key = f'week_{week}'
-            if week_key in calc.weekly_data.get(team_key, {}):
-                starters = calc.weekly_data[team_key][week_key].get('roster', {}).get('starters', [])
-                for starter in starters:
-                    if str(starter.get('player_id')) == player_id:
-                        pts = starter.get('actual_points', 0)
-                        total_points_started += pts
-                        weeks_started += 1
-
+    # Points each added player scored as a starter for this team
+    for transaction, total_points_started, weeks_started in context.waiver_adds[team_key]:
         waiver_total_points_started += total_points_started
 
         if total_points_started > 0:
             waiver_adds_list.append({
-                'player_name': player_name,
-                'player_id': player_id,
+                'player_name': transaction.get('player_name', 'Unknown'),
+                'player_id': str(transaction.get('player_id', '')),
                 'points_started': total_points_started,
                 'weeks_started': weeks_started
             })
 
     # Rank by waiver points
-    all_team_waiver_points = {}
-    regular_season_weeks = calc.get_regular_season_weeks()
-    for tk in calc.teams.keys():
-        tk_transactions = calc.transactions_by_team.get(tk, [])
-        tk_waiver_adds = [t for t in tk_transactions if t.get('type') in ['add', 'trade']]
-        tk_total = 0
-
-        for transaction in tk_waiver_adds:
-            # Player info is now flattened at transaction level
-            player_id = str(transaction.get('player_id', ''))
-            if not player_id:
-                continue
-
-            for week in regular_season_weeks:
-                week_key = f'week_{week}'
-                if week_key in calc.weekly_data.get(tk, {}):
-                    starters = calc.weekly_data[tk][week_key].get('roster', {}).get('starters', [])
-                    for starter in starters:
-                        if str(starter.get('player_id')) == player_id:
-                            tk_total += starter.get('actual_points', 0)
-
-        all_team_waiver_points[tk] = tk_total
-
-    sorted_teams = sorted(all_team_waiver_points.items(), key=lambda x: x[1], reverse=True)
-    waiver_rank = next((i + 1 for i, (tk, _) in enumerate(sorted_teams) if tk == team_key), num_teams)
+    waiver_rank = context.rank('waiver_points_started', team_key)
 
     # Get best waiver adds
     waiver_adds_list.sort(key=lambda x: x['points_started'], reverse=True)
@@ -391,39 +217,8 @@ def calculate_card_2_ledger(calc, team_key: str) -> dict:
     # RANK BEST WAIVER ADD ACROSS LEAGUE
     # ================================================================
 
-    # For each team, find their best waiver add's pts/start
-    all_team_best_add_value = {}
-    for tk in calc.teams.keys():
-        tk_transactions = calc.transactions_by_team.get(tk, [])
-        tk_waiver_adds = [t for t in tk_transactions if t.get('type') in ['add', 'trade']]
-
-        best_pts_per_start = 0
-        for transaction in tk_waiver_adds:
-            player_id = str(transaction.get('player_id', ''))
-            if not player_id:
-                continue
-
-            pts_started = 0
-            weeks_started = 0
-            for week in regular_season_weeks:
-                week_key = f'week_{week}'
-                if week_key in calc.weekly_data.get(tk, {}):
-                    starters = calc.weekly_data[tk][week_key].get('roster', {}).get('starters', [])
-                    for starter in starters:
-                        if str(starter.get('player_id')) == player_id:
-                            pts_started += starter.get('actual_points', 0)
-                            weeks_started += 1
-
-            if weeks_started > 0:
-                pts_per_start = pts_started / weeks_started
-                if pts_per_start > best_pts_per_start:
-                    best_pts_per_start = pts_per_start
-
-        all_team_best_add_value[tk] = best_pts_per_start
-
     # Rank best waiver adds (higher pts/start is better)
-    sorted_add_values = sorted(all_team_best_add_value.items(), key=lambda x: x[1], reverse=True)
-    best_add_rank = next((i + 1 for i, (tk, _) in enumerate(sorted_add_values) if tk == team_key), num_teams)
+    best_add_rank = context.rank('best_add_values', team_key)
 
     # Add rank to the best add
     if best_adds:
@@ -433,118 +228,26 @@ def calculate_card_2_ledger(calc, team_key: str) -> dict:
     # TRADE ANALYSIS
     # ================================================================
 
-    trade_transactions = [t for t in team_transactions if t.get('type') == 'trade']
     trade_net_impact = 0
     trades_list = []
 
-    # Group trade transactions by transaction_id to pair players in/out
-    from collections import defaultdict
-    trades_by_id = defaultdict(lambda: {'players_in': [], 'players_out': [], 'week': 1})
-
-    for t in trade_transactions:
-        tid = t.get('transaction_id')
-        week = t.get('week', 1)
-        trades_by_id[tid]['week'] = week
-
-        # Check if this team received or sent the player
-        if t.get('destination_team_key') == team_key:
-            # We received this player
-            trades_by_id[tid]['players_in'].append({
-                'player_name': t.get('player_name', 'Unknown'),
-                'player_id': t.get('player_id')
-            })
-        elif t.get('source_team_key') == team_key or t.get('trade_direction') == 'out':
-            # We sent this player
-            trades_by_id[tid]['players_out'].append({
-                'player_name': t.get('player_name', 'Unknown'),
-                'player_id': t.get('player_id')
-            })
-
-    # Calculate impact for each trade
-    for tid, trade_info in trades_by_id.items():
-        # Only process if we have both sides of the trade
-        if not trade_info['players_in'] and not trade_info['players_out']:
-            continue
-
-        trade_week = trade_info['week']
-        players_in_impact = 0
-        players_out_impact = 0
-
-        # Calculate points from players we received (after trade, regular season only)
-        for p in trade_info['players_in']:
-            player_id = str(p.get('player_id', ''))
-            for week in range(trade_week, last_reg_season_week + 1):
-                players_in_impact += calc.player_points_by_week.get(player_id, {}).get(week, 0)
-
-        # Calculate points from players we sent away (after trade, regular season only)
-        for p in trade_info['players_out']:
-            player_id = str(p.get('player_id', ''))
-            for week in range(trade_week, last_reg_season_week + 1):
-                players_out_impact += calc.player_points_by_week.get(player_id, {}).get(week, 0)
-
-        # Calculate net impact from raw player points (no roster adjustment)
-        net_impact = players_in_impact - players_out_impact
+    # Net points from players received minus players sent away (after the trade, regular season only)
+    for trade in context.trades[team_key]:
+        net_impact = trade['net_impact']
         trade_net_impact += net_impact
 
         # Track if this is a multi-player trade for display purposes
-        is_multi_player = len(trade_info['players_out']) != len(trade_info['players_in'])
+        is_multi_player = len(trade['players_out']) != len(trade['players_in'])
 
         trades_list.append({
-            'players_out': trade_info['players_out'],
-            'players_in': trade_info['players_in'],
+            'players_out': [dict(p) for p in trade['players_out']],
+            'players_in': [dict(p) for p in trade['players_in']],
             'net_started_impact': round(net_impact, 1),
             'is_multi_player': is_multi_player
         })
 
-    # Rank by trade impact across all teams
-    all_trade_impacts = {}
-    for tk in calc.teams.keys():
-        tk_transactions = calc.transactions_by_team.get(tk, [])
-        tk_trade_trans = [t for t in tk_transactions if t.get('type') == 'trade']
-        tk_impact = 0
-        tk_trades_by_id = defaultdict(lambda: {'players_in': [], 'players_out': [], 'week': 1})
-
-        for t in tk_trade_trans:
-            tid = t.get('transaction_id')
-            week = t.get('week', 1)
-            tk_trades_by_id[tid]['week'] = week
-            if t.get('destination_team_key') == tk:
-                tk_trades_by_id[tid]['players_in'].append({'player_id': t.get('player_id')})
-            elif t.get('source_team_key') == tk or t.get('trade_direction') == 'out':
-                tk_trades_by_id[tid]['players_out'].append({'player_id': t.get('player_id')})
-
-        for tid, ti in tk_trades_by_id.items():
-            tw = ti['week']
-            pi_impact = sum(calc.player_points_by_week.get(str(p.get('player_id', '')), {}).get(w, 0)
-                           for p in ti['players_in'] for w in range(tw, last_reg_season_week + 1))
-            po_impact = sum(calc.player_points_by_week.get(str(p.get('player_id', '')), {}).get(w, 0)
-                           for p in ti['players_out'] for w in range(tw, last_reg_season_week + 1))
-            tk_impact += pi_impact - po_impact
-        all_trade_impacts[tk] = tk_impact
-
-    # Rank (higher impact is better, so rank 1 = best)
-    # Handle ties - teams with same impact get same rank
-    sorted_impacts = sorted(all_trade_impacts.items(), key=lambda x: x[1], reverse=True)
-
-    # Build rank map with tie handling
-    rank_map = {}
-    tie_map = {}  # Track if rank is tied
-    current_rank = 1
-    prev_impact = None
-
-    # Count how many teams have each impact value
-    from collections import Counter
-    impact_counts = Counter(impact for _, impact in sorted_impacts)
-
-    for i, (tk, impact) in enumerate(sorted_impacts):
-        if prev_impact is not None and impact != prev_impact:
-            current_rank = i + 1  # Skip ranks for ties
-        rank_map[tk] = current_rank
-        tie_map[tk] = impact_counts[impact] > 1  # True if tied with others
-        prev_impact = impact
-
-    trade_rank = rank_map.get(team_key, num_teams // 2)
-    trade_is_tied = tie_map.get(team_key, False)
+    # Rank by trade impact across all teams (higher is better; tied teams share a rank)
+    trade_rank, trade_is_tied = context.tied_rank('trade_impacts', team_key)
 
     best_trade = max(trades_list, key=lambda t: t.get('net_started_impact', 0)) if trades_list else {}
 
@@ -552,39 +255,8 @@ def calculate_card_2_ledger(calc, team_key: str) -> dict:
     # RANK FEATURED TRADE ACROSS LEAGUE
     # ================================================================
 
-    # For each team, find their best/featured trade impact
-    all_team_featured_trade = {}
-    for tk in calc.teams.keys():
-        tk_transactions = calc.transactions_by_team.get(tk, [])
-        tk_trade_trans = [t for t in tk_transactions if t.get('type') == 'trade']
-        tk_trades_by_id = defaultdict(lambda: {'players_in': [], 'players_out': [], 'week': 1})
-
-        for t in tk_trade_trans:
-            tid = t.get('transaction_id')
-            week = t.get('week', 1)
-            tk_trades_by_id[tid]['week'] = week
-            if t.get('destination_team_key') == tk:
-                tk_trades_by_id[tid]['players_in'].append({'player_id': t.get('player_id')})
-            elif t.get('source_team_key') == tk or t.get('trade_direction') == 'out':
-                tk_trades_by_id[tid]['players_out'].append({'player_id': t.get('player_id')})
-
-        # Find best individual trade for this team
-        best_impact = float('-inf')
-        for tid, ti in tk_trades_by_id.items():
-            tw = ti['week']
-            pi_impact = sum(calc.player_points_by_week.get(str(p.get('player_id', '')), {}).get(w, 0)
-                           for p in ti['players_in'] for w in range(tw, last_reg_season_week + 1))
-            po_impact = sum(calc.player_points_by_week.get(str(p.get('player_id', '')), {}).get(w, 0)
-                           for p in ti['players_out'] for w in range(tw, last_reg_season_week + 1))
-            trade_impact = pi_impact - po_impact
-            if trade_impact > best_impact:
-                best_impact = trade_impact
-
-        all_team_featured_trade[tk] = best_impact if best_impact > float('-inf') else 0
-
     # Rank featured trades (higher impact is better)
-    sorted_featured = sorted(all_team_featured_trade.items(), key=lambda x: x[1], reverse=True)
-    featured_trade_rank = next((i + 1 for i, (tk, _) in enumerate(sorted_featured) if tk == team_key), num_teams)
+    featured_trade_rank = context.rank('featured_trade_impacts', team_key)
 
     # Add rank to best_trade
     if best_trade:
@@ -598,76 +270,20 @@ def calculate_card_2_ledger(calc, team_key: str) -> dict:
     costly_drops_total = 0
     costly_drops_list = []
 
-    for drop in drops:
-        player_id = str(drop.get('player_id', ''))
-        player_name = drop.get('player_name', 'Unknown')
-        dropped_week = drop.get('week', 1)
-
-        # Calculate points this player scored AFTER being dropped (regular season only)
-        # BUT only count weeks when they were NOT on this team's roster
-        points_after_drop = 0
-        weeks_away = 0
-
-        for week in range(dropped_week + 1, last_reg_season_week + 1):
-            week_key = f'week_{week}'
-
-            # Check if player is on this team's roster this week
-            player_on_roster = False
-            if week_key in calc.weekly_data.get(team_key, {}):
-                roster = calc.weekly_data[team_key][week_key].get('roster', {})
-                all_players = roster.get('starters', []) + roster.get('bench', [])
-                for p in all_players:
-                    if str(p.get('player_id')) == player_id:
-                        player_on_roster = True
-                        break
-
-            # Only count points when player was NOT on our roster
-            if not player_on_roster and player_id in calc.player_points_by_week:
-                points_after_drop += calc.player_points_by_week[player_id].get(week, 0)
-                weeks_away += 1
-
+    # Points each dropped player scored AFTER the drop while NOT on this team's roster (regular season only)
+    for drop, points_after_drop, weeks_away in context.drops[team_key]:
         if points_after_drop > 20:  # Only count significant losses
             costly_drops_total += points_after_drop
             costly_drops_list.append({
-                'player_name': player_name,
-                'player_id': player_id,
+                'player_name': drop.get('player_name', 'Unknown'),
+                'player_id': str(drop.get('player_id', '')),
                 'started_pts': points_after_drop,
-                'dropped_week': dropped_week,
+                'dropped_week': drop.get('week', 1),
                 'weeks_away': weeks_away
             })
 
     # Rank by costly drops (higher is worse)
-    all_team_costly_drops = {}
-    for tk in calc.teams.keys():
-        tk_transactions = calc.transactions_by_team.get(tk, [])
-        tk_drops = [t for t in tk_transactions if t.get('type') == 'drop']
-        tk_total = 0
-
-        for drop in tk_drops:
-            player_id = str(drop.get('player_id', ''))
-            dropped_week = drop.get('week', 1)
-
-            for week in range(dropped_week + 1, last_reg_season_week + 1):
-                week_key = f'week_{week}'
-
-                # Check if player is on this team's roster this week
-                player_on_roster = False
-                if week_key in calc.weekly_data.get(tk, {}):
-                    roster = calc.weekly_data[tk][week_key].get('roster', {})
-                    all_players = roster.get('starters', []) + roster.get('bench', [])
-                    for p in all_players:
-                        if str(p.get('player_id')) == player_id:
-                            player_on_roster = True
-                            break
-
-                # Only count points when player was NOT on this team's roster
-                if not player_on_roster and player_id in calc.player_points_by_week:
-                    tk_total += calc.player_points_by_week[player_id].get(week, 0)
-
-        all_team_costly_drops[tk] = tk_total
-
-    sorted_teams = sorted(all_team_costly_drops.items(), key=lambda x: x[1])  # Ascending - lower is better
-    costly_drops_rank = next((i + 1 for i, (tk, _) in enumerate(sorted_teams) if tk == team_key), num_teams)
+    costly_drops_rank = context.rank('costly_drop_points', team_key, reverse=False)
 
     # Get most costly drop
     costly_drops_list.sort(key=lambda x: x['started_pts'], reverse=True)
@@ -677,42 +293,8 @@ def calculate_card_2_ledger(calc, team_key: str) -> dict:
     # RANK MOST COSTLY DROP ACROSS LEAGUE
     # ================================================================
 
-    # For each team, find their most costly single drop
-    all_team_worst_drop = {}
-    for tk in calc.teams.keys():
-        tk_transactions = calc.transactions_by_team.get(tk, [])
-        tk_drops = [t for t in tk_transactions if t.get('type') == 'drop']
-
-        worst_drop_pts = 0
-        for drop in tk_drops:
-            player_id = str(drop.get('player_id', ''))
-            dropped_week = drop.get('week', 1)
-            points_after = 0
-
-            for week in range(dropped_week + 1, last_reg_season_week + 1):
-                week_key = f'week_{week}'
-
-                # Check if player is on this team's roster this week
-                player_on_roster = False
-                if week_key in calc.weekly_data.get(tk, {}):
-                    roster = calc.weekly_data[tk][week_key].get('roster', {})
-                    all_players = roster.get('starters', []) + roster.get('bench', [])
-                    for p in all_players:
-                        if str(p.get('player_id')) == player_id:
-                            player_on_roster = True
-                            break
-
-                if not player_on_roster and player_id in calc.player_points_by_week:
-                    points_after += calc.player_points_by_week[player_id].get(week, 0)
-
-            if points_after > worst_drop_pts:
-                worst_drop_pts = points_after
-
-        all_team_worst_drop[tk] = worst_drop_pts
-
     # Rank worst drops (higher points lost = worse = rank 1)
-    sorted_drops = sorted(all_team_worst_drop.items(), key=lambda x: x[1], reverse=True)
-    worst_drop_rank = next((i + 1 for i, (tk, _) in enumerate(sorted_drops) if tk == team_key), num_teams)
+    worst_drop_rank = context.rank('worst_drops', team_key)
 
     # Add rank to most_costly_drop
     if most_costly_drop:
@@ -87,71 +87,21 @@ def calculate_card_3_lineups(calc, team_key: str) -> dict:
     avg_efficiency = sum(weekly_efficiency) / len(weekly_efficiency) if weekly_efficiency else 0
     lineup_efficiency_pct = (total_actual_points / total_optimal_points * 100) if total_optimal_points > 0 else 0
 
-    # Calculate league-wide efficiency for percentile
-    all_team_efficiencies = []
-    for tk in calc.teams.keys():
-        team_total_actual = 0
-        team_total_optimal = 0
-
-        for week in regular_season_weeks:
-            week_key = f'week_{week}'
-            if week_key in calc.weekly_data.get(tk, {}):
-                week_data = calc.weekly_data[tk][week_key]
-                team_total_actual += week_data.get('actual_points', 0)
-
-                roster = week_data.get('roster', {})
-                optimal_result = calc.calculate_optimal_lineup(roster, filter_injured=False)
-                team_total_optimal += optimal_result['optimal_points']
-
-        team_efficiency = (team_total_actual / team_total_optimal * 100) if team_total_optimal > 0 else 0
-        all_team_efficiencies.append((tk, team_efficiency))
-
-    # Calculate league average
-    league_avg_efficiency = sum(eff for _, eff in all_team_efficiencies) / len(all_team_efficiencies) if all_team_efficiencies else 0
+    # League-wide efficiency for percentile (computed once per league)
+    context = calc.get_league_context()
+    league_avg_efficiency = context.average('lineup_efficiency')
 
     # Rank by efficiency
-    all_team_efficiencies.sort(key=lambda x: x[1], reverse=True)
-    efficiency_rank = next((i + 1 for i, (tk, _) in enumerate(all_team_efficiencies) if tk == team_key), num_teams)
+    efficiency_rank = context.rank('lineup_efficiency', team_key)
     efficiency_percentile = ((num_teams - efficiency_rank) / (num_teams - 1)) * 100 if num_teams > 1 else 50
 
     # ================================================================
     # POSITION UNITS (Strongest/Weakest)
     # ================================================================
 
-    # Sum started points by position for ALL teams
-    league_position_totals = {tk: {'QB': 0, 'RB': 0, 'WR': 0, 'TE': 0} for tk in calc.teams}
-
-    for tk in calc.teams:
-        for week in regular_season_weeks:
-            week_key = f'week_{week}'
-            if week_key not in calc.weekly_data.get(tk, {}):
-                continue
-
-            roster = calc.weekly_data[tk][week_key].get('roster', {})
-            starters = roster.get('starters', [])
-
-            for starter in starters:
-                # Use natural position (first eligible position), not selected_position
-                eligible = starter.get('eligible_positions', [])
-                if not eligible:
-                    continue
-
-                # Get natural position (first in eligible list)
-                natural_pos = eligible[0]
-                if natural_pos in ['QB', 'RB', 'WR', 'TE']:
-                    pts = starter.get('actual_points', 0)
-                    league_position_totals[tk][natural_pos] += pts
-
-    # Rank each position across league (1 = most points = best)
-    position_ranks = {tk: {} for tk in calc.teams}
-    for pos in ['QB', 'RB', 'WR', 'TE']:
-        sorted_teams = sorted(
-            calc.teams.keys(),
-            key=lambda t: league_position_totals[t][pos],
-            reverse=True
-        )
-        for rank, tk in enumerate(sorted_teams, 1):
-            position_ranks[tk][pos] = rank
+    # Started points by natural position for ALL teams, ranked across the league (1 = most points = best)
+    league_position_totals = context.position_totals
+    position_ranks = context.position_ranks
 
     # Find best and worst for target team
     my_ranks = position_ranks[team_key]
@@ -182,45 +132,9 @@ def calculate_card_3_lineups(calc, team_key: str) -> dict:
     # RANK ACTUAL AND OPTIMAL RECORDS ACROSS LEAGUE
     # ================================================================
 
-    # Rank by actual wins
-    all_team_actual_wins = {}
-    all_team_optimal_wins = {}
-
-    for tk in calc.teams.keys():
-        tk_actual_wins = 0
-        tk_optimal_wins = 0
-
-        for week in regular_season_weeks:
-            week_key = f'week_{week}'
-            if week_key not in calc.weekly_data.get(tk, {}):
-                continue
-
-            week_data = calc.weekly_data[tk][week_key]
-            result = week_data.get('result', '')
-
-            # Actual wins
-            if result == 'W':
-                tk_actual_wins += 1
-
-            # Calculate optimal wins
-            roster = week_data.get('roster', {})
-            optimal_result = calc.calculate_optimal_lineup(roster, filter_injured=False)
-            optimal_pts = optimal_result['optimal_points']
-            opp_pts = week_data.get('opponent_points', 0)
-
-            if optimal_pts > opp_pts:
-                tk_optimal_wins += 1
-
-        all_team_actual_wins[tk] = tk_actual_wins
-        all_team_optimal_wins[tk] = tk_optimal_wins
-
-    # Rank actual wins (more wins = better = rank 1)
-    sorted_actual = sorted(all_team_actual_wins.items(), key=lambda x: x[1], reverse=True)
-    actual_record_rank = next((i + 1 for i, (tk, _) in enumerate(sorted_actual) if tk == team_key), num_teams)
-
-    # Rank optimal wins (more wins = better = rank 1)
-    sorted_optimal = sorted(all_team_optimal_wins.items(), key=lambda x: x[1], reverse=True)
-    optimal_record_rank = next((i + 1 for i, (tk, _) in enumerate(sorted_optimal) if tk == team_key), num_teams)
+    # Rank actual and optimal wins (more wins = better = rank 1)
+    actual_record_rank = context.rank('actual_wins', team_key)
+    optimal_record_rank = context.rank('optimal_wins', team_key)
 
     # ================================================================
     # PIVOTAL MOMENTS
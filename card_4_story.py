@@ -7,8 +7,6 @@ Win Attribution Analysis:
 - Luck Factors: Schedule, Opponent Mistakes, Random
 """
 
-from card_2_ledger import calculate_card_2_ledger
-
 
 def calculate_card_4_story(calc, team_key: str, other_cards: dict = None) -> dict:
     """
@@ -56,12 +54,9 @@ def calculate_card_4_story(calc, team_key: str, other_cards: dict = None) -> dic
     # 3. WAIVER SKILL
     waiver_points_started = card_2.get('waivers', {}).get('total_points_started', 0)
 
-    # Calculate league average waiver points
-    all_team_waiver_pts = []
-    for tk in calc.teams.keys():
-        tk_card_2 = calculate_card_2_ledger(calc, tk)
-        tk_waiver_pts = tk_card_2.get('waivers', {}).get('total_points_started', 0)
-        all_team_waiver_pts.append(tk_waiver_pts)
+    # Calculate league average waiver points (as card 2 reports them)
+    context = calc.get_league_context()
+    all_team_waiver_pts = [round(pts, 1) for pts in context.waiver_points_started.values()]
 
     league_avg_waiver_pts = sum(all_team_waiver_pts) / len(all_team_waiver_pts) if all_team_waiver_pts else 0
     waiver_points_diff = waiver_points_started - league_avg_waiver_pts
@@ -95,7 +90,9 @@ def calculate_card_4_story(calc, team_key: str, other_cards: dict = None) -> dic
     regular_season_weeks = calc.get_regular_season_weeks()
 
     # 1. SCHEDULE LUCK
-    expected_wins = 0
+    # Expected wins: teams beaten each week / (total teams - 1), from the league's all-play table
+    all_play = calc.get_all_play()
+    expected_wins = all_play.expected_wins(team_key)
     schedule_luck_details = []
 
     for week in regular_season_weeks:
@@ -103,30 +100,11 @@ def calculate_card_4_story(calc, team_key: str, other_cards: dict = None) -> dic
         if week_key not in calc.weekly_data.get(team_key, {}):
             continue
 
-        manager_score = calc.weekly_data[team_key][week_key].get('actual_points', 0)
         actual_opponent_score = calc.weekly_data[team_key][week_key].get('opponent_points', 0)
         result = calc.weekly_data[team_key][week_key].get('result', '')
 
-        # Count how many teams this score would beat this week
-        teams_beaten = 0
-        for tk in calc.teams.keys():
-            if tk == team_key:
-                continue
-            if week_key in calc.weekly_data.get(tk, {}):
-                opponent_score = calc.weekly_data[tk][week_key].get('actual_points', 0)
-                if manager_score > opponent_score:
-                    teams_beaten += 1
-
-        # Expected win probability = teams beaten / (total teams - 1)
-        expected_wins += teams_beaten / (num_teams - 1)
-
         # Track significant luck moments (tough/weak opponents)
-        actual_opp_teams_beaten = 0
-        for tk in calc.teams.keys():
-            if week_key in calc.weekly_data.get(tk, {}):
-                other_score = calc.weekly_data[tk][week_key].get('actual_points', 0)
-                if actual_opponent_score > other_score:
-                    actual_opp_teams_beaten += 1
+        actual_opp_teams_beaten = all_play.teams_below(week, actual_opponent_score)
 
         # Track tough opponents (top 3 scorers) and weak opponents (bottom 3)
         if actual_opp_teams_beaten >= num_teams - 3:
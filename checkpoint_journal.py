@@ -0,0 +1,137 @@
+"""
+Checkpoint Journal
+Append-only JSONL checkpoints for resumable data pulls
+
+Each completed (team, week) is appended as one JSON line and fsynced, so a
+crash loses at most the team-week in flight and checkpoint cost stays
+constant per record instead of re-serializing everything pulled so far.
+Resume replays the journal; once the pull finishes and the league JSON has
+been written from the replayed data, the journal is removed.
+"""
+
+import os
+import json
+import threading
+
+
+class CheckpointJournal:
+    """
+    Thread-safe append-only journal of completed team-weeks
+    """
+
+    def __init__(self, path, header=None):
+        """
+        Initialize the journal (nothing is written until the first append)
+
+        Args:
+            path: Journal file path
+            header: Identifying fields (league, season) written as the first
+                    record; a journal with a different header is ignored on replay
+        """
+        self.path = path
+        self.header = header or {}
+        self._lock = threading.Lock()
+        self._file = None
+
+    def replay(self):
+        """
+        Read back every completed team-week
+
+        A truncated final line (crash mid-write) is skipped. Later records for
+        the same team-week replace earlier ones.
+
+        Returns:
+            dict: (team_id, week) -> week_data
+        """
+        records = {}
+        if not os.path.exists(self.path):
+            return records
+
+        with open(self.path, 'r') as f:
+            for line_num, line in enumerate(f):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    print(f"   Skipping unreadable journal line {line_num + 1}")
+                    continue
+
+                if record.get('type') == 'header':
+                    if record.get('header') != self.header:
+                        print("   Journal belongs to a different pull, ignoring it")
+                        return {}
+                    continue
+
+                records[(record['team_id'], int(record['week']))] = record['data']
+
+        return records
+
+    def _open(self):
+        """Open the journal for appending, writing the header if it's new (lock must be held)"""
+        if self._file is not None:
+            return
+
+        is_new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self._file = open(self.path, 'a')
+        if is_new:
+            self._write({'type': 'header', 'header': self.header})
+
+    def _write(self, record):
+        """Append one record and force it to disk (lock must be held)"""
+        self._file.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def append(self, team_id, week, week_data):
+        """
+        Record a completed team-week
+
+        Args:
+            team_id: Team ID
+            week: Week number
+            week_data: Week entry for weekly_data
+        """
+        with self._lock:
+            self._open()
+            self._write({'team_id': team_id, 'week': week, 'data': week_data})
+
+    def compact(self):
+        """
+        Rewrite the journal with one record per team-week
+
+        Written to a temp file and renamed so a crash during compaction
+        leaves the original journal intact.
+
+        Returns:
+            dict: (team_id, week) -> week_data
+        """
+        records = self.replay()
+
+        with self._lock:
+            self.close()
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(json.dumps({'type': 'header', 'header': self.header}, separators=(',', ':')) + '\n')
+                for (team_id, week), data in records.items():
+                    f.write(json.dumps({'team_id': team_id, 'week': week, 'data': data},
+                                       separators=(',', ':')) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+
+        return records
+
+    def close(self):
+        """Close the journal file if open"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self):
+        """Delete the journal once its data has been written to the league file"""
+        with self._lock:
+            self.close()
+            if os.path.exists(self.path):
+                os.remove(self.path)
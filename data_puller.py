@@ -8,24 +8,114 @@ Docs: https://yahoo-fantasy-api.readthedocs.io/
 """
 
 import os
-import json
-import time
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from dotenv import load_dotenv
 from yahoo_oauth import OAuth2
 import yahoo_fantasy_api as yfa
+from rate_limiter import TokenBucket
+from response_cache import ResponseCache
+from checkpoint_journal import CheckpointJournal
+from api_retry import ApiError, RetryBudget, call_with_retry, DEFAULT_RETRY_BUDGET
+from league_file import compact_week_entry, write_league_file
+from delta_pull import load_existing_league, last_complete_week, existing_team_weeks
 
 # Will be set by main() based on --work-dir argument
 WORK_DIR = None
 
+# Yahoo does not publish its Fantasy API limits. Sustained bursts much above a
+# few requests per second start returning "Request denied" (999) responses, so
+# stay under that by default. Override with --requests-per-second.
+YAHOO_REQUESTS_PER_SECOND = 4.0
+YAHOO_BURST_SIZE = 8
+
+# Default number of worker threads for concurrent pulls (1 = sequential)
+DEFAULT_CONCURRENCY = 1
+
+# Yahoo returns stats for at most 25 players per request
+PLAYER_STATS_BATCH_SIZE = 25
+
+# Response cache TTLs (seconds) per endpoint. Week-scoped responses for weeks
+# before the current week are cached as immutable instead.
+YAHOO_CACHE_TTLS = {
+    'settings': 24 * 3600,
+    'standings': 3600,
+    'teams': 3600,
+    'transactions': 1800,
+    'draft_results': 24 * 3600,
+    'scoreboard': 600,
+    'roster': 600,
+    'league_rosters': 600,
+    'player_stats': 600,
+}
+
+
+class WorkerSession:
+    """
+    One worker thread's view of the puller's OAuth session
+
+    requests sessions aren't thread-safe, so each worker makes its calls on
+    its own HTTP session carrying the shared access token. Token checks and
+    refreshes still go to the shared session; once any worker refreshes, the
+    token generation changes and every worker rebuilds its HTTP session on
+    its next call.
+
+    yahoo-fantasy-api refreshes an expired token itself, then assigns the
+    new token and session to its session object. Here that refresh goes
+    through the puller's shared, deduplicated refresh, and the assigned
+    session becomes this worker's.
+    """
+
+    def __init__(self, puller):
+        """
+        Args:
+            puller: FantasyWrappedDataPuller whose session this worker shares
+        """
+        self._puller = puller
+        self._session = None
+        self._generation = None
+
+    @property
+    def session(self):
+        """This worker's HTTP session, rebuilt after a token refresh"""
+        generation = self._puller._token_generation
+        if self._session is None or self._generation != generation:
+            self._session = self._puller._new_http_session()
+            self._generation = generation
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        self._session = session
+        self._generation = self._puller._token_generation
+
+    @property
+    def access_token(self):
+        return self._puller.sc.access_token
+
+    @access_token.setter
+    def access_token(self, token):
+        pass  # The shared session already holds the refreshed token
+
+    def refresh_access_token(self):
+        """Refresh the shared token (once per expiry across workers) and return its credentials"""
+        self._puller._refresh_token(self._generation)
+        return {'access_token': self._puller.sc.access_token}
+
+    def __getattr__(self, name):
+        return getattr(self._puller.sc, name)
+
 
 class FantasyWrappedDataPuller:
     """
     Pulls all necessary data from Yahoo Fantasy API
     """
 
-    def __init__(self, league_id, season_year, work_dir=None):
+    def __init__(self, league_id, season_year, work_dir=None, concurrency=DEFAULT_CONCURRENCY,
+                 requests_per_second=YAHOO_REQUESTS_PER_SECOND, batched=False, response_cache=None,
+                 since_existing=None, retry_budget=DEFAULT_RETRY_BUDGET, compact=False, api_base=None):
         """
         Initialize with league ID and season
 
@@ -33,13 +123,47 @@ class FantasyWrappedDataPuller:
             league_id: Yahoo league ID (e.g., '12345')
             season_year: Season year (e.g., 2024)
             work_dir: Directory for input/output files (optional)
+            concurrency: Worker threads for weekly fetches (1 = sequential)
+            requests_per_second: Sustained Yahoo request budget shared by all workers
+            batched: Fetch all teams' rosters for a week in one league-wide request
+            response_cache: ResponseCache for API responses (default: ResponseCache.default())
+            since_existing: Prior league JSON whose completed weeks are reused (optional)
+            retry_budget: Retries allowed across the whole pull before giving up
+            compact: Keep only the fields the calculator reads (smaller file, no indentation)
+            api_base: Alternate Yahoo API base URL, e.g. a local stand-in server (skips OAuth)
         """
         self.league_id = str(league_id)
         self.season_year = int(season_year)
         self.work_dir = work_dir or os.getcwd()
+        self.concurrency = max(1, int(concurrency))
+        self.batched = batched
+        self.since_existing = since_existing
+        self.compact = compact
+        self.api_base = api_base
         self.sc = None  # OAuth session
         self.gm = None  # Game object
-        self.lg = None  # League object
+        self.lg = None  # League object (each concurrent worker uses its own, see _start_worker)
+        self._worker = threading.local()
+        self.current_week = None  # Set by get_league_metadata(); earlier weeks are immutable
+        self._journal = None  # Checkpoint journal of a finished pull, removed once save_to_json writes it
+
+        # Persistent response cache shared across runs and sessions (never for stand-in responses)
+        if response_cache is None:
+            response_cache = ResponseCache(None) if api_base else ResponseCache.default()
+        self.response_cache = response_cache
+
+        # Shared request budget (replaces the old fixed 500ms sleep per call)
+        self.rate_limiter = TokenBucket(requests_per_second, max(YAHOO_BURST_SIZE, requests_per_second))
+
+        # Throttles, expired tokens and network errors are retried until the budget runs out
+        self.retry_budget = RetryBudget(retry_budget)
+        self._token_lock = threading.Lock()
+        self._token_generation = 0  # Bumped by every refresh, so one expiry refreshes once
+
+        # Parsed scoreboards by week - one lg.matchups() call covers every team
+        self._scoreboard_cache = {}
+        self._scoreboard_locks = {}
+        self._scoreboard_locks_guard = threading.Lock()
 
     def authenticate(self):
         """
@@ -50,12 +174,15 @@ class FantasyWrappedDataPuller:
         print("A browser window will open for you to authorize the app.")
         print("After authorization, you'll be redirected - copy the verification code.")
 
-        # Create OAuth2 object - this will handle the auth flow
-        oauth_file = os.path.join(self.work_dir, 'oauth2.json')
-        self.sc = OAuth2(None, None, from_file=oauth_file)
+        if self.api_base:
+            self.sc = self._stand_in_session()
+        else:
+            # Create OAuth2 object - this will handle the auth flow
+            oauth_file = os.path.join(self.work_dir, 'oauth2.json')
+            self.sc = OAuth2(None, None, from_file=oauth_file)
 
-        if not self.sc.token_is_valid():
-            self.sc.refresh_access_token()
+            if not self.sc.token_is_valid():
+                self.sc.refresh_access_token()
 
         # Initialize game and league objects
         self.gm = yfa.Game(self.sc, 'nfl')
@@ -71,9 +198,102 @@ class FantasyWrappedDataPuller:
 
         print("✓ Authentication successful!")
 
+    @property
+    def lg(self):
+        """League object for the calling thread: a worker's own league, else the main one"""
+        return getattr(self._worker, 'lg', None) or self._lg
+
+    @lg.setter
+    def lg(self, value):
+        self._lg = value
+
+    def _new_http_session(self):
+        """A fresh HTTP session carrying the current access token"""
+        if self.api_base:
+            import requests
+            return requests.Session()
+        return self.sc.oauth.get_session(token=self.sc.access_token)
+
+    def _start_worker(self):
+        """
+        Give a pool thread its own League object and HTTP session
+
+        yahoo-fantasy-api League objects cache lazily and make calls on one
+        requests session, neither of which is safe to share across threads.
+        """
+        self._worker.lg = yfa.League(WorkerSession(self), self._lg.league_id)
+
+    def _stand_in_session(self):
+        """
+        Point yahoo-fantasy-api at a stand-in server (see api_replay.py)
+
+        The stand-in needs no OAuth, so a plain requests session takes the
+        place of the OAuth2 object.
+        """
+        import requests
+        from types import SimpleNamespace
+        from yahoo_fantasy_api import yhandler
+
+        print(f"Using stand-in Yahoo API at {self.api_base}")
+        yhandler.YAHOO_ENDPOINT = self.api_base.rstrip('/')
+        return SimpleNamespace(session=requests.Session(), token_is_valid=lambda: True,
+                               refresh_access_token=lambda: None)
+
+    def _refresh_token(self, seen_generation):
+        """
+        Refresh the OAuth access token after Yahoo reports it expired
+
+        Yahoo can reject a token that token_is_valid() still trusts (its clock
+        only tracks the local expiry time), so the refresh is forced. Workers
+        that failed on the same token share one refresh: only the first one
+        whose call was made with the current generation refreshes.
+
+        yahoo_oauth's refresh_access_token() only replaces the token, so the
+        shared HTTP session is rebuilt to carry it.
+
+        Args:
+            seen_generation: Token generation the failed call was made with
+        """
+        with self._token_lock:
+            if self._token_generation != seen_generation:
+                return  # Another worker already refreshed since this call was made
+            if self.sc is not None:
+                print("      Refreshing Yahoo access token...")
+                self.sc.refresh_access_token()
+                self.sc.session = self._new_http_session()
+            self._token_generation += 1
+
+    def _call_with_retry(self, func, *args, **kwargs):
+        """
+        Make API call, retrying throttles, expired tokens and network errors
+
+        Args:
+            func: Function to call
+            *args, **kwargs: Arguments to pass to function
+
+        Returns:
+            Result of function call
+
+        Raises:
+            ApiError: Retries exhausted or retry budget used up
+        """
+        seen_generation = self._token_generation
+
+        def attempt():
+            nonlocal seen_generation
+            seen_generation = self._token_generation
+            return func(*args, **kwargs)
+
+        return call_with_retry(
+            attempt, budget=self.retry_budget, on_auth_expired=lambda: self._refresh_token(seen_generation)
+        )
+
     def _make_api_call_with_delay(self, func, *args, **kwargs):
         """
-        Make API call with delay to avoid rate limits
+        Make API call once the shared rate limiter allows it
+
+        Retryable failures are retried with backoff (each attempt waits for the
+        rate limiter); other failures are logged and return None.
 
         Args:
             func: Function to call
@@ -81,14 +301,56 @@ class FantasyWrappedDataPuller:
 
         Returns:
             Result of function call
+
+        Raises:
+            ApiError: Retries exhausted or retry budget used up
         """
-        time.sleep(0.5)  # 500ms delay between calls
-        try:
+        def attempt():
+            self.rate_limiter.acquire()
             return func(*args, **kwargs)
+
+        try:
+            return self._call_with_retry(attempt)
+        except ApiError:
+            raise
         except Exception as e:
             print(f"API call failed: {e}")
             return None
 
+    def _cached_api_call(self, endpoint, func, *args, cache_week=None, cache_params=None, validate=None,
+                         **kwargs):
+        """
+        Serve an API call from the response cache, or make it and cache the result
+
+        Non-empty responses for weeks before the current week are stored as
+        immutable (if they pass validate); everything else, including an empty
+        response Yahoo may fill in later, expires after the endpoint's TTL.
+
+        Args:
+            endpoint: Endpoint name (key into YAHOO_CACHE_TTLS)
+            func: Function that makes the call (rate limiting is its job)
+            *args, **kwargs: Arguments to pass to function
+            cache_week: Week the response belongs to (optional)
+            cache_params: Extra parameters that identify the response (optional)
+            validate: Returns True if a response is complete enough to keep forever (optional)
+
+        Returns:
+            Result of function call
+        """
+        params = {'league': self.lg.league_id, 'week': cache_week}
+        params.update(cache_params or {})
+
+        past_week = cache_week is not None and self.current_week is not None and cache_week < self.current_week
+
+        def is_complete(body):
+            return bool(body) and (validate is None or validate(body))
+
+        return self.response_cache.fetch(
+            'yahoo', endpoint, func, *args,
+            params=params, ttl=YAHOO_CACHE_TTLS.get(endpoint), immutable=is_complete if past_week else False,
+            **kwargs
+        )
+
     def get_league_metadata(self):
         """
         Extract basic league information
@@ -98,8 +360,9 @@ class FantasyWrappedDataPuller:
         """
         print("Fetching league metadata...")
 
-        settings = self.lg.settings()
-        standings = self.lg.standings()
+        settings = self._cached_api_call('settings', self._call_with_retry, self.lg.settings)
+        standings = self._cached_api_call('standings', self._call_with_retry, self.lg.standings)
+        self.current_week = self._call_with_retry(self.lg.current_week)
 
         metadata = {
             'league_id': self.league_id,
@@ -108,7 +371,7 @@ class FantasyWrappedDataPuller:
             'num_teams': settings.get('num_teams', len(standings)),
             'playoff_start_week': settings.get('playoff_start_week', 15),
             'scoring_type': settings.get('scoring_type', 'head2head'),
-            'current_week': self.lg.current_week(),
+            'current_week': self.current_week,
 
             # Enhanced settings for roster configuration
             'roster_positions': settings.get('roster_positions', {}),
@@ -141,8 +404,8 @@ class FantasyWrappedDataPuller:
         print("Fetching all teams...")
 
         teams_data = []
-        standings = self.lg.standings()
-        teams = self.lg.teams()
+        standings = self._cached_api_call('standings', self._call_with_retry, self.lg.standings)
+        teams = self._cached_api_call('teams', self._call_with_retry, self.lg.teams)
 
         # Convert standings list to dict for easier lookup
         standings_dict = {}
@@ -186,121 +449,196 @@ class FantasyWrappedDataPuller:
         print(f"✓ Found {len(teams_data)} teams")
         return teams_data
 
-    def get_weekly_scores(self, team_id, week):
+    def _parse_scoreboard(self, scoreboard_data, week):
         """
-        Get scoring data for a specific team and week
+        Parse a raw Yahoo scoreboard response into per-team results
 
         Args:
-            team_id: Yahoo team ID
-            week: Week number (1-17)
+            scoreboard_data: Raw dict returned by lg.matchups(week)
+            week: Week number
 
         Returns:
-            dict: Weekly scoring data
+            dict: {'results': team_key -> weekly score dict,
+                   'matchups': list of head-to-head matchup dicts}
+                  or None if the response has no matchups
         """
-        try:
-            # matchups() returns a dict with raw JSON from Yahoo API
-            scoreboard_data = self.lg.matchups(week)
+        # The structure is: fantasy_content -> league[1] -> scoreboard -> 0 -> matchups
+        matchups_dict = None
 
-            # The structure is: fantasy_content -> league[1] -> scoreboard -> 0 -> matchups
-            matchups_dict = None
+        if 'fantasy_content' in scoreboard_data:
+            league_data = scoreboard_data['fantasy_content'].get('league', [])
+            if len(league_data) > 1 and isinstance(league_data[1], dict):
+                scoreboard = league_data[1].get('scoreboard', {})
+                if '0' in scoreboard:
+                    matchups_dict = scoreboard['0'].get('matchups', {})
 
-            if 'fantasy_content' in scoreboard_data:
-                league_data = scoreboard_data['fantasy_content'].get('league', [])
-                if len(league_data) > 1 and isinstance(league_data[1], dict):
-                    scoreboard = league_data[1].get('scoreboard', {})
-                    if '0' in scoreboard:
-                        matchups_dict = scoreboard['0'].get('matchups', {})
+        if not matchups_dict:
+            return None
 
-            if not matchups_dict:
+        # matchups_dict is a dict with numeric string keys: {'0': {matchup}, '1': {matchup}, ...}
+        # Also contains 'count' field which is an int - filter it out
+        matchups_list = [v for v in matchups_dict.values() if isinstance(v, dict)]
+
+        results = {}
+        matchups = []
+
+        for matchup_obj in matchups_list:
+            # Each matchup has structure: {'matchup': {...}}
+            matchup_data = matchup_obj.get('matchup', {})
+
+            # Teams are under matchup_data['0']['teams']
+            # teams is a dict like: {'0': {'team': [...]}, '1': {'team': [...]}}
+            if '0' not in matchup_data or 'teams' not in matchup_data['0']:
+                continue
+
+            teams_dict = matchup_data['0']['teams']
+
+            # Extract both teams from the matchup
+            # Each team is structured as: {'team': [[metadata_list], {points_obj}]}
+            teams_in_matchup = []
+            for team_key in ['0', '1']:
+                if team_key in teams_dict:
+                    team_array = teams_dict[team_key].get('team', [])
+                    if len(team_array) >= 2:
+                        # team_array[0] is list of metadata dicts
+                        # team_array[1] is the points/stats object
+                        metadata_list = team_array[0]
+                        points_obj = team_array[1]
+
+                        # Extract team_key from metadata
+                        team_id_str = None
+                        for item in metadata_list:
+                            if isinstance(item, dict) and 'team_key' in item:
+                                team_id_str = item['team_key']
+                                break
+
+                        teams_in_matchup.append({
+                            'team_key': team_id_str,
+                            'points': float(points_obj.get('team_points', {}).get('total', 0.0)),
+                            'projected_points': float(points_obj.get('team_projected_points', {}).get('total', 0.0)),
+                        })
+
+            # Record each team's result (first occurrence wins, as the old per-team scan did)
+            for idx, team_data in enumerate(teams_in_matchup):
+                if team_data['team_key'] in results:
+                    continue
+
+                opponent_id = None
+                opponent_points = 0.0
+                result = 'L'
+
+                opponent_idx = 1 - idx
+                if opponent_idx < len(teams_in_matchup):
+                    opponent = teams_in_matchup[opponent_idx]
+                    opponent_id = opponent['team_key']
+                    opponent_points = opponent['points']
+
+                    # Determine result
+                    if team_data['points'] > opponent_points:
+                        result = 'W'
+                    elif team_data['points'] < opponent_points:
+                        result = 'L'
+                    else:
+                        result = 'T'
+
+                results[team_data['team_key']] = {
+                    'week': week,
+                    'actual_points': team_data['points'],
+                    'projected_points': team_data['projected_points'],
+                    'opponent_id': opponent_id,
+                    'opponent_points': opponent_points,
+                    'result': result,
+                }
+
+            if len(teams_in_matchup) >= 2:
+                team1 = teams_in_matchup[0]
+                team2 = teams_in_matchup[1]
+
+                # Determine winner
+                if team1['points'] > team2['points']:
+                    winner = team1['team_key']
+                elif team2['points'] > team1['points']:
+                    winner = team2['team_key']
+                else:
+                    winner = 'TIE'
+
+                matchups.append({
+                    'week': week,
+                    'team1_id': team1['team_key'],
+                    'team1_points': team1['points'],
+                    'team2_id': team2['team_key'],
+                    'team2_points': team2['points'],
+                    'winner': winner,
+                })
+
+        return {'results': results, 'matchups': matchups}
+
+    def get_week_scoreboard(self, week):
+        """
+        Get the parsed scoreboard for a week, fetching it at most once
+
+        The scoreboard covers every team in the league, so it is cached per
+        week and shared by get_weekly_scores() and get_matchups().
+
+        Args:
+            week: Week number
+
+        Returns:
+            dict: Parsed scoreboard (see _parse_scoreboard) or None on failure
+        """
+        if week in self._scoreboard_cache:
+            return self._scoreboard_cache[week]
+
+        # One lock per week so concurrent workers don't fetch the same scoreboard twice
+        with self._scoreboard_locks_guard:
+            week_lock = self._scoreboard_locks.setdefault(week, threading.Lock())
+
+        with week_lock:
+            if week in self._scoreboard_cache:
+                return self._scoreboard_cache[week]
+
+            # matchups() returns a dict with raw JSON from Yahoo API
+            # Note: There is no scoreboard() method - use matchups()
+            scoreboard_data = self._cached_api_call(
+                'scoreboard', self._make_api_call_with_delay, self.lg.matchups, week, cache_week=week,
+                validate=lambda body: self._parse_scoreboard(body, week) is not None
+            )
+            if scoreboard_data is None:
+                # Don't cache failures - the next caller retries
+                return None
+
+            parsed = self._parse_scoreboard(scoreboard_data, week)
+            if parsed is None:
                 print(f"No matchups found for week {week}")
                 return None
 
-            # matchups_dict is a dict with numeric string keys: {'0': {matchup}, '1': {matchup}, ...}
-            # Also contains 'count' field which is an int - filter it out
-            matchups_list = [v for v in matchups_dict.values() if isinstance(v, dict)]
-
-            # Find this team's matchup
-            team_matchup = None
-            opponent_id = None
-            opponent_points = 0.0
-            result = 'L'
-            team_points = 0.0
-
-            # Iterate through matchups to find the one containing our team
-            for matchup_obj in matchups_list:
-                # Each matchup has structure: {'matchup': {...}}
-                matchup_data = matchup_obj.get('matchup', {})
-
-                # Teams are under matchup_data['0']['teams']
-                # teams is a dict like: {'0': {'team': [...]}, '1': {'team': [...]}}
-                if '0' not in matchup_data or 'teams' not in matchup_data['0']:
-                    continue
+            self._scoreboard_cache[week] = parsed
+            return parsed
 
-                teams_dict = matchup_data['0']['teams']
-
-                # Extract both teams from the matchup
-                # Each team is structured as: {'team': [[metadata_list], {points_obj}]}
-                teams_in_matchup = []
-                for team_key in ['0', '1']:
-                    if team_key in teams_dict:
-                        team_array = teams_dict[team_key].get('team', [])
-                        if len(team_array) >= 2:
-                            # team_array[0] is list of metadata dicts
-                            # team_array[1] is the points/stats object
-                            metadata_list = team_array[0]
-                            points_obj = team_array[1]
-
-                            # Extract team_key from metadata
-                            team_id_str = None
-                            for item in metadata_list:
-                                if isinstance(item, dict) and 'team_key' in item:
-                                    team_id_str = item['team_key']
-                                    break
-
-                            teams_in_matchup.append({
-                                'team_key': team_id_str,
-                                'points_obj': points_obj,
-                                'metadata': metadata_list
-                            })
+    def get_weekly_scores(self, team_id, week):
+        """
+        Get scoring data for a specific team and week
 
-                # Look for our team in this matchup
-                for idx, team_data in enumerate(teams_in_matchup):
-                    if team_data['team_key'] == team_id:
-                        # Found our team! Extract points
-                        points_obj = team_data['points_obj']
-                        team_points = float(points_obj.get('team_points', {}).get('total', 0.0))
-                        projected_points = float(points_obj.get('team_projected_points', {}).get('total', 0.0))
-
-                        # Get opponent
-                        opponent_idx = 1 - idx
-                        if opponent_idx < len(teams_in_matchup):
-                            opponent = teams_in_matchup[opponent_idx]
-                            opponent_id = opponent['team_key']
-                            opponent_points = float(opponent['points_obj'].get('team_points', {}).get('total', 0.0))
-
-                            # Determine result
-                            if team_points > opponent_points:
-                                result = 'W'
-                            elif team_points < opponent_points:
-                                result = 'L'
-                            else:
-                                result = 'T'
-
-                        team_matchup = {
-                            'week': week,
-                            'actual_points': team_points,
-                            'projected_points': projected_points,
-                            'opponent_id': opponent_id,
-                            'opponent_points': opponent_points,
-                            'result': result,
-                        }
-                        break
-
-                if team_matchup:
-                    break
+        Args:
+            team_id: Yahoo team ID
+            week: Week number (1-17)
+
+        Returns:
+            dict: Weekly scoring data
+        """
+        try:
+            scoreboard = self.get_week_scoreboard(week)
+            if not scoreboard:
+                return None
+
+            team_matchup = scoreboard['results'].get(team_id)
 
-            return team_matchup
+            # Return a copy - callers add roster data to the result
+            return dict(team_matchup) if team_matchup else None
 
+        except ApiError:
+            # Retries exhausted - stop the pull so it can resume from the journal
+            raise
         except Exception as e:
             print(f"Error fetching week {week} scores for team {team_id}: {e}")
             import traceback
@@ -364,6 +702,9 @@ class FantasyWrappedDataPuller:
                 'total_bench_points': sum(p['actual_points'] for p in bench),
             }
 
+        except ApiError:
+            # Retries exhausted - stop the pull so it can resume from the journal
+            raise
         except Exception as e:
             print(f"Error fetching week {week} roster for team {team_id}: {e}")
             import traceback
@@ -385,24 +726,40 @@ class FantasyWrappedDataPuller:
             if not player_ids:
                 return {}
 
-            # Make single API call for all players
-            stats_list = self.lg.player_stats(player_ids, 'week', week=week)
-
-            # Convert to dict keyed by player_id
+            # Yahoo caps stats requests at 25 players - one rate-limited call per chunk
             stats_dict = {}
-            for player_stats in stats_list:
-                player_id = player_stats.get('player_id')
-                stats_dict[player_id] = {
-                    'points': float(player_stats.get('total_points', 0.0)),
-                    'stats': player_stats
-                }
+            for i in range(0, len(player_ids), PLAYER_STATS_BATCH_SIZE):
+                chunk = player_ids[i:i + PLAYER_STATS_BATCH_SIZE]
+                stats_list = self._cached_api_call(
+                    'player_stats', self._player_stats_chunk, chunk, week,
+                    cache_week=week, cache_params={'players': sorted(chunk)}
+                )
+
+                # Convert to dict keyed by player_id
+                for player_stats in stats_list:
+                    player_id = player_stats.get('player_id')
+                    stats_dict[player_id] = {
+                        'points': float(player_stats.get('total_points', 0.0)),
+                        'stats': player_stats
+                    }
 
             return stats_dict
 
+        except ApiError:
+            # Retries exhausted - stop the pull so it can resume from the journal
+            raise
         except Exception as e:
             print(f"      Error fetching player stats for week {week}: {e}")
             return {}
 
+    def _player_stats_chunk(self, player_ids, week):
+        """Fetch one rate-limited chunk of weekly player stats (errors propagate)"""
+        def attempt():
+            self.rate_limiter.acquire()
+            return self.lg.player_stats(player_ids, 'week', week=week)
+
+        return self._call_with_retry(attempt)
+
     def get_weekly_roster_with_stats(self, team_id, week):
         """
         Get complete roster with player stats for a team in a specific week
@@ -416,7 +773,10 @@ class FantasyWrappedDataPuller:
         """
         try:
             # Get roster positions
-            roster_list = self.lg.to_team(team_id).roster(week)
+            roster_list = self._cached_api_call(
+                'roster', self._make_api_call_with_delay, self.lg.to_team(team_id).roster, week,
+                cache_week=week, cache_params={'team': team_id}
+            )
 
             if not roster_list:
                 return {'starters': [], 'bench': [], 'total_starter_points': 0.0, 'total_bench_points': 0.0}
@@ -427,42 +787,218 @@ class FantasyWrappedDataPuller:
             # Get stats for all players in one API call
             player_stats = self.get_player_stats_for_week(player_ids, week)
 
-            starters = []
-            bench = []
+            return self._build_roster_with_stats(roster_list, player_stats)
 
-            for player_data in roster_list:
-                player_id = player_data.get('player_id', 0)
-                stats = player_stats.get(player_id, {})
+        except ApiError:
+            # Retries exhausted - stop the pull so it can resume from the journal
+            raise
+        except Exception as e:
+            print(f"      Error fetching roster+stats for team {team_id} week {week}: {e}")
+            import traceback
+            traceback.print_exc()
+            return {'starters': [], 'bench': [], 'total_starter_points': 0.0, 'total_bench_points': 0.0}
 
-                player_info = {
-                    'player_id': player_id,
-                    'player_name': player_data.get('name', 'Unknown'),
-                    'position': player_data.get('position_type', 'Unknown'),
-                    'selected_position': player_data.get('selected_position', 'BN'),
-                    'eligible_positions': player_data.get('eligible_positions', []),
-                    'status': player_data.get('status', ''),  # Q/D/O/IR injury status
-                    'actual_points': stats.get('points', 0.0),
-                    'stats_detail': stats.get('stats', {})
+    def _build_roster_with_stats(self, roster_list, player_stats):
+        """
+        Combine a roster list with fetched player stats
+
+        Args:
+            roster_list: Player dicts in lg.to_team(...).roster() format
+            player_stats: Output from get_player_stats_for_week()
+
+        Returns:
+            dict: Roster data with starters, bench, and actual points
+        """
+        starters = []
+        bench = []
+
+        for player_data in roster_list:
+            player_id = player_data.get('player_id', 0)
+            stats = player_stats.get(player_id, {})
+
+            player_info = {
+                'player_id': player_id,
+                'player_name': player_data.get('name', 'Unknown'),
+                'position': player_data.get('position_type', 'Unknown'),
+                'selected_position': player_data.get('selected_position', 'BN'),
+                'eligible_positions': player_data.get('eligible_positions', []),
+                'status': player_data.get('status', ''),  # Q/D/O/IR injury status
+                'actual_points': stats.get('points', 0.0),
+                'stats_detail': stats.get('stats', {})
+            }
+
+            # Check if starter or bench
+            if player_data.get('selected_position') == 'BN':
+                bench.append(player_info)
+            else:
+                starters.append(player_info)
+
+        return {
+            'starters': starters,
+            'bench': bench,
+            'total_starter_points': sum(p['actual_points'] for p in starters),
+            'total_bench_points': sum(p['actual_points'] for p in bench),
+        }
+
+    def _parse_league_rosters(self, rosters_data):
+        """
+        Parse a raw league-wide roster collection into per-team roster lists
+
+        Args:
+            rosters_data: Raw dict from league/{key}/teams/roster;week=N
+
+        Returns:
+            dict: team_key -> list of player dicts in the same format as
+                  lg.to_team(...).roster(), or None if the response has no teams
+        """
+        # The structure is: fantasy_content -> league[1] -> teams -> {0, 1, ...} -> team
+        teams_dict = None
+
+        if 'fantasy_content' in rosters_data:
+            league_data = rosters_data['fantasy_content'].get('league', [])
+            if len(league_data) > 1 and isinstance(league_data[1], dict):
+                teams_dict = league_data[1].get('teams', {})
+
+        if not teams_dict:
+            return None
+
+        rosters = {}
+        for key, team_obj in teams_dict.items():
+            if key == 'count' or not isinstance(team_obj, dict):
+                continue
+
+            # Each team is structured as: {'team': [[metadata_list], {'roster': {...}}]}
+            team_array = team_obj.get('team', [])
+            if len(team_array) < 2:
+                continue
+
+            team_key = None
+            for item in team_array[0]:
+                if isinstance(item, dict) and 'team_key' in item:
+                    team_key = item['team_key']
+                    break
+
+            roster_obj = {}
+            for item in team_array[1:]:
+                if isinstance(item, dict) and 'roster' in item:
+                    roster_obj = item['roster']
+                    break
+
+            # Players are under roster['0']['players']: {0: {'player': [[metadata], {selected_position}]}}
+            players_dict = roster_obj.get('0', {}).get('players', {})
+
+            roster_list = []
+            for pkey, player_wrapper in players_dict.items():
+                if pkey == 'count' or not isinstance(player_wrapper, dict):
+                    continue
+
+                player_obj = player_wrapper.get('player', [])
+                if len(player_obj) < 2:
+                    continue
+
+                player_data = {
+                    'player_id': 0,
+                    'name': 'Unknown',
+                    'position_type': 'Unknown',
+                    'eligible_positions': [],
+                    'selected_position': 'BN',
+                    'status': '',
                 }
 
-                # Check if starter or bench
-                if player_data.get('selected_position') == 'BN':
-                    bench.append(player_info)
-                else:
-                    starters.append(player_info)
+                for item in player_obj[0]:
+                    if not isinstance(item, dict):
+                        continue
+                    if 'player_id' in item:
+                        player_data['player_id'] = int(item['player_id'])
+                    if 'name' in item:
+                        player_data['name'] = item['name'].get('full', 'Unknown')
+                    if 'position_type' in item:
+                        player_data['position_type'] = item['position_type']
+                    if 'status' in item:
+                        player_data['status'] = item['status']
+                    if 'eligible_positions' in item:
+                        player_data['eligible_positions'] = [
+                            p['position'] for p in item['eligible_positions']
+                            if isinstance(p, dict) and 'position' in p
+                        ]
+
+                for item in player_obj[1:]:
+                    if isinstance(item, dict) and 'selected_position' in item:
+                        for sp in item['selected_position']:
+                            if isinstance(sp, dict) and 'position' in sp:
+                                player_data['selected_position'] = sp['position']
+
+                roster_list.append(player_data)
+
+            rosters[team_key] = roster_list
+
+        return rosters
+
+    def get_league_rosters_with_stats(self, week, team_ids=None):
+        """
+        Get every team's roster with player stats for a week in as few calls as possible
+
+        One league-wide roster collection request replaces the per-team roster
+        calls, and stats for all rostered players are fetched in chunks of
+        PLAYER_STATS_BATCH_SIZE: 1 + ceil(players / 25) requests instead of 2 per team.
+
+        Args:
+            week: Week number
+            team_ids: Teams to return (default: every team in the response)
+
+        Returns:
+            dict: team_key -> roster data (same format as get_weekly_roster_with_stats),
+                  or None if the league-wide roster request failed. Requested teams
+                  missing from the response are left out.
+        """
+        try:
+            rosters_data = self._cached_api_call(
+                'league_rosters', self._make_api_call_with_delay,
+                self.lg.yhandler.get, f"league/{self.lg.league_id}/teams/roster;week={week}",
+                cache_week=week, validate=lambda body: any((self._parse_league_rosters(body) or {}).values())
+            )
+            if rosters_data is None:
+                return None
+
+            rosters = self._parse_league_rosters(rosters_data)
+            if rosters is None:
+                print(f"      No league rosters found for week {week}")
+                return None
+
+            if team_ids is not None:
+                # Teams the response left out are omitted (not given an empty roster)
+                # so the caller fetches them individually
+                missing = [tk for tk in team_ids if tk not in rosters]
+                if missing:
+                    print(f"      League rosters missing {len(missing)} team(s) for week {week}, "
+                          f"fetching them individually")
+                rosters = {tk: rosters[tk] for tk in team_ids if tk in rosters}
+
+            # Collect all player IDs across the league for chunked stats queries
+            player_ids = []
+            seen = set()
+            for roster_list in rosters.values():
+                for p in roster_list:
+                    pid = p.get('player_id')
+                    if pid and pid not in seen:
+                        seen.add(pid)
+                        player_ids.append(pid)
+
+            player_stats = self.get_player_stats_for_week(player_ids, week)
 
             return {
-                'starters': starters,
-                'bench': bench,
-                'total_starter_points': sum(p['actual_points'] for p in starters),
-                'total_bench_points': sum(p['actual_points'] for p in bench),
+                tk: self._build_roster_with_stats(roster_list, player_stats)
+                for tk, roster_list in rosters.items()
             }
 
+        except ApiError:
+            # Retries exhausted - stop the pull so it can resume from the journal
+            raise
         except Exception as e:
-            print(f"      Error fetching roster+stats for team {team_id} week {week}: {e}")
+            print(f"      Error fetching league rosters+stats for week {week}: {e}")
             import traceback
             traceback.print_exc()
-            return {'starters': [], 'bench': [], 'total_starter_points': 0.0, 'total_bench_points': 0.0}
+            return None
 
     def get_transactions(self):
         """
@@ -476,7 +1012,9 @@ class FantasyWrappedDataPuller:
         try:
             # Get all transaction types (add, drop, trade)
             # count=1000 should cover entire season
-            transactions = self.lg.transactions('add,drop,trade', 1000)
+            transactions = self._cached_api_call(
+                'transactions', self._call_with_retry, self.lg.transactions, 'add,drop,trade', 1000
+            )
 
             transaction_list = []
             for trans in transactions:
@@ -566,7 +1104,7 @@ class FantasyWrappedDataPuller:
         print("Fetching draft results...")
 
         try:
-            draft_results = self.lg.draft_results()
+            draft_results = self._cached_api_call('draft_results', self._call_with_retry, self.lg.draft_results)
 
             draft_picks = []
             for pick in draft_results:
@@ -616,91 +1154,15 @@ class FantasyWrappedDataPuller:
             list of dict: Matchup data
         """
         try:
-            # matchups() returns a dict with raw JSON from Yahoo API
-            # Note: There is no scoreboard() method - use matchups()
-            scoreboard_data = self.lg.matchups(week)
-            matchups = []
-
-            # The structure is: fantasy_content -> league[1] -> scoreboard -> 0 -> matchups
-            matchups_dict = None
-
-            if 'fantasy_content' in scoreboard_data:
-                league_data = scoreboard_data['fantasy_content'].get('league', [])
-                if len(league_data) > 1 and isinstance(league_data[1], dict):
-                    scoreboard = league_data[1].get('scoreboard', {})
-                    if '0' in scoreboard:
-                        matchups_dict = scoreboard['0'].get('matchups', {})
-
-            if not matchups_dict:
-                print(f"No matchups found for week {week}")
+            scoreboard = self.get_week_scoreboard(week)
+            if not scoreboard:
                 return []
 
-            # matchups_dict is a dict with numeric string keys: {'0': {matchup}, '1': {matchup}, ...}
-            # Also contains 'count' field which is an int - filter it out
-            matchups_list = [v for v in matchups_dict.values() if isinstance(v, dict)]
-
-            # Parse each matchup
-            for matchup_obj in matchups_list:
-                # Each matchup has structure: {'matchup': {...}}
-                matchup_data = matchup_obj.get('matchup', {})
-
-                # Teams are under matchup_data['0']['teams']
-                if '0' not in matchup_data or 'teams' not in matchup_data['0']:
-                    continue
-
-                teams_dict = matchup_data['0']['teams']
-
-                # Extract both teams
-                teams_in_matchup = []
-                for team_key in ['0', '1']:
-                    if team_key in teams_dict:
-                        team_array = teams_dict[team_key].get('team', [])
-                        if len(team_array) >= 2:
-                            metadata_list = team_array[0]
-                            points_obj = team_array[1]
-
-                            # Extract team_key from metadata
-                            team_id_str = None
-                            for item in metadata_list:
-                                if isinstance(item, dict) and 'team_key' in item:
-                                    team_id_str = item['team_key']
-                                    break
-
-                            teams_in_matchup.append({
-                                'team_key': team_id_str,
-                                'points_obj': points_obj
-                            })
-
-                if len(teams_in_matchup) >= 2:
-                    team1 = teams_in_matchup[0]
-                    team2 = teams_in_matchup[1]
-
-                    team1_key = team1['team_key']
-                    team1_points = float(team1['points_obj'].get('team_points', {}).get('total', 0.0))
-
-                    team2_key = team2['team_key']
-                    team2_points = float(team2['points_obj'].get('team_points', {}).get('total', 0.0))
-
-                    # Determine winner
-                    if team1_points > team2_points:
-                        winner = team1_key
-                    elif team2_points > team1_points:
-                        winner = team2_key
-                    else:
-                        winner = 'TIE'
-
-                    matchup = {
-                        'week': week,
-                        'team1_id': team1_key,
-                        'team1_points': team1_points,
-                        'team2_id': team2_key,
-                        'team2_points': team2_points,
-                        'winner': winner,
-                    }
-                    matchups.append(matchup)
-
-            return matchups
+            return [dict(m) for m in scoreboard['matchups']]
 
+        except ApiError:
+            # Retries exhausted - stop the pull so it can resume from the journal
+            raise
         except Exception as e:
             print(f"Error fetching week {week} matchups: {e}")
             import traceback
@@ -749,12 +1211,164 @@ class FantasyWrappedDataPuller:
             'points_left_on_bench': sum(m['point_differential'] for m in bench_mistakes),
         }
 
+    def _fetch_team_week(self, team_id, week, roster=None):
+        """
+        Fetch and assemble one team's data for one week
+
+        Args:
+            team_id: Yahoo team ID
+            week: Week number
+            roster: Roster already fetched by a league-wide batch (optional)
+
+        Returns:
+            dict: Week entry for weekly_data (scores, roster, optimal lineup)
+        """
+        # Get scores (scoreboard is fetched once per week and shared across teams)
+        scores = self.get_weekly_scores(team_id, week)
+
+        # Get roster with player stats (includes bench points and injury status)
+        if roster is None:
+            roster = self.get_weekly_roster_with_stats(team_id, week)
+
+        # Combine data
+        week_data = scores or {}
+        week_data['roster'] = roster
+        week_data['bench_points'] = roster.get('total_bench_points', 0.0) if roster else 0.0
+
+        # The calculator recomputes lineups and never reads raw stats, so compact mode skips both
+        if self.compact:
+            return compact_week_entry(week_data)
+
+        # Calculate optimal lineup
+        week_data['optimal_lineup'] = self.calculate_optimal_lineup(roster) if roster else {}
+
+        return week_data
+
+    def _fetch_week_batched(self, team_ids, week):
+        """
+        Fetch one week for several teams using the league-wide roster batch
+
+        Falls back to per-team roster calls if the batch request fails, and for
+        any team the batch response left out.
+
+        Args:
+            team_ids: Teams to fetch
+            week: Week number
+
+        Returns:
+            dict: team_id -> week entry for weekly_data
+        """
+        rosters = self.get_league_rosters_with_stats(week, team_ids) or {}
+        if not rosters:
+            print(f"      League roster batch failed for week {week}, fetching teams individually")
+
+        return {
+            team_id: self._fetch_team_week(team_id, week, rosters.get(team_id))
+            for team_id in team_ids
+        }
+
+    def _record_team_week(self, journal, fetched, team_id, week, week_data):
+        """
+        Keep a fetched team-week and checkpoint it if complete
+
+        Weeks without a result are kept for this run but not journaled, so a
+        resumed pull fetches them again.
+        """
+        fetched[(team_id, week)] = week_data
+        if week_data.get('result'):
+            journal.append(team_id, week, week_data)
+
+    def _pull_weekly_data_batched(self, pending, journal):
+        """
+        Fetch weekly data one league-wide batch per week
+
+        Weeks are spread across the thread pool when concurrency > 1.
+
+        Args:
+            pending: List of (team_id, week) pairs still to fetch
+            journal: CheckpointJournal for completed team-weeks
+
+        Returns:
+            dict: (team_id, week) -> week_data
+        """
+        teams_by_week = {}
+        for team_id, week in pending:
+            teams_by_week.setdefault(week, []).append(team_id)
+
+        fetched = {}
+
+        def record_week(week, week_results):
+            for team_id, week_data in week_results.items():
+                self._record_team_week(journal, fetched, team_id, week, week_data)
+
+        if self.concurrency > 1:
+            with ThreadPoolExecutor(max_workers=self.concurrency, initializer=self._start_worker) as executor:
+                futures = {
+                    executor.submit(self._fetch_week_batched, team_ids, week): week
+                    for week, team_ids in teams_by_week.items()
+                }
+                try:
+                    for future in as_completed(futures):
+                        week = futures[future]
+                        record_week(week, future.result())
+                        print(f"    Week {week} ✓")
+                except ApiError:
+                    # Don't start queued weeks once Yahoo has given up on us
+                    for future in futures:
+                        future.cancel()
+                    raise
+        else:
+            for week, team_ids in teams_by_week.items():
+                print(f"    Week {week}...", end=" ")
+                record_week(week, self._fetch_week_batched(team_ids, week))
+                print("✓")
+
+        return fetched
+
+    def _pull_weekly_data_concurrent(self, pending, journal):
+        """
+        Fetch every pending (team, week) pair across a bounded thread pool
+
+        All workers share self.rate_limiter, so concurrency overlaps request
+        latency without exceeding the Yahoo request budget. Each worker makes
+        its calls through its own League object and HTTP session.
+
+        Args:
+            pending: List of (team_id, week) pairs still to fetch
+            journal: CheckpointJournal for completed team-weeks
+
+        Returns:
+            dict: (team_id, week) -> week_data
+        """
+        print(f"  Fetching {len(pending)} team-weeks with {self.concurrency} workers...")
+
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency, initializer=self._start_worker) as executor:
+            futures = {
+                executor.submit(self._fetch_team_week, team_id, week): (team_id, week)
+                for team_id, week in pending
+            }
+
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    team_id, week = futures[future]
+                    self._record_team_week(journal, fetched, team_id, week, future.result())
+                    if done % 25 == 0 or done == len(pending):
+                        print(f"    [{done}/{len(pending)}] team-weeks fetched")
+            except ApiError:
+                # Don't start queued team-weeks once Yahoo has given up on us
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return fetched
+
     def pull_complete_season_data(self, resume=True):
         """
         Master function: Pull all data needed for Fantasy Wrapped
 
         Args:
-            resume: If True, check for partial save file and resume from there
+            resume: If True, replay the checkpoint journal and only fetch missing team-weeks
 
         Returns:
             dict: Complete structured data for entire season
@@ -763,18 +1377,17 @@ class FantasyWrappedDataPuller:
         print("FANTASY RECKONING DATA PULLER")
         print("="*60 + "\n")
 
-        # Check for partial save to resume from
-        partial_filename = os.path.join(self.work_dir, f"league_{self.league_id}_{self.season_year}_PARTIAL.json")
-        existing_weekly_data = {}
-        completed_team_ids = set()
+        # Completed team-weeks are journaled as they arrive so a crash loses at most the ones in flight
+        journal_filename = os.path.join(self.work_dir, f"league_{self.league_id}_{self.season_year}_PARTIAL.jsonl")
+        journal = CheckpointJournal(journal_filename, {'league_id': self.league_id, 'season': self.season_year})
+        completed = {}
 
-        if resume and os.path.exists(partial_filename):
-            print(f"📂 Found partial save file: {partial_filename}")
-            with open(partial_filename, 'r') as f:
-                partial_data = json.load(f)
-            existing_weekly_data = partial_data.get('weekly_data', {})
-            completed_team_ids = set(existing_weekly_data.keys())
-            print(f"   Resuming from {len(completed_team_ids)} completed teams\n")
+        if resume and os.path.exists(journal_filename):
+            print(f"📂 Found checkpoint journal: {journal_filename}")
+            completed = journal.compact()
+            print(f"   Resuming with {len(completed)} completed team-weeks\n")
+        elif os.path.exists(journal_filename):
+            journal.remove()
 
         # Get league metadata
         league_metadata = self.get_league_metadata()
@@ -792,65 +1405,72 @@ class FantasyWrappedDataPuller:
         # Get weekly data for each team
         print(f"\nFetching weekly data for weeks 1-{last_regular_season_week}...")
 
-        # Start with existing data if resuming
-        weekly_data = existing_weekly_data.copy()
-
-        teams_completed = len(completed_team_ids)
         total_teams = len(all_teams)
+        weeks = list(range(1, last_regular_season_week + 1))
+
+        # Delta pull: reuse weeks that were already final in the existing league file
+        if self.since_existing:
+            existing = load_existing_league(self.since_existing, self.league_id, self.season_year)
+            team_ids = [team['team_id'] for team in all_teams]
+            reuse_through = last_complete_week(existing, team_ids, last_regular_season_week)
+            if reuse_through:
+                print(f"  Reusing weeks 1-{reuse_through} from {self.since_existing}")
+                for key, week_data in existing_team_weeks(existing, team_ids, reuse_through).items():
+                    completed.setdefault(key, week_data)
+
+        pending = [
+            (team['team_id'], week)
+            for team in all_teams
+            for week in weeks
+            if (team['team_id'], week) not in completed
+        ]
 
         for team in all_teams:
-            team_id = team['team_id']
-            team_name = team['team_name']
-
-            # Skip already completed teams
-            if team_id in completed_team_ids:
-                print(f"\n  [✓] Skipping {team_name} (already completed)")
-                continue
-
-            teams_completed += 1
-            print(f"\n  [{teams_completed}/{total_teams}] Processing {team_name}...")
-            weekly_data[team_id] = {}
-
-            for week in range(1, last_regular_season_week + 1):
-                print(f"    Week {week}...", end=" ")
+            if all((team['team_id'], week) in completed for week in weeks):
+                print(f"\n  [✓] Skipping {team['team_name']} (already completed)")
 
-                # Get scores
-                scores = self._make_api_call_with_delay(
-                    self.get_weekly_scores, team_id, week
-                )
-
-                # Get roster with player stats (includes bench points and injury status)
-                roster = self._make_api_call_with_delay(
-                    self.get_weekly_roster_with_stats, team_id, week
-                )
-
-                # Calculate optimal lineup
-                optimal = self.calculate_optimal_lineup(roster) if roster else {}
-
-                # Combine data
-                week_data = scores or {}
-                week_data['roster'] = roster
-                week_data['optimal_lineup'] = optimal
-                week_data['bench_points'] = roster.get('total_bench_points', 0.0) if roster else 0.0
-
-                weekly_data[team_id][f'week_{week}'] = week_data
-                print("✓")
+        try:
+            if self.batched and pending:
+                print(f"  Fetching league-wide roster batches for {len(pending)} team-weeks...")
+                completed.update(self._pull_weekly_data_batched(pending, journal))
+            elif self.concurrency > 1 and pending:
+                completed.update(self._pull_weekly_data_concurrent(pending, journal))
+            else:
+                pending_by_team = {}
+                for team_id, week in pending:
+                    pending_by_team.setdefault(team_id, []).append(week)
+
+                teams_started = total_teams - len(pending_by_team)
+                for team in all_teams:
+                    team_id = team['team_id']
+                    if team_id not in pending_by_team:
+                        continue
 
-            # INCREMENTAL SAVE: Save progress after each team completes
-            partial_data = {
-                'league': league_metadata,
-                'teams': all_teams,
-                'weekly_data': weekly_data,
-                'transactions': {},  # Not fetched yet
-                'draft': {},  # Not fetched yet
-                'generated_at': datetime.now().isoformat(),
-                '_partial': True,
-                '_teams_completed': teams_completed,
-                '_total_teams': total_teams,
+                    teams_started += 1
+                    print(f"\n  [{teams_started}/{total_teams}] Processing {team['team_name']}...")
+
+                    for week in pending_by_team[team_id]:
+                        print(f"    Week {week}...", end=" ")
+                        week_data = self._fetch_team_week(team_id, week)
+                        self._record_team_week(journal, completed, team_id, week, week_data)
+                        print("✓")
+        except ApiError as e:
+            print(f"\n❌ Stopping pull: {e}")
+            print(f"   Completed team-weeks saved to: {journal_filename}")
+            print("   Re-run the pull to resume once Yahoo recovers.")
+            raise
+        finally:
+            journal.close()
+
+        # Compaction: assemble weekly_data in team/week order from the journaled and fetched team-weeks
+        weekly_data = {
+            team['team_id']: {
+                f'week_{week}': completed[(team['team_id'], week)]
+                for week in weeks
+                if (team['team_id'], week) in completed
             }
-            with open(partial_filename, 'w') as f:
-                json.dump(partial_data, f, indent=2)
-            print(f"    💾 Progress saved ({teams_completed}/{total_teams} teams)")
+            for team in all_teams
+        }
 
         # Get transactions
         print("\nFetching transactions...")
@@ -902,16 +1522,14 @@ class FantasyWrappedDataPuller:
                 print(f"   • {error}")
             if len(validation_errors) > 20:
                 print(f"   ... and {len(validation_errors) - 20} more errors")
-            print(f"\n⚠️  Partial data saved to: {partial_filename}")
+            print(f"\n⚠️  Completed team-weeks saved to: {journal_filename}")
             print("   Re-run pull when rate limit resets to complete.")
             raise Exception(f"Data pull incomplete: {len(validation_errors)} validation errors")
 
         print("✓ All data validated successfully!")
 
-        # Remove partial file since we completed successfully
-        if os.path.exists(partial_filename):
-            os.remove(partial_filename)
-            print(f"✓ Removed partial save file")
+        # Keep the journal until save_to_json has written the league file from this data
+        self._journal = journal
 
         # Compile complete data
         complete_data = {
@@ -927,6 +1545,9 @@ class FantasyWrappedDataPuller:
         print("DATA EXTRACTION COMPLETE!")
         print("="*60)
 
+        if self.response_cache.enabled:
+            print(self.response_cache.summary())
+
         return complete_data
 
     def save_to_json(self, data, filename=None):
@@ -941,11 +1562,16 @@ class FantasyWrappedDataPuller:
             filename = f'league_{self.league_id}_{self.season_year}.json'
 
         filepath = os.path.join(self.work_dir, filename)
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_league_file(data, filepath, compact=self.compact)
 
         print(f"\n✓ Data saved to: {filepath}")
 
+        # The league file now holds everything the journal did
+        if self._journal is not None:
+            self._journal.remove()
+            self._journal = None
+            print("✓ Removed checkpoint journal")
+
 
 def main():
     """
@@ -955,6 +1581,20 @@ def main():
     parser = argparse.ArgumentParser(description='Pull Yahoo Fantasy data')
     parser.add_argument('--work-dir', type=str, default=None,
                         help='Working directory for input/output files')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='Worker threads for weekly team fetches (default: 1, sequential)')
+    parser.add_argument('--requests-per-second', type=float, default=YAHOO_REQUESTS_PER_SECOND,
+                        help=f'Sustained Yahoo API request budget (default: {YAHOO_REQUESTS_PER_SECOND})')
+    parser.add_argument('--batched', action='store_true',
+                        help='Fetch all rosters for a week in one league-wide request')
+    parser.add_argument('--since-existing', type=str, default=None, metavar='LEAGUE_JSON',
+                        help='Reuse completed weeks from an existing league file and only fetch newer weeks')
+    parser.add_argument('--retry-budget', type=int, default=DEFAULT_RETRY_BUDGET,
+                        help=f'Retries allowed across the whole pull (default: {DEFAULT_RETRY_BUDGET})')
+    parser.add_argument('--compact', action='store_true',
+                        help='Write only the fields the calculator reads, without indentation')
+    parser.add_argument('--api-base', type=str, default=None,
+                        help='Alternate Yahoo API base URL (e.g. api_replay.py stand-in server, skips OAuth)')
     args = parser.parse_args()
 
     work_dir = args.work_dir or os.getcwd()
@@ -978,7 +1618,16 @@ def main():
     print(f"Season: {season}\n")
 
     # Initialize puller with work directory
-    puller = FantasyWrappedDataPuller(league_id, season, work_dir=work_dir)
+    puller = FantasyWrappedDataPuller(
+        league_id, season, work_dir=work_dir,
+        concurrency=args.concurrency,
+        requests_per_second=args.requests_per_second,
+        batched=args.batched,
+        since_existing=args.since_existing,
+        retry_budget=args.retry_budget,
+        compact=args.compact,
+        api_base=args.api_base,
+    )
 
     # Authenticate
     puller.authenticate()
@@ -0,0 +1,94 @@
+"""
+Delta Pull Helpers
+Reuse completed weeks from an existing league file so a refresh only fetches newer weeks
+
+Shared by data_puller.py and sleeper_data_puller.py (--since-existing). A week
+is reused only if it was already over when the existing file was pulled (it is
+before that file's current_week) and every team has a result for it, so the
+merged output matches what a full pull would produce.
+"""
+
+import os
+import json
+
+
+def load_existing_league(path, league_id, season=None):
+    """
+    Load a prior league file if it belongs to the same league and season
+
+    Args:
+        path: Existing league JSON path
+        league_id: League being pulled
+        season: Season being pulled (optional)
+
+    Returns:
+        dict: Existing league data, or None if it can't be reused
+    """
+    if not path or not os.path.exists(path):
+        print(f"⚠️  Existing league file not found: {path} (doing a full pull)")
+        return None
+
+    try:
+        with open(path, 'r') as f:
+            existing = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Could not read existing league file ({e}), doing a full pull")
+        return None
+
+    league = existing.get('league', {})
+    if str(league.get('league_id')) != str(league_id):
+        print(f"⚠️  Existing file is for league {league.get('league_id')}, doing a full pull")
+        return None
+    if season is not None and int(league.get('season', 0)) != int(season):
+        print(f"⚠️  Existing file is for season {league.get('season')}, doing a full pull")
+        return None
+
+    return existing
+
+
+def last_complete_week(existing, team_ids, max_week):
+    """
+    Find the last week that can be reused from an existing league file
+
+    Args:
+        existing: Existing league data (from load_existing_league)
+        team_ids: Teams in the league now
+        max_week: Last week the new pull covers
+
+    Returns:
+        int: Weeks 1..N can be reused (0 if none)
+    """
+    if not existing or not team_ids:
+        return 0
+
+    weekly_data = existing.get('weekly_data', {})
+    # Weeks before the existing pull's current week were already final
+    through = min(max_week, int(existing.get('league', {}).get('current_week', 1)) - 1)
+
+    for week in range(1, through + 1):
+        week_key = f'week_{week}'
+        for team_id in team_ids:
+            if not weekly_data.get(team_id, {}).get(week_key, {}).get('result'):
+                return week - 1
+
+    return max(through, 0)
+
+
+def existing_team_weeks(existing, team_ids, through_week):
+    """
+    Pull reusable team-weeks out of an existing league file
+
+    Args:
+        existing: Existing league data
+        team_ids: Teams to reuse
+        through_week: Last reusable week (from last_complete_week)
+
+    Returns:
+        dict: (team_id, week) -> week_data
+    """
+    weekly_data = existing.get('weekly_data', {}) if existing else {}
+    return {
+        (team_id, week): weekly_data[team_id][f'week_{week}']
+        for team_id in team_ids
+        for week in range(1, through_week + 1)
+    }
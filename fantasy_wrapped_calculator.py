@@ -15,13 +15,33 @@ Universal support for ANY Yahoo Fantasy Football league:
 - Head-to-head and points-only scoring
 """
 
+import contextlib
+import io
 import json
+import multiprocessing
 import os
 import glob
 import argparse
 from datetime import datetime
 from collections import defaultdict
 from typing import Dict, List, Tuple, Any, Optional
+from league_model import LeagueModel, transaction_week
+from league_context import LeagueContext
+from all_play import AllPlay
+from lineup_engine import optimal_lineup, optimal_lineups
+from league_state import LeagueState, apply_delta_file, state_path
+from league_snapshot import read_snapshot, snapshot_path, source_digest, write_snapshot
+from roster_entry import roster_object_hook
+
+# Card ids and the cards each one reads. Card 1 also needs the league's
+# archetype assignment, which is scored from ARCHETYPE_INPUTS for every team.
+CARD_DEPENDENCIES = {
+    'card_1_overview': ('card_2_ledger', 'card_3_lineups'),
+    'card_2_ledger': (),
+    'card_3_lineups': (),
+    'card_4_story': ('card_2_ledger', 'card_3_lineups'),
+}
+ARCHETYPE_INPUTS = ('card_2_ledger', 'card_3_lineups')
 
 
 class FantasyWrappedCalculator:
@@ -30,22 +50,36 @@ class FantasyWrappedCalculator:
     Supports any Yahoo Fantasy Football league configuration
     """
 
-    def __init__(self, data_file: Optional[str] = None):
+    def __init__(self, data_file: Optional[str] = None, use_snapshot: bool = False):
         """
         Load and parse league data
 
         Args:
             data_file: Path to league JSON file. If None, auto-detects most recent file.
+            use_snapshot: Load from (and write) the binary snapshot next to the
+                league file instead of reparsing the JSON every run. Only pays
+                off when the same league file is loaded again (e.g. repeated
+                CLI refreshes); one-off files such as web jobs leave it off.
         """
         # Auto-detect data file if not provided
         if data_file is None:
             data_file = self._find_latest_league_file()
             print(f"Auto-detected league file: {data_file}")
 
-        # Load data
+        # Load data (from the snapshot if it was written from this exact file)
         print(f"Loading league data from: {data_file}")
-        with open(data_file, 'r') as f:
-            self.data = json.load(f)
+        self.data_file = data_file
+        with open(data_file, 'rb') as f:
+            raw = f.read()
+        digest = source_digest(raw) if use_snapshot else None
+        snapshot = read_snapshot(snapshot_path(data_file), digest) if use_snapshot else None
+        if snapshot is not None:
+            self.data, model = snapshot
+            print(f"Loaded snapshot: {snapshot_path(data_file)}")
+        else:
+            # Roster listings are decoded straight into compact RosterEntry objects
+            self.data = json.loads(raw, object_hook=roster_object_hook())
+            model = None
 
         # Parse core data
         self.league = self.data['league']
@@ -63,7 +97,13 @@ class FantasyWrappedCalculator:
         self._validate_league()
 
         # Build helper indices
-        self._build_indices()
+        self._build_indices(model)
+
+        if use_snapshot and snapshot is None:
+            try:
+                write_snapshot(snapshot_path(data_file), digest, self.data, self.model)
+            except OSError as e:
+                print(f"⚠️  Could not write league snapshot: {e}")
 
         # Print league info
         self._print_league_summary()
@@ -277,8 +317,13 @@ class FantasyWrappedCalculator:
             print(f"Positions: {', '.join(f'{k}({v})' for k, v in self.roster_config['positions'].items())}")
         print("="*70 + "\n")
 
-    def _build_indices(self):
-        """Build lookup indices for fast data access"""
+    def _build_indices(self, model: Optional[LeagueModel] = None):
+        """
+        Build lookup indices for fast data access
+
+        Args:
+            model: LeagueModel loaded from a snapshot (built from weekly_data if None)
+        """
         # Draft picks by team
         self.draft_by_team = defaultdict(list)
         for pick in self.draft:
@@ -287,19 +332,13 @@ class FantasyWrappedCalculator:
         # Transactions by team - flatten player data for easier access
         self.transactions_by_team = defaultdict(list)
 
-        # Calculate season start based on league year (NFL starts first Thursday of Sept)
-        from datetime import datetime
+        # Weeks count from the season start (NFL starts first Thursday of Sept)
         season_year = self.league.get('season', 2024)
-        # First Thursday of September for the season year
-        sept_1 = datetime(season_year, 9, 1)
-        days_to_thursday = (3 - sept_1.weekday()) % 7  # Thursday = 3
-        season_start_dt = datetime(season_year, 9, 1 + days_to_thursday)
-        season_start_ts = int(season_start_dt.timestamp())
 
         for trans in self.transactions:
             timestamp = trans.get('timestamp', 0)
             # Calculate week from timestamp
-            week = max(1, min(18, ((timestamp - season_start_ts) // (7 * 24 * 3600)) + 1)) if timestamp > season_start_ts else 1
+            week = transaction_week(timestamp, season_year)
 
             for player in trans.get('players', []):
                 player_type = player.get('type')  # 'add' or 'drop'
@@ -335,20 +374,93 @@ class FantasyWrappedCalculator:
                         source_entry['trade_direction'] = 'out'  # Mark as outgoing
                         self.transactions_by_team[player.get('source_team_key')].append(source_entry)
 
-        # Player points by week (for ROS calculations)
-        self.player_points_by_week = defaultdict(lambda: defaultdict(float))
-        # Player ID to name mapping
-        self.player_names = {}
-        for team_key, weeks in self.weekly_data.items():
-            for week_key, week_data in weeks.items():
-                roster = week_data.get('roster', {})
-                for player in roster.get('starters', []) + roster.get('bench', []):
-                    player_id = str(player['player_id'])
-                    week_num = int(week_key.split('_')[1])
-                    self.player_points_by_week[player_id][week_num] = player['actual_points']
-                    # Store player name if we don't have it yet
-                    if player_id not in self.player_names:
-                        self.player_names[player_id] = player.get('player_name', f'Player {player_id}')
+        # Columnar model of weekly results and rosters (one pass over weekly_data)
+        self.model = model if model is not None else LeagueModel(self.weekly_data, self.teams.keys())
+
+        # Player points by week (for ROS calculations) and player ID to name mapping
+        self.player_points_by_week = self.model.player_points_by_week
+        self.player_names = self.model.player_names
+
+        # Player position index (primary position, eligibility, first/last week rostered)
+        self.player_positions = self.model.player_position_index()
+
+        # League-wide rankings shared by the cards (built on first use)
+        self._league_context = None
+        self._all_play = None
+
+        # Optimal lineup cache: (team_key, week, filter_injured) -> result.
+        # Rosters are recognized by identity, so the existing
+        # calculate_optimal_lineup(roster) calls hit the cache too.
+        self._roster_keys = {
+            id(week_data['roster']): (team_key, int(week_key.split('_')[1]))
+            for team_key, weeks in self.weekly_data.items()
+            for week_key, week_data in weeks.items()
+            if 'roster' in week_data
+        }
+        self._lineup_cache = {}
+        self._lineup_cache_stats = {'hits': 0, 'misses': 0, 'uncached': 0}
+
+        # Computed cards: card_id -> team_key -> card, plus the league's archetypes
+        self._card_cache = {card_id: {} for card_id in CARD_DEPENDENCIES}
+        self._archetype_assignments = None
+
+    def get_league_context(self) -> LeagueContext:
+        """
+        Get the league-wide metric vectors the cards rank against
+
+        Returns:
+            LeagueContext built once per calculator
+        """
+        if self._league_context is None:
+            self._league_context = LeagueContext(self)
+        return self._league_context
+
+    def get_all_play(self) -> AllPlay:
+        """
+        Get every team's regular season all-play record and expected wins
+
+        Returns:
+            AllPlay built once per calculator (each week's scores sorted once)
+        """
+        if self._all_play is None:
+            self._all_play = AllPlay(self.model, self.teams.keys(), self.get_regular_season_weeks())
+        return self._all_play
+
+    def use_league_state(self, path: str = None) -> LeagueState:
+        """
+        Fold new weeks into the league's persisted season aggregates and seed the caches from them
+
+        The state sidecar is reused when it matches this league file's earlier
+        weeks, so only weeks after its last folded week are processed (and it
+        is rebuilt from scratch otherwise). Call before generating cards.
+
+        Args:
+            path: State sidecar path (default: next to the league file)
+
+        Returns:
+            The updated LeagueState (also saved to path)
+        """
+        path = path or state_path(self.data_file)
+        league_id = self.league.get('league_id')
+        season = self.league.get('season')
+
+        state = LeagueState.load(path, league_id, season)
+        if state is not None and not state.is_current(self):
+            print("⚠️  League state doesn't match earlier weeks, rebuilding")
+            state = None
+        reused = state.through_week if state is not None else 0
+        if state is None:
+            state = LeagueState(league_id, season)
+
+        new_weeks = state.update(self)
+        state.seed(self)
+        state.save(path)
+
+        if reused:
+            print(f"✓ League state: reused weeks 1-{reused}, added {len(new_weeks)} new week(s)")
+        else:
+            print(f"✓ League state: built weeks 1-{state.through_week}")
+        return state
 
     def get_regular_season_weeks(self) -> range:
         """
@@ -376,43 +488,10 @@ class FantasyWrappedCalculator:
         Returns:
             Dict with wins, losses, ties, points_for, points_against
         """
-        regular_season_weeks = self.get_regular_season_weeks()
-
-        wins = 0
-        losses = 0
-        ties = 0
-        points_for = 0.0
-        points_against = 0.0
-
-        for week in regular_season_weeks:
-            week_key = f'week_{week}'
-
-            if week_key not in self.weekly_data.get(team_key, {}):
-                continue
-
-            week_data = self.weekly_data[team_key][week_key]
-            team_score = week_data.get('actual_points', 0)
-            opp_score = week_data.get('opponent_points', 0)
-
-            # Accumulate points
-            points_for += team_score
-            points_against += opp_score
-
-            # Determine result
-            if team_score > opp_score:
-                wins += 1
-            elif team_score < opp_score:
-                losses += 1
-            else:
-                ties += 1
-
-        return {
-            'wins': wins,
-            'losses': losses,
-            'ties': ties,
-            'points_for': round(points_for, 2),
-            'points_against': round(points_against, 2)
-        }
+        totals = self.model.team_season_totals(team_key, self.get_regular_season_weeks())
+        totals['points_for'] = round(totals['points_for'], 2)
+        totals['points_against'] = round(totals['points_against'], 2)
+        return totals
 
     def get_ros_points(self, player_id: str, start_week: int) -> float:
         """
@@ -425,13 +504,7 @@ class FantasyWrappedCalculator:
         Returns:
             Total points scored from week start_week+1 through end of season
         """
-        total = 0.0
-        current_week = self.league['current_week']
-
-        for week in range(start_week + 1, current_week + 1):
-            total += self.player_points_by_week[player_id].get(week, 0.0)
-
-        return total
+        return self.model.player_points_between(player_id, start_week + 1, self.league['current_week'])
 
     def get_rostered_players(self, week: int) -> set:
         """
@@ -443,16 +516,8 @@ class FantasyWrappedCalculator:
         Returns:
             Set of player IDs on rosters that week
         """
-        rostered = set()
-        week_key = f'week_{week}'
-
-        for team_key in self.weekly_data:
-            if week_key in self.weekly_data[team_key]:
-                roster = self.weekly_data[team_key][week_key].get('roster', {})
-                for player in roster.get('starters', []) + roster.get('bench', []):
-                    rostered.add(str(player['player_id']))
-
-        return rostered
+        player_ids = self.model.player_ids
+        return {player_ids[p] for p in self.model.rostered_player_indices(week)}
 
     def get_available_fas(self, week: int, position: str = None) -> List[Tuple[str, float]]:
         """
@@ -460,26 +525,48 @@ class FantasyWrappedCalculator:
 
         Args:
             week: Week number
-            position: Optional position filter
+            position: Optional position filter (players ever eligible at the position)
 
         Returns:
             List of (player_id, ros_points) tuples for available players
         """
-        rostered = self.get_rostered_players(week)
+        model = self.model
+        current_week = self.league['current_week']
         available = []
 
-        # Get all players who scored points that season
-        for player_id, weeks_dict in self.player_points_by_week.items():
-            if player_id not in rostered:
-                ros_points = self.get_ros_points(player_id, week)
-                if ros_points > 0:
-                    available.append((player_id, ros_points))
+        # Get all unrostered players who scored points the rest of the season
+        for p in model.iter_bits(model.available_mask(week, position)):
+            ros_points = model.points_between(p, week + 1, current_week)
+            if ros_points > 0:
+                available.append((model.player_ids[p], ros_points))
 
         # Sort by ROS points descending
         available.sort(key=lambda x: x[1], reverse=True)
 
         return available
 
+    def get_best_available_fa(self, week: int, position: str = None) -> Optional[Tuple[str, float]]:
+        """
+        Get the free agent with the most ROS points at a given week
+
+        Args:
+            week: Week number
+            position: Optional position filter
+
+        Returns:
+            (player_id, ros_points) tuple, or None if nobody available scored
+        """
+        model = self.model
+        current_week = self.league['current_week']
+        best = None
+
+        for p in model.iter_bits(model.available_mask(week, position)):
+            ros_points = model.points_between(p, week + 1, current_week)
+            if ros_points > 0 and (best is None or ros_points > best[1]):
+                best = (model.player_ids[p], ros_points)
+
+        return best
+
     def calculate_replacement_levels(self) -> Dict[str, float]:
         """
         Calculate position-specific replacement level points based on league settings
@@ -515,6 +602,21 @@ class FantasyWrappedCalculator:
         # Sample several weeks to see which positions fill flex spots
         flex_usage = self._estimate_flex_allocation()
 
+        # Group every player's season totals by primary position once
+        players_by_position = defaultdict(list)
+        for player_id, weeks_dict in self.player_points_by_week.items():
+            # Calculate total points and games played
+            total_points = sum(weeks_dict.values())
+            games_played = len([pts for pts in weeks_dict.values() if pts > 0])
+
+            if games_played > 0:
+                players_by_position[self._get_player_primary_position(player_id)].append({
+                    'player_id': player_id,
+                    'total_points': total_points,
+                    'games_played': games_played,
+                    'ppg': total_points / games_played
+                })
+
         # Calculate replacement levels for each position
         replacement_levels = {}
 
@@ -529,24 +631,7 @@ class FantasyWrappedCalculator:
             band_size = max(int(num_teams * starters_at_pos), 1)
 
             # Get all players at this position with their season totals
-            players_at_position = []
-            for player_id, weeks_dict in self.player_points_by_week.items():
-                # Determine player position
-                player_pos = self._get_player_primary_position(player_id)
-
-                if player_pos == position:
-                    # Calculate total points and games played
-                    total_points = sum(weeks_dict.values())
-                    games_played = len([pts for pts in weeks_dict.values() if pts > 0])
-
-                    if games_played > 0:
-                        ppg = total_points / games_played
-                        players_at_position.append({
-                            'player_id': player_id,
-                            'total_points': total_points,
-                            'games_played': games_played,
-                            'ppg': ppg
-                        })
+            players_at_position = players_by_position[position]
 
             # Sort by total points (season-long value)
             players_at_position.sort(key=lambda x: x['total_points'], reverse=True)
@@ -583,27 +668,23 @@ class FantasyWrappedCalculator:
         flex_counts = {'RB': 0, 'WR': 0, 'TE': 0}
         sample_count = 0
 
+        model = self.model
+        flex_slots = {model.position_index[pos] for pos in ['FLEX', 'W/R/T', 'W/R', 'W/T', 'R/T']
+                      if pos in model.position_index}
+        position_bits = [(pos, model.position_mask([pos])) for pos in ['RB', 'WR', 'TE']]
+
         # Sample up to 5 weeks for each team
         for team_key in list(self.weekly_data.keys())[:min(len(self.weekly_data), 12)]:
-            team_weeks = self.weekly_data[team_key]
-            for week_key in list(team_weeks.keys())[:5]:
-                week_data = team_weeks[week_key]
-                roster = week_data.get('roster', {})
-                starters = roster.get('starters', [])
-
-                for player in starters:
-                    selected_pos = player.get('selected_position', '')
-
+            for week_key in list(self.weekly_data[team_key].keys())[:5]:
+                for row in model.roster_rows(team_key, int(week_key.split('_')[1]), bench=False):
                     # Check if this is a flex position
-                    if selected_pos in ['FLEX', 'W/R/T', 'W/R', 'W/T', 'R/T']:
+                    if model.slot_position[row] in flex_slots:
                         # Get player's actual position
-                        eligible = player.get('eligible_positions', [])
-                        if 'RB' in eligible:
-                            flex_counts['RB'] += 1
-                        elif 'WR' in eligible:
-                            flex_counts['WR'] += 1
-                        elif 'TE' in eligible:
-                            flex_counts['TE'] += 1
+                        eligible = model.slot_eligible[row]
+                        for pos, bit in position_bits:
+                            if eligible & bit:
+                                flex_counts[pos] += 1
+                                break
 
                         sample_count += 1
 
@@ -624,7 +705,7 @@ class FantasyWrappedCalculator:
 
     def _get_player_primary_position(self, player_id: str) -> str:
         """
-        Get a player's primary position by checking their most common roster position
+        Get a player's primary position (most common first eligible position) from the position index
 
         Args:
             player_id: Player ID
@@ -632,35 +713,18 @@ class FantasyWrappedCalculator:
         Returns:
             Position string (QB, RB, WR, TE, K, DEF)
         """
-        position_counts = {}
-
-        # Check all weeks/teams to find this player
-        for team_key in self.weekly_data:
-            for week_key in self.weekly_data[team_key]:
-                week_data = self.weekly_data[team_key][week_key]
-                roster = week_data.get('roster', {})
-
-                # Check starters and bench
-                for player in roster.get('starters', []) + roster.get('bench', []):
-                    if str(player.get('player_id')) == str(player_id):
-                        # Get eligible positions
-                        eligible = player.get('eligible_positions', [])
-                        if eligible:
-                            # Use first eligible position as primary
-                            primary = eligible[0]
-                            position_counts[primary] = position_counts.get(primary, 0) + 1
-
-        # Return most common position
-        if position_counts:
-            return max(position_counts, key=position_counts.get)
-
-        # Default fallback
-        return 'FLEX'
+        position = self.player_positions.get(str(player_id))
+        return position.primary if position else 'FLEX'
 
     def calculate_optimal_lineup(self, roster: Dict, filter_injured: bool = True) -> Dict:
         """
         Calculate optimal lineup for a given roster
 
+        Rosters from this league's weekly_data are solved once per
+        (team, week, filter_injured) and served from the cache afterwards;
+        any other roster is solved on every call. Cached results are shared,
+        so treat them as read-only.
+
         Args:
             roster: Roster dict with starters and bench
             filter_injured: If True, exclude Q/D/O/IR players
@@ -668,76 +732,80 @@ class FantasyWrappedCalculator:
         Returns:
             Dict with optimal_points, bench_mistakes, etc.
         """
-        all_players = roster.get('starters', []) + roster.get('bench', [])
-        actual_starters = roster.get('starters', [])
-
-        # Filter out injured if requested and exclude IR
-        if filter_injured:
-            available_players = [
-                p for p in all_players
-                if p.get('selected_position') != 'IR' and
-                (not p.get('status') or p.get('status') not in ['Q', 'D', 'O', 'IR'])
-            ]
-        else:
-            available_players = [
-                p for p in all_players
-                if p.get('selected_position') != 'IR'
+        team_week = self._roster_keys.get(id(roster))
+        if team_week is None:
+            self._lineup_cache_stats['uncached'] += 1
+            return self._solve_optimal_lineup(roster, filter_injured)
+        return self.get_optimal_lineup(team_week[0], team_week[1], filter_injured)
+
+    def get_optimal_lineup(self, team_key: str, week: int, filter_injured: bool = True) -> Dict:
+        """
+        Get the (cached) optimal lineup for a team-week
+
+        Args:
+            team_key: Team key
+            week: Week number
+            filter_injured: If True, exclude Q/D/O/IR players
+
+        Returns:
+            Dict with optimal_points, points_left_on_bench, etc. (read-only)
+        """
+        key = (team_key, week, filter_injured)
+        result = self._lineup_cache.get(key)
+        if result is not None:
+            self._lineup_cache_stats['hits'] += 1
+            return result
+
+        self._lineup_cache_stats['misses'] += 1
+        roster = self.weekly_data[team_key][f'week_{week}'].get('roster', {})
+        result = self._lineup_cache[key] = self._solve_optimal_lineup(roster, filter_injured)
+        return result
+
+    def precompute_optimal_lineups(self, filter_injured: bool = False, weeks: range = None) -> int:
+        """
+        Solve every team's optimal lineups for a set of weeks in one pass
+
+        Args:
+            filter_injured: Variant to solve (the cards use filter_injured=False)
+            weeks: Weeks to solve (default: regular season)
+
+        Returns:
+            Number of team-weeks solved
+        """
+        weeks = weeks if weeks is not None else self.get_regular_season_weeks()
+        solved = 0
+        for team_key, team_weeks in self.weekly_data.items():
+            # Batch each team's season so weeks with the same slots share eligibility lookups
+            pending = [
+                week for week in weeks
+                if f'week_{week}' in team_weeks and (team_key, week, filter_injured) not in self._lineup_cache
             ]
+            rosters = [team_weeks[f'week_{week}'].get('roster', {}) for week in pending]
+            for week, result in zip(pending, optimal_lineups(rosters, filter_injured)):
+                self._lineup_cache[(team_key, week, filter_injured)] = result
+            self._lineup_cache_stats['misses'] += len(pending)
+            solved += len(pending)
+        return solved
+
+    def get_lineup_cache_stats(self) -> Dict:
+        """
+        Optimal lineup cache counters for profiling
 
-        # Get required positions from actual starters (excluding IR)
-        required_positions = [
-            p['selected_position'] for p in actual_starters
-            if p.get('selected_position') != 'IR'
-        ]
-
-        # Build optimal lineup respecting position constraints
-        optimal_lineup = []
-        used_players = set()
-
-        # Sort available players by points (highest first)
-        available_sorted = sorted(available_players, key=lambda x: x.get('actual_points', 0), reverse=True)
-
-        # Fill each required position with best available eligible player
-        for position in required_positions:
-            best_player = None
-            best_points = -1
-
-            for player in available_sorted:
-                player_id = player.get('player_id')
-                if player_id in used_players:
-                    continue
-
-                eligible_positions = player.get('eligible_positions', [])
-                player_points = player.get('actual_points', 0)
-
-                # Can this player fill this position?
-                if position in eligible_positions:
-                    if player_points > best_points:
-                        best_points = player_points
-                        best_player = player
-
-            if best_player:
-                optimal_lineup.append(best_player)
-                used_players.add(best_player.get('player_id'))
-
-        # Calculate optimal points
-        optimal_points = sum(p.get('actual_points', 0) for p in optimal_lineup)
-
-        # Calculate actual points (excluding IR)
-        actual_points = sum(
-            p.get('actual_points', 0) for p in actual_starters
-            if p.get('selected_position') != 'IR'
-        )
+        Returns:
+            Dict with hits, misses (solves), uncached (rosters not from weekly_data),
+            size and hit_rate
+        """
+        stats = dict(self._lineup_cache_stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['size'] = len(self._lineup_cache)
+        stats['hit_rate'] = round(stats['hits'] / lookups * 100, 1) if lookups else 0
+        return stats
 
-        return {
-            'optimal_points': optimal_points,
-            'actual_points': actual_points,
-            'points_left_on_bench': optimal_points - actual_points,
-            'efficiency_pct': (actual_points / optimal_points * 100) if optimal_points > 0 else 0,
-            'optimal_lineup': optimal_lineup
-        }
+    def _solve_optimal_lineup(self, roster: Dict, filter_injured: bool) -> Dict:
+        """Exact optimal lineup solve for one roster (see lineup_engine.optimal_lineup)"""
+        return optimal_lineup(roster, filter_injured)
 
-    def generate_all_cards(self) -> Dict:
+    def generate_all_cards(self, workers: int = 1) -> Dict:
         """
         Generate all 4 cards for all managers
 
@@ -746,64 +814,46 @@ class FantasyWrappedCalculator:
         2. Assign archetypes at league level (max 3 per archetype)
         3. Generate Card 1 for all teams with assigned archetypes
 
+        Args:
+            workers: Processes for the per-team card passes (1 = serial,
+                0 = one per CPU). Parallel mode needs the fork start method;
+                elsewhere it falls back to serial.
+
         Returns:
             Dict mapping manager names to their card data
         """
         results = {}
-        temp_cards = {}
+        team_keys = list(self.teams.keys())
 
-        # PASS 1: Generate The Ledger, The Lineup, and The Legend for all teams
-        print("\n=== PASS 1: Generating The Ledger, The Lineup, and The Legend ===")
-        for team_key, team in self.teams.items():
-            manager_name = team['manager_name']
-            team_name = team.get('team_name', manager_name)
-            print(f"\n{team_name}...")
-
-            cards = {
-                'manager_id': team_key,
-                'manager_name': manager_name,
-                'team_name': team_name,
-                'season': self.league['season'],
-                'league': self.league['name'],
-                'cards': {}
-            }
+        if workers == 0:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(team_keys))
+        if workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            print("\n⚠️  Parallel card generation needs fork; running serially")
+            workers = 1
 
-            # Generate cards in order 2→3→4 (Card 1 comes later)
-            try:
-                cards['cards']['card_2_ledger'] = self.calculate_card_2(team_key)
-                print(f"  ✓ The Ledger")
-            except Exception as e:
-                print(f"  ✗ The Ledger failed: {e}")
-                cards['cards']['card_2_ledger'] = {'error': str(e)}
+        # Solve every team-week's optimal lineup once; cards 3 and 4 read the cache
+        solved = self.precompute_optimal_lineups(filter_injured=False)
+        print(f"\n✓ Solved {solved} optimal lineups")
 
-            try:
-                cards['cards']['card_3_lineups'] = self.calculate_card_3(team_key)
-                print(f"  ✓ The Lineup")
-            except Exception as e:
-                print(f"  ✗ The Lineup failed: {e}")
-                cards['cards']['card_3_lineups'] = {'error': str(e)}
+        if workers > 1:
+            # Workers inherit the calculator copy-on-write, so build every shared
+            # league vector here once instead of once per worker
+            self.get_league_context().warm()
+            print(f"✓ Generating cards with {workers} worker processes")
 
-            try:
-                cards['cards']['card_4_story'] = self.calculate_card_4(team_key, cards['cards'])
-                print(f"  ✓ The Legend")
-            except Exception as e:
-                print(f"  ✗ The Legend failed: {e}")
-                cards['cards']['card_4_story'] = {'error': str(e)}
-
-            temp_cards[team_key] = cards
+        # PASS 1: Generate The Ledger, The Lineup, and The Legend for all teams
+        print("\n=== PASS 1: Generating The Ledger, The Lineup, and The Legend ===")
+        temp_cards = dict(zip(team_keys, self._run_team_pass(_pass1_worker, team_keys, workers)))
+        for team_key, cards in temp_cards.items():
+            for card_id, card in cards['cards'].items():
+                self._card_cache[card_id][team_key] = card
 
         # PASS 2: Assign archetypes at league level (max 3 per archetype)
         print("\n=== PASS 2: Assigning archetypes (max 3 per archetype) ===")
-        from archetypes import assign_archetypes_for_league
-
-        # Build other_cards_by_team dict for archetype assignment
-        other_cards_by_team = {}
-        for team_key, cards in temp_cards.items():
-            other_cards_by_team[team_key] = cards['cards']
 
         # Assign archetypes across league with capacity constraints
-        team_keys = list(self.teams.keys())
-        archetype_assignments = assign_archetypes_for_league(self, team_keys, other_cards_by_team)
+        archetype_assignments = self.get_archetype_assignments()
 
         # Print archetype distribution
         from collections import Counter
@@ -814,29 +864,192 @@ class FantasyWrappedCalculator:
 
         # PASS 3: Generate The Leader for all teams with assigned archetypes
         print("\n=== PASS 3: Generating The Leader for all teams ===")
-        for team_key, team in self.teams.items():
-            manager_name = team['manager_name']
+        leader_cards = self._run_team_pass(_pass3_worker, team_keys, workers)
+
+        for team_key, card_1 in zip(team_keys, leader_cards):
+            self._card_cache['card_1_overview'][team_key] = card_1
             cards = temp_cards[team_key]
-            assigned_archetype = archetype_assignments[team_key]
+            cards['cards']['card_1_overview'] = card_1
+            cards['generated_at'] = datetime.now().isoformat()
+            results[cards['manager_name']] = cards
+
+        stats = self.get_lineup_cache_stats()
+        print(f"\nOptimal lineup cache: {stats['hits']} hits, {stats['misses']} solves ({stats['hit_rate']}% hit rate)")
+
+        return results
+
+    def _run_team_pass(self, worker, team_keys: List[str], workers: int) -> List:
+        """
+        Run a per-team card pass serially or across forked worker processes
+
+        Workers see this calculator through fork copy-on-write (nothing but the
+        team key is sent to them). Their output is printed and returned in
+        team order, so parallel runs print and merge exactly like serial ones.
+
+        Args:
+            worker: Module-level function (team_key) -> (result, log)
+            team_keys: Teams to process
+            workers: Number of processes (1 = run in this process)
+
+        Returns:
+            List of worker results in team_keys order
+        """
+        global _WORKER_CALC
+
+        _WORKER_CALC = self
+        try:
+            if workers > 1:
+                with multiprocessing.get_context('fork').Pool(workers) as pool:
+                    outputs = pool.map(worker, team_keys)
+            else:
+                outputs = [worker(team_key, capture=False) for team_key in team_keys]
+        finally:
+            _WORKER_CALC = None
+
+        results = []
+        for result, log in outputs:
+            if log:
+                print(log, end='')
+            results.append(result)
+        return results
+
+    def _generate_team_cards(self, team_key: str) -> Dict:
+        """
+        Pass 1 for one team: The Ledger, The Lineup and The Legend
+
+        Returns:
+            Manager card dict with cards 2-4 filled in
+        """
+        team = self.teams[team_key]
+        manager_name = team['manager_name']
+        team_name = team.get('team_name', manager_name)
+        print(f"\n{team_name}...")
+
+        cards = {
+            'manager_id': team_key,
+            'manager_name': manager_name,
+            'team_name': team_name,
+            'season': self.league['season'],
+            'league': self.league['name'],
+            'cards': {}
+        }
+
+        # Generate cards in order 2→3→4 (Card 1 comes later)
+        for card_id, title in (('card_2_ledger', 'The Ledger'), ('card_3_lineups', 'The Lineup'),
+                               ('card_4_story', 'The Legend')):
+            card = cards['cards'][card_id] = self.get_card(team_key, card_id)
+            if 'error' in card:
+                print(f"  ✗ {title} failed: {card['error']}")
+            else:
+                print(f"  ✓ {title}")
+
+        return cards
+
+    def _generate_leader_card(self, team_key: str) -> Dict:
+        """
+        Pass 3 for one team: The Leader with its league-assigned archetype
+
+        Returns:
+            Card 1 dict (or an error dict)
+        """
+        manager_name = self.teams[team_key]['manager_name']
+        assigned_archetype = self.get_archetype_assignments()[team_key]
+        print(f"\nGenerating The Leader for {manager_name} ({assigned_archetype['name']})...")
+
+        card_1 = self.get_card(team_key, 'card_1_overview')
+        if 'error' in card_1:
+            print(f"  ✗ The Leader failed: {card_1['error']}")
+        else:
+            print("  ✓ The Leader")
 
-            print(f"\nGenerating The Leader for {manager_name} ({assigned_archetype['name']})...")
+        return card_1
+
+    def get_cards(self, team_keys: List[str] = None, card_ids: List[str] = None) -> Dict[str, Dict]:
+        """
+        Compute only the requested cards for the requested teams
+
+        Each card pulls in just what it depends on (see CARD_DEPENDENCIES) and
+        the league vectors it reads; card 1 also needs the league's archetype
+        assignment, which is built from cards 2 and 3 for every team. Results
+        are cached on the calculator, so later calls (and generate_all_cards)
+        reuse them.
+
+        Args:
+            team_keys: Teams to compute (default: all teams)
+            card_ids: Card ids, e.g. ['card_3_lineups'] (default: all 4 cards)
+
+        Returns:
+            Dict mapping team_key -> {card_id: card data}
+        """
+        team_keys = list(self.teams.keys()) if team_keys is None else list(team_keys)
+        card_ids = list(CARD_DEPENDENCIES) if card_ids is None else list(card_ids)
+
+        unknown_teams = [tk for tk in team_keys if tk not in self.teams]
+        if unknown_teams:
+            raise ValueError(f"Unknown team key(s): {', '.join(unknown_teams)}")
+        unknown_cards = [card_id for card_id in card_ids if card_id not in CARD_DEPENDENCIES]
+        if unknown_cards:
+            raise ValueError(f"Unknown card id(s): {', '.join(unknown_cards)}. "
+                             f"Valid ids: {', '.join(CARD_DEPENDENCIES)}")
+
+        return {
+            team_key: {card_id: self.get_card(team_key, card_id) for card_id in card_ids}
+            for team_key in team_keys
+        }
+
+    def get_card(self, team_key: str, card_id: str) -> Dict:
+        """
+        Get one card for one team, computing it (and its inputs) on first use
 
-            # Generate The Leader with assigned archetype
+        A card that fails is cached as {'error': message}, the same way
+        generate_all_cards reports it.
+
+        Args:
+            team_key: Team key
+            card_id: One of CARD_DEPENDENCIES
+
+        Returns:
+            Card data dict
+        """
+        cache = self._card_cache[card_id]
+        card = cache.get(team_key)
+        if card is None:
+            other_cards = {dep: self.get_card(team_key, dep) for dep in CARD_DEPENDENCIES[card_id]}
             try:
-                cards['cards']['card_1_overview'] = self.calculate_card_1(
-                    team_key,
-                    cards['cards'],
-                    assigned_archetype=assigned_archetype
-                )
-                print(f"  ✓ The Leader")
+                if card_id == 'card_1_overview':
+                    card = self.calculate_card_1(
+                        team_key,
+                        other_cards,
+                        assigned_archetype=self.get_archetype_assignments()[team_key]
+                    )
+                elif card_id == 'card_2_ledger':
+                    card = self.calculate_card_2(team_key)
+                elif card_id == 'card_3_lineups':
+                    card = self.calculate_card_3(team_key)
+                else:
+                    card = self.calculate_card_4(team_key, other_cards)
             except Exception as e:
-                print(f"  ✗ The Leader failed: {e}")
-                cards['cards']['card_1_overview'] = {'error': str(e)}
+                card = {'error': str(e)}
+            cache[team_key] = card
+        return card
 
-            cards['generated_at'] = datetime.now().isoformat()
-            results[manager_name] = cards
+    def get_archetype_assignments(self) -> Dict[str, Dict]:
+        """
+        Assign archetypes across the league (max 3 per archetype)
 
-        return results
+        Returns:
+            Dict mapping team_key -> assigned archetype, computed once
+        """
+        if self._archetype_assignments is None:
+            from archetypes import assign_archetypes_for_league
+
+            team_keys = list(self.teams.keys())
+            other_cards_by_team = {
+                team_key: {card_id: self.get_card(team_key, card_id) for card_id in ARCHETYPE_INPUTS}
+                for team_key in team_keys
+            }
+            self._archetype_assignments = assign_archetypes_for_league(self, team_keys, other_cards_by_team)
+        return self._archetype_assignments
 
     def calculate_card_1(self, team_key: str, other_cards: Dict = None, assigned_archetype: Dict = None) -> Dict:
         """Card 1: The Leader - How you played and stacked up against your rivals"""
@@ -983,26 +1196,7 @@ class FantasyWrappedCalculator:
 
         # Calculate expected wins from points-for
         # Simple method: How many teams would you beat each week on average?
-        expected_wins = 0
-        for week in regular_season_weeks:
-            week_key = f'week_{week}'
-            if week_key not in self.weekly_data.get(team_key, {}):
-                continue
-
-            manager_score = self.weekly_data[team_key][week_key].get('actual_points', 0)
-
-            # Count how many teams this score would beat this week
-            teams_beaten = 0
-            for tk in self.teams.keys():
-                if tk == team_key:
-                    continue
-                if week_key in self.weekly_data.get(tk, {}):
-                    opponent_score = self.weekly_data[tk][week_key].get('actual_points', 0)
-                    if manager_score > opponent_score:
-                        teams_beaten += 1
-
-            # Expected win probability = teams beaten / (total teams - 1)
-            expected_wins += teams_beaten / (num_teams - 1)
+        expected_wins = self.get_all_play().expected_wins(team_key)
 
         win_luck = actual_wins - expected_wins
 
@@ -1160,25 +1354,7 @@ class FantasyWrappedCalculator:
                     tk_team = self.teams[tk]
                     tk_actual_wins = int(tk_team['wins'])
 
-                    tk_expected_wins = 0
-                    for week in regular_season_weeks:
-                        week_key = f'week_{week}'
-                        if week_key not in self.weekly_data.get(tk, {}):
-                            continue
-
-                        tk_score_week = self.weekly_data[tk][week_key].get('actual_points', 0)
-
-                        # Count how many teams this score would beat this week
-                        teams_beaten = 0
-                        for other_tk in self.teams.keys():
-                            if other_tk == tk:
-                                continue
-                            if week_key in self.weekly_data.get(other_tk, {}):
-                                other_score = self.weekly_data[other_tk][week_key].get('actual_points', 0)
-                                if tk_score_week > other_score:
-                                    teams_beaten += 1
-
-                        tk_expected_wins += teams_beaten / (num_teams - 1)
+                    tk_expected_wins = self.get_all_play().expected_wins(tk)
 
                     tk_win_luck = tk_actual_wins - tk_expected_wins
                     tk_luck_score = 50 + (tk_win_luck * 12.5)
@@ -1321,6 +1497,30 @@ class FantasyWrappedCalculator:
         return summary
 
 
+# Calculator shared with forked card workers (inherited, never pickled)
+_WORKER_CALC = None
+
+
+def _pass1_worker(team_key: str, capture: bool = True) -> Tuple[Dict, str]:
+    """Generate cards 2-4 for one team, returning (cards, printed output)"""
+    return _run_captured(capture, _WORKER_CALC._generate_team_cards, team_key)
+
+
+def _pass3_worker(team_key: str, capture: bool = True) -> Tuple[Dict, str]:
+    """Generate card 1 for one team, returning (card_1, printed output)"""
+    return _run_captured(capture, _WORKER_CALC._generate_leader_card, team_key)
+
+
+def _run_captured(capture: bool, func, *args) -> Tuple[Any, str]:
+    """Call func, capturing its progress output when running in a worker"""
+    if not capture:
+        return func(*args), ''
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = func(*args)
+    return result, output.getvalue()
+
+
 def main():
     """Main execution with CLI argument support"""
     parser = argparse.ArgumentParser(
@@ -1366,6 +1566,33 @@ Examples:
         help='Working directory for output files'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Processes for per-team card generation (default: 1, 0 = one per CPU)'
+    )
+
+    parser.add_argument(
+        '--snapshot',
+        action='store_true',
+        help='Load the league from a binary snapshot next to the league file (written on first use)'
+    )
+
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Keep season aggregates in a state file next to the league file and only process new weeks'
+    )
+
+    parser.add_argument(
+        '--delta',
+        type=str,
+        default=None,
+        metavar='DELTA_JSON',
+        help='Merge a one-week delta into the --data league file first (implies --incremental)'
+    )
+
     args = parser.parse_args()
 
     # Set work directory
@@ -1375,14 +1602,23 @@ Examples:
     print('FANTASY RECKONING - METRICS CALCULATOR')
     print('='*70)
 
+    # Merge the newest week into the league file
+    if args.delta:
+        if not args.data:
+            parser.error('--delta requires --data')
+        week = apply_delta_file(args.data, args.delta)
+        print(f"Merged week {week} from {args.delta} into {args.data}")
+
     # Initialize calculator
-    calc = FantasyWrappedCalculator(data_file=args.data)
+    calc = FantasyWrappedCalculator(data_file=args.data, use_snapshot=args.snapshot)
+    if args.incremental or args.delta:
+        calc.use_league_state()
 
     print(f"\nGenerating Fantasy Reckoning for {len(calc.teams)} teams...")
     print(f"Current Week: {calc.league['current_week']}\n")
 
     # Generate all cards
-    results = calc.generate_all_cards()
+    results = calc.generate_all_cards(workers=args.workers)
 
     # Save individual files for each manager/team
     for manager_name, cards in results.items():
@@ -1405,6 +1641,15 @@ Examples:
             json.dump(cards, f, indent=2)
         print(f"✓ Saved: {filepath}")
 
+    # League-wide all-play standings
+    standings = calc.get_all_play().standings()
+    for row in standings:
+        row['team_name'] = calc.teams[row['team_key']].get('team_name', 'Unknown')
+    filepath = os.path.join(work_dir, 'all_play_standings.json')
+    with open(filepath, 'w') as f:
+        json.dump(standings, f, indent=2)
+    print(f"✓ Saved: {filepath}")
+
     print('\n' + '='*70)
     print('FANTASY RECKONING GENERATION COMPLETE!')
     print('='*70)
@@ -0,0 +1,478 @@
+"""
+League Context
+League-wide metric vectors computed once per league, shared by every card
+
+Each card used to rebuild the whole league's numbers just to rank one team:
+card 3 re-solved every team's optimal lineups, card 2 re-summed every team's
+draft, waiver, trade and drop values, card 4 recomputed card 2 for the whole
+league, and card 1 re-ran bye week management for every team. The context
+computes each vector (team_key -> value) the first time a card asks for it
+and keeps it, so ranks, percentiles and league averages are lookups.
+"""
+
+from collections import Counter, defaultdict
+from functools import cached_property
+from typing import Dict, List, Tuple
+
+from card_2_ledger import INJURY_EXCLUSION_THRESHOLD, _count_injured_weeks
+
+
+class LeagueContext:
+    """
+    Lazily computed league-wide aggregates for one calculator
+    """
+
+    def __init__(self, calc):
+        """
+        Args:
+            calc: FantasyWrappedCalculator instance
+        """
+        self.calc = calc
+        self.team_keys = list(calc.teams.keys())
+        self.num_teams = len(self.team_keys)
+        self.regular_season_weeks = calc.get_regular_season_weeks()
+
+        # Last regular season week (trade and drop windows stop here)
+        playoff_start = int(calc.league.get('playoff_start_week', 15))
+        current_week = int(calc.league.get('current_week', 14))
+        self.last_reg_season_week = min(playoff_start - 1, current_week)
+
+        self._injured_weeks = {}
+        self._rank_maps = {}
+
+    def warm(self):
+        """Compute every league vector now (e.g. before forking card workers)"""
+        for name, attr in type(self).__dict__.items():
+            if isinstance(attr, cached_property):
+                getattr(self, name)
+
+    # ------------------------------------------------------------------
+    # Ranking helpers
+    # ------------------------------------------------------------------
+
+    def rank(self, metric: str, team_key: str, reverse: bool = True) -> int:
+        """
+        1-based rank of a team for a metric (ties keep league order)
+
+        Args:
+            metric: Name of a team_key -> value vector on this context
+            team_key: Team to rank
+            reverse: True if higher is better
+
+        Returns:
+            Rank (number of teams if the team is missing)
+        """
+        key = (metric, reverse)
+        ranks = self._rank_maps.get(key)
+        if ranks is None:
+            ordered = sorted(getattr(self, metric).items(), key=lambda x: x[1], reverse=reverse)
+            ranks = self._rank_maps[key] = {tk: i + 1 for i, (tk, _) in enumerate(ordered)}
+        return ranks.get(team_key, self.num_teams)
+
+    def tied_rank(self, metric: str, team_key: str) -> Tuple[int, bool]:
+        """
+        Competition rank (tied teams share a rank, higher is better)
+
+        Returns:
+            (rank, is_tied) tuple
+        """
+        values = getattr(self, metric)
+        if team_key not in values:
+            return self.num_teams // 2, False
+        value = values[team_key]
+        counts = Counter(values.values())
+        return 1 + sum(1 for v in values.values() if v > value), counts[value] > 1
+
+    def percentile(self, metric: str, team_key: str) -> float:
+        """Share of the other teams with a strictly lower value (0-100)"""
+        values = getattr(self, metric)
+        if len(values) <= 1:
+            return 50
+        this_value = values[team_key]
+        teams_below = sum(1 for value in values.values() if value < this_value)
+        return (teams_below / (len(values) - 1)) * 100
+
+    def average(self, metric: str) -> float:
+        """League average of a metric"""
+        values = getattr(self, metric)
+        return sum(values.values()) / len(values) if values else 0
+
+    # ------------------------------------------------------------------
+    # Lineups (card 3)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def lineup_totals(self) -> Dict[str, Dict]:
+        """Per team: actual and optimal points, actual and optimal-lineup wins"""
+        calc = self.calc
+        totals = {}
+        for tk in self.team_keys:
+            team_weeks = calc.weekly_data.get(tk, {})
+            actual_points = 0
+            optimal_points = 0
+            actual_wins = 0
+            optimal_wins = 0
+
+            for week in self.regular_season_weeks:
+                week_key = f'week_{week}'
+                if week_key not in team_weeks:
+                    continue
+
+                week_data = team_weeks[week_key]
+                actual_points += week_data.get('actual_points', 0)
+                optimal_pts = calc.get_optimal_lineup(tk, week, filter_injured=False)['optimal_points']
+                optimal_points += optimal_pts
+
+                if week_data.get('result', '') == 'W':
+                    actual_wins += 1
+                if optimal_pts > week_data.get('opponent_points', 0):
+                    optimal_wins += 1
+
+            totals[tk] = {
+                'actual_points': actual_points,
+                'optimal_points': optimal_points,
+                'actual_wins': actual_wins,
+                'optimal_wins': optimal_wins,
+            }
+        return totals
+
+    @cached_property
+    def lineup_efficiency(self) -> Dict[str, float]:
+        """Season lineup efficiency % (actual / optimal points)"""
+        return {
+            tk: (t['actual_points'] / t['optimal_points'] * 100) if t['optimal_points'] > 0 else 0
+            for tk, t in self.lineup_totals.items()
+        }
+
+    @cached_property
+    def actual_wins(self) -> Dict[str, int]:
+        return {tk: t['actual_wins'] for tk, t in self.lineup_totals.items()}
+
+    @cached_property
+    def optimal_wins(self) -> Dict[str, int]:
+        return {tk: t['optimal_wins'] for tk, t in self.lineup_totals.items()}
+
+    @cached_property
+    def position_totals(self) -> Dict[str, Dict[str, float]]:
+        """Started points by natural position (first eligible position) for QB/RB/WR/TE"""
+        calc = self.calc
+        totals = {tk: {'QB': 0, 'RB': 0, 'WR': 0, 'TE': 0} for tk in self.team_keys}
+
+        for tk in self.team_keys:
+            for week in self.regular_season_weeks:
+                week_key = f'week_{week}'
+                if week_key not in calc.weekly_data.get(tk, {}):
+                    continue
+
+                for starter in calc.weekly_data[tk][week_key].get('roster', {}).get('starters', []):
+                    eligible = starter.get('eligible_positions', [])
+                    if not eligible:
+                        continue
+
+                    natural_pos = eligible[0]
+                    if natural_pos in totals[tk]:
+                        totals[tk][natural_pos] += starter.get('actual_points', 0)
+        return totals
+
+    @cached_property
+    def position_ranks(self) -> Dict[str, Dict[str, int]]:
+        """Rank of each team's QB/RB/WR/TE unit (1 = most points)"""
+        totals = self.position_totals
+        ranks = {tk: {} for tk in self.team_keys}
+        for pos in ['QB', 'RB', 'WR', 'TE']:
+            for rank, tk in enumerate(sorted(self.team_keys, key=lambda t: totals[t][pos], reverse=True), 1):
+                ranks[tk][pos] = rank
+        return ranks
+
+    # ------------------------------------------------------------------
+    # Draft (card 2)
+    # ------------------------------------------------------------------
+
+    def injured_weeks(self, player_id: str) -> int:
+        """Weeks a player was listed O/IR/D on any roster (memoized)"""
+        count = self._injured_weeks.get(player_id)
+        if count is None:
+            count = self._injured_weeks[player_id] = _count_injured_weeks(self.calc, player_id)
+        return count
+
+    def player_season_points(self, player_id: str) -> float:
+        return sum(self.calc.player_points_by_week.get(player_id, {}).values())
+
+    @cached_property
+    def is_auction(self) -> bool:
+        """Auction (varied costs) vs snake (costs are 0 or uniform)"""
+        all_costs = [p.get('cost', 0) for p in self.calc.draft]
+        return len(set(all_costs)) > 3 and max(all_costs) > 0
+
+    @cached_property
+    def round_averages(self) -> Dict[int, float]:
+        """Average season points per draft round (keepers excluded)"""
+        round_points = {}
+        for pick in self.calc.draft:
+            rnd = pick.get('round', 0)
+            if rnd > 0 and not pick.get('is_keeper', False):
+                round_points.setdefault(rnd, []).append(self.player_season_points(str(pick.get('player_id', ''))))
+        return {rnd: sum(pts) / len(pts) for rnd, pts in round_points.items() if pts}
+
+    @cached_property
+    def draft_points(self) -> Dict[str, float]:
+        """Season points scored by each team's draft picks"""
+        totals = {}
+        for tk in self.team_keys:
+            tk_total = 0
+            for pick in self.calc.draft_by_team.get(tk, []):
+                tk_total += self.player_season_points(str(pick.get('player_id', '')))
+            totals[tk] = tk_total
+        return totals
+
+    def _draft_values(self, tk: str) -> List[Dict]:
+        scores = []
+        for pick in self.calc.draft_by_team.get(tk, []):
+            pid = str(pick.get('player_id', ''))
+            points = self.player_season_points(pid)
+            if self.is_auction:
+                value = points / max(pick.get('cost', 0), 1)
+            else:
+                value = points - self.round_averages.get(pick.get('round', 0), 0)
+            scores.append({
+                'player_id': pid,
+                'points': points,
+                'cost': pick.get('cost', 0),
+                'round': pick.get('round', 0),
+                'is_keeper': pick.get('is_keeper', False),
+                'value': value,
+            })
+        return scores
+
+    @cached_property
+    def draft_value_extremes(self) -> Dict[str, Tuple[float, float]]:
+        """Per team: (best value, biggest bust) as ranked across the league"""
+        extremes = {}
+        for tk in self.team_keys:
+            tk_scores = self._draft_values(tk)
+            if not tk_scores:
+                extremes[tk] = (float('-inf'), float('inf'))
+                continue
+
+            # Exclude keepers from value ranking (their cost/round is artificial)
+            non_keepers = [p for p in tk_scores if not p.get('is_keeper')]
+            best_value = max(p['value'] for p in (non_keepers or tk_scores))
+
+            # Auction busts: lowest points among $5+ picks; snake busts: lowest value among Rd 1-4 picks
+            if self.is_auction:
+                candidates = [p for p in tk_scores if p['cost'] >= 5 and not p.get('is_keeper')]
+                bust_key = 'points'
+            else:
+                candidates = [p for p in tk_scores if p['round'] <= 4 and not p.get('is_keeper')]
+                bust_key = 'value'
+            eligible = [p for p in candidates if self.injured_weeks(p['player_id']) < INJURY_EXCLUSION_THRESHOLD]
+            pool = eligible or candidates
+            biggest_bust = min(p[bust_key] for p in pool) if pool else float('inf')
+
+            extremes[tk] = (best_value, biggest_bust)
+        return extremes
+
+    @cached_property
+    def best_draft_values(self) -> Dict[str, float]:
+        return {tk: best for tk, (best, _) in self.draft_value_extremes.items()}
+
+    @cached_property
+    def biggest_draft_busts(self) -> Dict[str, float]:
+        return {tk: bust for tk, (_, bust) in self.draft_value_extremes.items()}
+
+    # ------------------------------------------------------------------
+    # Waivers (cards 1, 2, 4)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def waiver_adds(self) -> Dict[str, List[Tuple[Dict, float, int]]]:
+        """Per team: (add transaction, points started for the team, weeks started) for each add"""
+        calc = self.calc
+        weeks = self.regular_season_weeks
+        adds = {}
+        for tk in self.team_keys:
+            tk_adds = []
+            for transaction in calc.transactions_by_team.get(tk, []):
+                if transaction.get('type') not in ['add', 'trade']:
+                    continue
+                player_id = str(transaction.get('player_id', ''))
+                if not player_id:
+                    continue
+
+                points_started = 0
+                weeks_started = 0
+                if weeks:
+                    for _, points, _ in calc.model.weeks_with_team(player_id, tk, weeks[0], weeks[-1],
+                                                                started_only=True):
+                        points_started += points
+                        weeks_started += 1
+
+                tk_adds.append((transaction, points_started, weeks_started))
+            adds[tk] = tk_adds
+        return adds
+
+    @cached_property
+    def waiver_points_started(self) -> Dict[str, float]:
+        """Points started from added players"""
+        totals = {}
+        for tk, tk_adds in self.waiver_adds.items():
+            total = 0
+            for _, points_started, _ in tk_adds:
+                total += points_started
+            totals[tk] = total
+        return totals
+
+    @cached_property
+    def best_add_values(self) -> Dict[str, float]:
+        """Best points per start among each team's adds"""
+        return {
+            tk: max([0] + [pts / weeks for _, pts, weeks in tk_adds if weeks > 0])
+            for tk, tk_adds in self.waiver_adds.items()
+        }
+
+    @cached_property
+    def waiver_scores(self) -> Dict[str, float]:
+        """Net waiver score: points added minus points given away on costly drops (as card 2 rounds them)"""
+        return {
+            tk: round(self.waiver_points_started[tk], 1) - round(self.costly_drops_given_away[tk], 1)
+            for tk in self.team_keys
+        }
+
+    # ------------------------------------------------------------------
+    # Trades (card 2)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def trades(self) -> Dict[str, List[Dict]]:
+        """Per team: each trade's players in/out and net points after the trade (regular season)"""
+        calc = self.calc
+        trades = {}
+        for tk in self.team_keys:
+            trades_by_id = defaultdict(lambda: {'players_in': [], 'players_out': [], 'week': 1})
+            for t in calc.transactions_by_team.get(tk, []):
+                if t.get('type') != 'trade':
+                    continue
+                tid = t.get('transaction_id')
+                trades_by_id[tid]['week'] = t.get('week', 1)
+                player = {'player_name': t.get('player_name', 'Unknown'), 'player_id': t.get('player_id')}
+                if t.get('destination_team_key') == tk:
+                    trades_by_id[tid]['players_in'].append(player)
+                elif t.get('source_team_key') == tk or t.get('trade_direction') == 'out':
+                    trades_by_id[tid]['players_out'].append(player)
+
+            tk_trades = []
+            for trade_info in trades_by_id.values():
+                if not trade_info['players_in'] and not trade_info['players_out']:
+                    continue
+                weeks = range(trade_info['week'], self.last_reg_season_week + 1)
+                players_in_impact = self._points_in_weeks(trade_info['players_in'], weeks)
+                players_out_impact = self._points_in_weeks(trade_info['players_out'], weeks)
+                tk_trades.append({
+                    'players_in': trade_info['players_in'],
+                    'players_out': trade_info['players_out'],
+                    'net_impact': players_in_impact - players_out_impact,
+                })
+            trades[tk] = tk_trades
+        return trades
+
+    def _points_in_weeks(self, players: List[Dict], weeks: range) -> float:
+        total = 0
+        for p in players:
+            weekly = self.calc.player_points_by_week.get(str(p.get('player_id', '')), {})
+            for week in weeks:
+                total += weekly.get(week, 0)
+        return total
+
+    @cached_property
+    def trade_impacts(self) -> Dict[str, float]:
+        """Net points from all of a team's trades"""
+        impacts = {}
+        for tk, tk_trades in self.trades.items():
+            total = 0
+            for trade in tk_trades:
+                total += trade['net_impact']
+            impacts[tk] = total
+        return impacts
+
+    @cached_property
+    def featured_trade_impacts(self) -> Dict[str, float]:
+        """Each team's single best trade (0 without trades)"""
+        return {
+            tk: max(trade['net_impact'] for trade in tk_trades) if tk_trades else 0
+            for tk, tk_trades in self.trades.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Costly drops (cards 1, 2)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def drops(self) -> Dict[str, List[Tuple[Dict, float, int]]]:
+        """Per team: (drop transaction, points scored after the drop while off the team, weeks away)"""
+        calc = self.calc
+        model = calc.model
+        drops = {}
+        for tk in self.team_keys:
+            tk_drops = []
+            for drop in calc.transactions_by_team.get(tk, []):
+                if drop.get('type') != 'drop':
+                    continue
+                player_id = str(drop.get('player_id', ''))
+                points_after = 0
+                weeks_away = 0
+
+                for week in range(drop.get('week', 1) + 1, self.last_reg_season_week + 1):
+                    # Only count points when the player was NOT back on this team's roster
+                    player_on_roster = model.occupant(player_id, week, tk) is not None
+
+                    if not player_on_roster and player_id in calc.player_points_by_week:
+                        points_after += calc.player_points_by_week[player_id].get(week, 0)
+                        weeks_away += 1
+
+                tk_drops.append((drop, points_after, weeks_away))
+            drops[tk] = tk_drops
+        return drops
+
+    @cached_property
+    def costly_drop_points(self) -> Dict[str, float]:
+        """Points scored elsewhere by every player a team dropped"""
+        totals = {}
+        for tk, tk_drops in self.drops.items():
+            total = 0
+            for _, points_after, _ in tk_drops:
+                total += points_after
+            totals[tk] = total
+        return totals
+
+    @cached_property
+    def costly_drops_given_away(self) -> Dict[str, float]:
+        """Points given away on significant drops (20+ points after the drop)"""
+        totals = {}
+        for tk, tk_drops in self.drops.items():
+            total = 0
+            for _, points_after, _ in tk_drops:
+                if points_after > 20:
+                    total += points_after
+            totals[tk] = total
+        return totals
+
+    @cached_property
+    def worst_drops(self) -> Dict[str, float]:
+        """Each team's single most costly drop"""
+        return {
+            tk: max([0] + [points_after for _, points_after, _ in tk_drops])
+            for tk, tk_drops in self.drops.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Bye weeks (card 1)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def bye_week_scores(self) -> Dict[str, float]:
+        """Average points in weeks with 2+ starters on bye"""
+        from bye_week_calculation import calculate_bye_week_management
+        return {
+            tk: calculate_bye_week_management(self.calc, tk)['avg_replacement_points']
+            for tk in self.team_keys
+        }
@@ -0,0 +1,75 @@
+"""
+League File Output
+Shared writer for the league JSON produced by the Yahoo and Sleeper pullers
+
+The compact schema keeps only what FantasyWrappedCalculator reads. It drops
+each player's raw `stats_detail` blob and the per-week `optimal_lineup`
+(the calculator recomputes lineups itself), and it is written without
+indentation. Full mode keeps the original pretty-printed output for debugging.
+"""
+
+import json
+
+# Fields the calculator never reads, removed in compact mode
+COMPACT_PLAYER_DROP_FIELDS = ('stats_detail',)
+COMPACT_WEEK_DROP_FIELDS = ('optimal_lineup',)
+
+
+def compact_week_entry(week_data):
+    """
+    Strip unused fields from one team-week entry
+
+    Args:
+        week_data: Entry from weekly_data[team_id]['week_N']
+
+    Returns:
+        dict: New entry without stats_detail / optimal_lineup
+    """
+    if not isinstance(week_data, dict):
+        return week_data
+
+    compact = {k: v for k, v in week_data.items() if k not in COMPACT_WEEK_DROP_FIELDS}
+
+    roster = week_data.get('roster')
+    if isinstance(roster, dict):
+        compact['roster'] = {
+            key: ([{k: v for k, v in p.items() if k not in COMPACT_PLAYER_DROP_FIELDS} for p in value]
+                  if key in ('starters', 'bench') and isinstance(value, list) else value)
+            for key, value in roster.items()
+        }
+
+    return compact
+
+
+def compact_league_data(data):
+    """
+    Build the compact form of a complete league file
+
+    Args:
+        data: League data dict (league, teams, weekly_data, ...)
+
+    Returns:
+        dict: Shallow copy with every team-week compacted
+    """
+    compact = dict(data)
+    compact['weekly_data'] = {
+        team_id: {week_key: compact_week_entry(week_data) for week_key, week_data in team_weeks.items()}
+        for team_id, team_weeks in data.get('weekly_data', {}).items()
+    }
+    return compact
+
+
+def write_league_file(data, filepath, compact=False):
+    """
+    Write a league file
+
+    Args:
+        data: League data dict
+        filepath: Output path
+        compact: Write the compact schema without indentation
+    """
+    with open(filepath, 'w') as f:
+        if compact:
+            json.dump(compact_league_data(data), f, separators=(',', ':'))
+        else:
+            json.dump(data, f, indent=2)
@@ -0,0 +1,538 @@
+"""
+League Model
+Columnar view of a league's weekly data, built once when the calculator loads
+
+Cards used to answer every question by walking
+weekly_data[team]['week_N']['roster']['starters'] + [...] as nested dicts,
+rebuilding week-key strings and list concatenations in tight loops. The model
+interns teams, players, positions and statuses to integer ids and stores:
+
+- team x week score, opponent score, opponent and result matrices
+- a player x week points matrix (plus a bitmask of the weeks each player was rostered)
+  and per-player running totals, so any week window is one subtraction
+- per-week rostered bitsets and per-position player bitsets over interned player ids
+- a roster-slot table of (team, week, player, slot, status, eligibility bitmask, points)
+- a player x week occupancy index into the slot table (who rostered a player,
+  in which slot, started or not, with what status), so ownership questions
+  are lookups instead of roster scans
+
+Rows are flat typed arrays (stdlib array module), indexed by week number
+directly (index 0 is unused), so season reductions are C-level slices and sums.
+"""
+
+from array import array
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Result codes in the team x week results matrix
+NO_RESULT, WIN, LOSS, TIE = 0, 1, 2, 3
+RESULT_CODES = {'W': WIN, 'L': LOSS, 'T': TIE}
+
+
+class PlayerPosition(NamedTuple):
+    """Where a player lines up, from every roster slot they appeared in"""
+    primary: str  # most common first eligible position ('FLEX' if none was listed)
+    eligible: FrozenSet[str]  # every position they were ever eligible at
+    first_week: int  # first week on any roster
+    last_week: int  # last week on any roster
+
+
+class Occupancy(NamedTuple):
+    """One player's roster listing for a week"""
+    team_key: str
+    slot: str  # selected_position
+    started: bool
+    status: str  # injury status ('' if healthy)
+    points: float
+
+
+def week_number(week_key: str) -> int:
+    """'week_7' -> 7"""
+    return int(week_key.split('_')[1])
+
+
+def transaction_week(timestamp: int, season) -> int:
+    """
+    Week a transaction happened in, counted from the season's first Thursday of September
+
+    Args:
+        timestamp: Transaction Unix timestamp
+        season: League season year
+
+    Returns:
+        Week number (1-18)
+    """
+    sept_1 = datetime(season, 9, 1)
+    days_to_thursday = (3 - sept_1.weekday()) % 7  # Thursday = 3
+    season_start_ts = int(datetime(season, 9, 1 + days_to_thursday).timestamp())
+    if timestamp <= season_start_ts:
+        return 1
+    return max(1, min(18, ((timestamp - season_start_ts) // (7 * 24 * 3600)) + 1))
+
+
+class LeagueModel:
+    """
+    Interned, columnar representation of weekly_data
+    """
+
+    # Snapshot layout (see league_snapshot.py): flat typed arrays, per-team or
+    # per-player row matrices (flattened, every row num_weeks + 1 wide) and
+    # plain values. Lookup dicts are rebuilt from the interned tables on load.
+    SNAPSHOT_ARRAYS = ('player_eligible', 'slot_team', 'slot_week', 'slot_player', 'slot_position',
+                       'slot_status', 'slot_eligible', 'slot_primary', 'slot_points', 'slot_starter')
+    SNAPSHOT_ROWS = {'played': 'b', 'scores': 'd', 'opponent_scores': 'd', 'opponents': 'i', 'results': 'b',
+                     'points': 'd', 'cumulative': 'd', 'occupancy': 'i'}
+    SNAPSHOT_VALUES = ('team_keys', 'player_ids', 'player_names', 'positions', 'statuses', 'num_weeks',
+                       'weeks_seen', 'slot_ranges', 'rostered_bits', 'position_players', 'shared_occupancy')
+
+    def __init__(self, weekly_data: Dict, team_keys: Iterable[str] = ()):
+        """
+        Build the model in one pass over weekly_data
+
+        Args:
+            weekly_data: League file weekly_data (team_key -> week_key -> week data)
+            team_keys: Teams in display order (teams only in weekly_data are appended)
+        """
+        # Interned tables: index -> value, value -> index
+        self.team_keys: List[str] = []
+        self.team_index: Dict[str, int] = {}
+        self.player_ids: List[str] = []
+        self.player_index: Dict[str, int] = {}
+        self.player_names: Dict[str, str] = {}
+        self.positions: List[str] = []
+        self.position_index: Dict[str, int] = {}
+        self.statuses: List[str] = ['']
+        self.status_index: Dict[str, int] = {'': 0}
+        self._eligible_cache: Dict[int, List[str]] = {}
+
+        for team_key in list(team_keys) + list(weekly_data):
+            if team_key not in self.team_index:
+                self.team_index[team_key] = len(self.team_keys)
+                self.team_keys.append(team_key)
+
+        self.num_weeks = max(
+            (week_number(week_key) for weeks in weekly_data.values() for week_key in weeks),
+            default=0
+        )
+        width = self.num_weeks + 1
+        num_teams = len(self.team_keys)
+
+        # Team x week matrices
+        self.played = [array('b', [0]) * width for _ in range(num_teams)]
+        self.scores = [array('d', [0.0]) * width for _ in range(num_teams)]
+        self.opponent_scores = [array('d', [0.0]) * width for _ in range(num_teams)]
+        self.opponents = [array('i', [-1]) * width for _ in range(num_teams)]
+        self.results = [array('b', [NO_RESULT]) * width for _ in range(num_teams)]
+
+        # Player x week matrix (rows added as players are interned)
+        self.points: List[array] = []
+        self.weeks_seen: List[int] = []  # bitmask of weeks each player was rostered
+        self.player_eligible = array('Q')  # bitmask over self.positions, across all of a player's slots
+
+        # Roster-slot table, one row per roster entry in file order (starters, then bench)
+        self.slot_team = array('i')
+        self.slot_week = array('i')
+        self.slot_player = array('i')
+        self.slot_position = array('i')  # selected_position
+        self.slot_status = array('i')
+        self.slot_eligible = array('Q')  # bitmask over self.positions
+        self.slot_primary = array('i')  # first eligible position (-1 if none listed)
+        self.slot_points = array('d')
+        self.slot_starter = array('b')
+        self.slot_ranges: Dict[Tuple[int, int], Tuple[int, int, int]] = {}  # (team, week) -> (start, bench, end)
+
+        # Raw points keyed like the calculator's player_points_by_week (same values and order)
+        self.player_points_by_week = defaultdict(lambda: defaultdict(float))
+
+        for team_key, weeks in weekly_data.items():
+            t = self.team_index[team_key]
+            for week_key, week_data in weeks.items():
+                self._add_team_week(t, week_number(week_key), week_data)
+
+        self._build_season_indices()
+
+    def _build_season_indices(self):
+        """Running point totals, rostered bitsets and position bitsets (once every slot is loaded)"""
+        # cumulative[p][w] = points from week 1 through week w
+        self.cumulative: List[array] = []
+        for row in self.points:
+            running = array('d', row)
+            for w in range(1, len(running)):
+                running[w] += running[w - 1]
+            self.cumulative.append(running)
+
+        # Bit p set = player p was on some roster that week
+        self.rostered_bits = [0] * (self.num_weeks + 1)
+        # Bit p set = player p was ever eligible at the position
+        self.position_players = [0] * len(self.positions)
+        for p in range(self.num_players):
+            bit = 1 << p
+            seen = self.weeks_seen[p]
+            while seen:
+                low = seen & -seen
+                self.rostered_bits[low.bit_length() - 1] |= bit
+                seen ^= low
+            eligible = self.player_eligible[p]
+            while eligible:
+                low = eligible & -eligible
+                self.position_players[low.bit_length() - 1] |= bit
+                eligible ^= low
+
+        self.all_players = (1 << self.num_players) - 1
+
+        # occupancy[p][w] = slot row of player p's listing in week w (-1 if unrostered),
+        # on the first team in league order. A player can appear on a second roster
+        # in the same week (e.g. traded mid-week); those rows go in shared_occupancy.
+        # A repeat listing on the same roster is ignored.
+        self.occupancy = [array('i', [-1]) * (self.num_weeks + 1) for _ in range(self.num_players)]
+        self.shared_occupancy: Dict[Tuple[int, int], List[int]] = {}
+        slot_team, slot_week = self.slot_team, self.slot_week
+        for row, p in enumerate(self.slot_player):
+            w = slot_week[row]
+            first = self.occupancy[p][w]
+            if first < 0:
+                self.occupancy[p][w] = row
+                continue
+            t = slot_team[row]
+            others = self.shared_occupancy.get((p, w), [])
+            if t == slot_team[first] or any(slot_team[other] == t for other in others):
+                continue
+            if t < slot_team[first]:
+                self.occupancy[p][w], row = row, first
+            self.shared_occupancy[(p, w)] = others + [row]
+
+    def snapshot_fields(self) -> Dict:
+        """
+        Everything needed to rebuild the model without weekly_data
+
+        Returns:
+            Dict of field name -> array (typed arrays and flattened row
+            matrices) or plain value (tables, bitsets, player_points_by_week)
+        """
+        fields = {name: getattr(self, name) for name in self.SNAPSHOT_ARRAYS + self.SNAPSHOT_VALUES}
+        for name, typecode in self.SNAPSHOT_ROWS.items():
+            flat = array(typecode)
+            for row in getattr(self, name):
+                flat.extend(row)
+            fields[name] = flat
+        fields['player_points_by_week'] = {
+            player_id: dict(weeks) for player_id, weeks in self.player_points_by_week.items()
+        }
+        return fields
+
+    @classmethod
+    def from_snapshot_fields(cls, fields: Dict) -> 'LeagueModel':
+        """
+        Rebuild a model from snapshot_fields() output
+
+        Args:
+            fields: Dict from snapshot_fields (e.g. read back from a snapshot file)
+
+        Returns:
+            LeagueModel equal to the one the fields came from
+        """
+        model = cls.__new__(cls)
+        for name in cls.SNAPSHOT_ARRAYS + cls.SNAPSHOT_VALUES:
+            setattr(model, name, fields[name])
+
+        width = model.num_weeks + 1
+        for name in cls.SNAPSHOT_ROWS:
+            flat = fields[name]
+            setattr(model, name, [flat[i:i + width] for i in range(0, len(flat), width)])
+
+        model.team_index = {team_key: t for t, team_key in enumerate(model.team_keys)}
+        model.player_index = {player_id: p for p, player_id in enumerate(model.player_ids)}
+        model.position_index = {pos: i for i, pos in enumerate(model.positions)}
+        model.status_index = {status: i for i, status in enumerate(model.statuses)}
+        model._eligible_cache = {}
+        model.player_points_by_week = defaultdict(lambda: defaultdict(float), {
+            player_id: defaultdict(float, weeks) for player_id, weeks in fields['player_points_by_week'].items()
+        })
+        model.all_players = (1 << model.num_players) - 1
+        return model
+
+    def _intern(self, value, table: List, index: Dict) -> int:
+        i = index.get(value)
+        if i is None:
+            i = index[value] = len(table)
+            table.append(value)
+        return i
+
+    def _intern_player(self, player_id: str, player_name: str) -> int:
+        p = self.player_index.get(player_id)
+        if p is None:
+            p = self.player_index[player_id] = len(self.player_ids)
+            self.player_ids.append(player_id)
+            self.player_names[player_id] = player_name
+            self.points.append(array('d', [0.0]) * (self.num_weeks + 1))
+            self.weeks_seen.append(0)
+            self.player_eligible.append(0)
+        return p
+
+    def _add_team_week(self, t: int, w: int, week_data: Dict):
+        self.played[t][w] = 1
+        self.scores[t][w] = float(week_data.get('actual_points', 0) or 0)
+        self.opponent_scores[t][w] = float(week_data.get('opponent_points', 0) or 0)
+        self.opponents[t][w] = self.team_index.get(week_data.get('opponent_id'), -1)
+        self.results[t][w] = RESULT_CODES.get(week_data.get('result'), NO_RESULT)
+
+        roster = week_data.get('roster', {})
+        start = len(self.slot_player)
+        starters = roster.get('starters', [])
+        for player in starters:
+            self._add_slot(t, w, player, starter=True)
+        bench_start = len(self.slot_player)
+        for player in roster.get('bench', []):
+            self._add_slot(t, w, player, starter=False)
+        self.slot_ranges[(t, w)] = (start, bench_start, len(self.slot_player))
+
+    def _add_slot(self, t: int, w: int, player: Dict, starter: bool):
+        player_id = str(player['player_id'])
+        raw_points = player.get('actual_points', 0)
+        p = self._intern_player(player_id, player.get('player_name', f'Player {player_id}'))
+
+        eligible = 0
+        primary = -1
+        for pos in player.get('eligible_positions') or []:
+            i = self._intern(pos, self.positions, self.position_index)
+            eligible |= 1 << i
+            if primary < 0:
+                primary = i
+
+        self.slot_team.append(t)
+        self.slot_week.append(w)
+        self.slot_player.append(p)
+        self.slot_position.append(self._intern(player.get('selected_position') or '', self.positions,
+                                               self.position_index))
+        self.slot_status.append(self._intern(player.get('status') or '', self.statuses, self.status_index))
+        self.slot_eligible.append(eligible)
+        self.slot_primary.append(primary)
+        self.slot_points.append(float(raw_points or 0))
+        self.slot_starter.append(1 if starter else 0)
+
+        self.points[p][w] = float(raw_points or 0)
+        self.weeks_seen[p] |= 1 << w
+        self.player_eligible[p] |= eligible
+        self.player_points_by_week[player_id][w] = raw_points
+
+    # ------------------------------------------------------------------
+    # Accessors
+    # ------------------------------------------------------------------
+
+    @property
+    def num_players(self) -> int:
+        return len(self.player_ids)
+
+    def team_played(self, team_key: str, week: int) -> bool:
+        """True if the team has an entry for the week"""
+        t = self.team_index.get(team_key)
+        return t is not None and 0 < week <= self.num_weeks and bool(self.played[t][week])
+
+    def eligible_positions(self, mask: int) -> List[str]:
+        """Decode an eligibility bitmask to position names (in interned order)"""
+        positions = self._eligible_cache.get(mask)
+        if positions is None:
+            positions = [pos for i, pos in enumerate(self.positions) if mask >> i & 1]
+            self._eligible_cache[mask] = positions
+        return positions
+
+    def position_mask(self, positions: Iterable[str]) -> int:
+        """Bitmask for a set of position names (unknown names are ignored)"""
+        mask = 0
+        for pos in positions:
+            i = self.position_index.get(pos)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def player_position_index(self) -> Dict[str, PlayerPosition]:
+        """
+        Build every player's position profile in one pass over the slot table
+
+        The primary position is the most common first eligible position across
+        all of a player's roster appearances (ties go to the one seen first).
+
+        Returns:
+            dict: player_id -> PlayerPosition
+        """
+        counts = [None] * self.num_players  # player -> {position index: appearances}
+        eligible = [0] * self.num_players
+        for row in range(len(self.slot_player)):
+            p = self.slot_player[row]
+            eligible[p] |= self.slot_eligible[row]
+            primary = self.slot_primary[row]
+            if primary >= 0:
+                player_counts = counts[p]
+                if player_counts is None:
+                    player_counts = counts[p] = {}
+                player_counts[primary] = player_counts.get(primary, 0) + 1
+
+        index = {}
+        for p, player_id in enumerate(self.player_ids):
+            seen = self.weeks_seen[p]
+            player_counts = counts[p]
+            index[player_id] = PlayerPosition(
+                primary=self.positions[max(player_counts, key=player_counts.get)] if player_counts else 'FLEX',
+                eligible=frozenset(self.eligible_positions(eligible[p])),
+                first_week=(seen & -seen).bit_length() - 1,
+                last_week=seen.bit_length() - 1,
+            )
+        return index
+
+    def roster_rows(self, team_key: str, week: int, starters: bool = True, bench: bool = True) -> range:
+        """Slot-table rows for one team-week (empty if the team didn't play it)"""
+        rows = self.slot_ranges.get((self.team_index.get(team_key), week))
+        if rows is None:
+            return range(0)
+        start, bench_start, end = rows
+        return range(start if starters else bench_start, end if bench else bench_start)
+
+    def points_between(self, p: int, first_week: int, last_week: int) -> float:
+        """Interned player p's points from first_week through last_week (inclusive), in O(1)"""
+        first_week = max(first_week, 1)
+        last_week = min(last_week, self.num_weeks)
+        if p is None or last_week < first_week:
+            return 0.0
+        running = self.cumulative[p]
+        return running[last_week] - running[first_week - 1]
+
+    def player_points_between(self, player_id: str, first_week: int, last_week: int) -> float:
+        """A player's points from first_week through last_week (inclusive)"""
+        return self.points_between(self.player_index.get(player_id), first_week, last_week)
+
+    def occupancy_row(self, p: int, week: int, t: int = None) -> int:
+        """
+        Slot row of interned player p's listing in a week, in O(1)
+
+        Args:
+            p: Interned player id
+            week: Week number
+            t: Only a listing on this interned team's roster (default: first team in league order)
+
+        Returns:
+            Slot-table row, or -1 if not listed
+        """
+        if p is None or not 0 < week <= self.num_weeks:
+            return -1
+        row = self.occupancy[p][week]
+        if t is None or row < 0 or self.slot_team[row] == t:
+            return row
+        for other in self.shared_occupancy.get((p, week), ()):
+            if self.slot_team[other] == t:
+                return other
+        return -1
+
+    def occupant(self, player_id: str, week: int, team_key: str = None) -> Optional[Occupancy]:
+        """
+        Who had a player in a week, in which slot and with what status
+
+        Args:
+            player_id: Player ID
+            week: Week number
+            team_key: Only a listing on this team's roster (default: first team in league order)
+
+        Returns:
+            Occupancy, or None if the player wasn't listed
+        """
+        t = None
+        if team_key is not None:
+            t = self.team_index.get(team_key)
+            if t is None:
+                return None
+        row = self.occupancy_row(self.player_index.get(player_id), week, t)
+        if row < 0:
+            return None
+        return Occupancy(
+            team_key=self.team_keys[self.slot_team[row]],
+            slot=self.positions[self.slot_position[row]],
+            started=bool(self.slot_starter[row]),
+            status=self.statuses[self.slot_status[row]],
+            points=self.slot_points[row],
+        )
+
+    def weeks_with_team(self, player_id: str, team_key: str, first_week: int, last_week: int,
+                        started_only: bool = False) -> List[Tuple[int, float, bool]]:
+        """
+        Weeks a player was on (or started for) a team between two weeks
+
+        Args:
+            player_id: Player ID
+            team_key: Team key
+            first_week: First week (inclusive)
+            last_week: Last week (inclusive)
+            started_only: Only weeks the player was in the starting lineup
+
+        Returns:
+            List of (week, points scored in that listing, started), in week order
+        """
+        p = self.player_index.get(player_id)
+        t = self.team_index.get(team_key)
+        if p is None or t is None:
+            return []
+        weeks = []
+        seen = self.weeks_seen[p]
+        for week in range(max(first_week, 1), min(last_week, self.num_weeks) + 1):
+            if not seen >> week & 1:
+                continue
+            row = self.occupancy_row(p, week, t)
+            if row >= 0 and (self.slot_starter[row] or not started_only):
+                weeks.append((week, self.slot_points[row], bool(self.slot_starter[row])))
+        return weeks
+
+    def rostered_mask(self, week: int) -> int:
+        """Bitset of interned players on any roster in a week"""
+        return self.rostered_bits[week] if 0 < week <= self.num_weeks else 0
+
+    def available_mask(self, week: int, position: str = None) -> int:
+        """
+        Bitset of interned players not on any roster in a week
+
+        Args:
+            week: Week number
+            position: Only players ever eligible at this position (optional)
+        """
+        candidates = self.all_players
+        if position is not None:
+            i = self.position_index.get(position)
+            candidates = self.position_players[i] if i is not None else 0
+        return candidates & ~self.rostered_mask(week)
+
+    @staticmethod
+    def iter_bits(mask: int) -> Iterator[int]:
+        """Set bit positions of a bitset, lowest first"""
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def rostered_player_indices(self, week: int) -> set:
+        """Interned ids of every player on any roster in a week"""
+        return set(self.iter_bits(self.rostered_mask(week)))
+
+    def team_season_totals(self, team_key: str, weeks: Iterable[int]) -> Dict:
+        """
+        Record and points for a team over a set of weeks, from the score matrices
+
+        The result is decided by the scores (not the stored W/L), matching the
+        league's weekly results even if a result field is stale.
+        """
+        t = self.team_index.get(team_key)
+        totals = {'wins': 0, 'losses': 0, 'ties': 0, 'points_for': 0.0, 'points_against': 0.0}
+        if t is None:
+            return totals
+
+        played, scores, opp_scores = self.played[t], self.scores[t], self.opponent_scores[t]
+        for week in weeks:
+            if not (0 < week <= self.num_weeks and played[week]):
+                continue
+            team_score, opp_score = scores[week], opp_scores[week]
+            totals['points_for'] += team_score
+            totals['points_against'] += opp_score
+            if team_score > opp_score:
+                totals['wins'] += 1
+            elif team_score < opp_score:
+                totals['losses'] += 1
+            else:
+                totals['ties'] += 1
+        return totals
@@ -0,0 +1,140 @@
+"""
+League Snapshot
+Binary copy of a parsed league file and its LeagueModel, for fast calculator startup
+
+Every calculator run parsed the league JSON and then rebuilt the columnar
+model from it. With use_snapshot (CLI --snapshot), the first run writes
+league_X.snapshot next to the league file:
+
+    header   MAGIC, SHA-256 of the league JSON bytes, runtime tag
+    sections name, kind and payload for each part:
+             'a' typed array (typecode + raw bytes, native byte order)
+             'm' marshal-encoded value (league data, interned tables, bitsets)
+
+Roster entries are stored as field columns (roster_entry.pack_rosters) in
+their own section, and rebuilt straight into RosterEntry objects on load, so
+a snapshot load never materialises a dict per roster slot.
+
+Later runs memory-map the snapshot and copy the model arrays straight out
+of it, and build roster entries from their columns, instead of parsing JSON
+and walking every roster again. Only the small remainder of the league data
+(league settings, teams, transactions, draft, weekly scores) is a marshalled
+value. Writing costs a hash, an encode and a file, so it is opt-in: it helps
+when a league file is reloaded (repeated CLI refreshes), not for the web
+app's one-off job files.
+
+The snapshot is used only if the hash matches the league file's current
+bytes, so an edited or re-pulled file (or a merged delta) never loads stale
+data; the runtime tag (Python version, marshal version, byte order) guards
+the binary encodings. Anything unreadable is ignored and rewritten. NumPy isn't a dependency of
+this project, so the format sticks to the stdlib struct, array and marshal
+modules.
+"""
+
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Optional, Tuple
+
+from league_model import LeagueModel
+from roster_entry import pack_rosters, unpack_rosters
+
+MAGIC = b'FRSNAP02'
+RUNTIME_TAG = f'{sys.implementation.cache_tag}-{sys.byteorder}-m{marshal.version}'.encode()
+
+_HEADER = struct.Struct('<8s32sH')  # magic, source digest, runtime tag length
+_SECTION = struct.Struct('<HccQ')  # name length, kind, typecode, payload length
+
+
+def snapshot_path(league_file: str) -> str:
+    """Snapshot path for a league file (league_X.json -> league_X.snapshot)"""
+    root, _ = os.path.splitext(league_file)
+    return root + '.snapshot'
+
+
+def source_digest(raw: bytes) -> bytes:
+    """SHA-256 of the league file's bytes (the snapshot's staleness check)"""
+    return hashlib.sha256(raw).digest()
+
+
+def write_snapshot(path: str, digest: bytes, data: Dict, model: LeagueModel):
+    """
+    Write a snapshot (atomically, so concurrent runs never read a partial file)
+
+    Args:
+        path: Snapshot path
+        digest: source_digest() of the league file the data was parsed from
+        data: Parsed league data
+        model: LeagueModel built from data
+    """
+    packed_data, rosters = pack_rosters(data)
+    sections = {'data': packed_data, 'rosters': rosters}
+    sections.update(model.snapshot_fields())
+
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, digest, len(RUNTIME_TAG)))
+        f.write(RUNTIME_TAG)
+        for name, value in sections.items():
+            if isinstance(value, array):
+                kind, typecode, payload = b'a', value.typecode.encode(), value.tobytes()
+            else:
+                kind, typecode, payload = b'm', b' ', marshal.dumps(value)
+            encoded_name = name.encode()
+            f.write(_SECTION.pack(len(encoded_name), kind, typecode, len(payload)))
+            f.write(encoded_name)
+            f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: str, digest: bytes) -> Optional[Tuple[Dict, LeagueModel]]:
+    """
+    Load a snapshot if it exists and was written from the same league file bytes
+
+    Args:
+        path: Snapshot path
+        digest: source_digest() of the league file as it is now
+
+    Returns:
+        (league data, LeagueModel), or None if missing, stale or unreadable
+    """
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, snapshot_digest, tag_length = _HEADER.unpack_from(mm, 0)
+            offset = _HEADER.size
+            if magic != MAGIC or snapshot_digest != digest or mm[offset:offset + tag_length] != RUNTIME_TAG:
+                return None
+            offset += tag_length
+
+            sections = {}
+            with memoryview(mm) as view:
+                while offset < len(mm):
+                    name_length, kind, typecode, length = _SECTION.unpack_from(mm, offset)
+                    offset += _SECTION.size
+                    name = bytes(view[offset:offset + name_length]).decode()
+                    offset += name_length
+                    with view[offset:offset + length] as payload:
+                        if kind == b'a':
+                            value = array(typecode.decode())
+                            value.frombytes(payload)
+                        else:
+                            value = marshal.loads(payload)
+                    sections[name] = value
+                    offset += length
+    except (OSError, ValueError, EOFError, TypeError, struct.error) as e:
+        print(f"⚠️  Could not read league snapshot ({e}), reparsing")
+        return None
+
+    try:
+        data = unpack_rosters(sections.pop('data'), sections.pop('rosters'))
+        return data, LeagueModel.from_snapshot_fields(sections)
+    except KeyError as e:
+        print(f"⚠️  League snapshot is missing {e}, reparsing")
+        return None
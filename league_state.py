@@ -0,0 +1,445 @@
+"""
+League State
+Season aggregates persisted next to the league JSON, so a weekly refresh only processes the new week
+
+Every refresh used to rebuild each season aggregate from week 1: all of a
+team's optimal lineups, every waiver add's started points and every drop's
+points scored elsewhere. The state sidecar (league_X.state.json) keeps those
+running totals:
+
+- per team: PF/PA and record, actual and optimal lineup points (efficiency
+  sums), optimal-lineup wins and all-play W/L/T
+- per player: cumulative points and weeks listed O/IR/D
+- per team-week: the optimal lineup (points plus roster positions of the starters)
+- per transaction: started points for each add and points scored elsewhere
+  for each drop
+
+Folding in a week touches only that week's rosters. Transactions first seen
+in the new week are backfilled over the earlier weeks once. Totals are added
+week by week in the same order the cards sum them, so seeded results are
+identical to a from-scratch run. A state whose league, season or folded
+weeks no longer match the league file (e.g. after a stat correction to any
+rostered player, bench included) is rebuilt from scratch. Each folded week's
+fingerprint is stored, so a refresh hashes every earlier week once to check
+it and hashes only the new weeks when folding them in.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+from all_play import all_play_counts
+from league_file import write_league_file
+from league_model import transaction_week
+
+STATE_VERSION = 3
+
+# Statuses card 2 counts as injured weeks
+INJURED_STATUSES = ('O', 'IR', 'D')
+
+
+def state_path(league_file: str) -> str:
+    """Sidecar path for a league file (league_X.json -> league_X.state.json)"""
+    root, _ = os.path.splitext(league_file)
+    return root + '.state.json'
+
+
+def extract_week_delta(data: Dict, week: int) -> Dict:
+    """
+    Cut one week out of a league file as a delta
+
+    Args:
+        data: League data dict
+        week: Week to extract
+
+    Returns:
+        Delta dict with week, league, teams, weekly_data (that week only)
+        and the transactions made during it
+    """
+    week_key = f'week_{week}'
+    season = data['league'].get('season', 2024)
+    return {
+        'week': week,
+        'league': data['league'],
+        'teams': data.get('teams', []),
+        'weekly_data': {
+            team_key: weeks[week_key]
+            for team_key, weeks in data.get('weekly_data', {}).items()
+            if week_key in weeks
+        },
+        'transactions': [
+            t for t in data.get('transactions', [])
+            if transaction_week(t.get('timestamp', 0), season) == week
+        ],
+    }
+
+
+def apply_week_delta(data: Dict, delta: Dict) -> int:
+    """
+    Merge a one-week delta into league data (in place)
+
+    The delta's league and teams replace the stored ones (current week,
+    standings), its team-weeks are added under week_N and transactions not
+    already in the file are appended.
+
+    Args:
+        data: League data dict
+        delta: Delta dict (see extract_week_delta)
+
+    Returns:
+        The delta's week number
+    """
+    week = int(delta['week'])
+    week_key = f'week_{week}'
+
+    if delta.get('league'):
+        data['league'] = dict(data['league'], **delta['league'])
+    if delta.get('teams'):
+        data['teams'] = delta['teams']
+
+    weekly_data = data.setdefault('weekly_data', {})
+    for team_key, week_data in delta.get('weekly_data', {}).items():
+        weekly_data.setdefault(team_key, {})[week_key] = week_data
+
+    transactions = data.setdefault('transactions', [])
+    known = {t.get('transaction_id') for t in transactions}
+    for transaction in delta.get('transactions', []):
+        if transaction.get('transaction_id') not in known:
+            transactions.append(transaction)
+            known.add(transaction.get('transaction_id'))
+
+    return week
+
+
+def apply_delta_file(league_file: str, delta_file: str) -> int:
+    """
+    Merge a delta file into a league file on disk, keeping its compact/pretty format
+
+    Returns:
+        The delta's week number
+    """
+    with open(league_file, 'r') as f:
+        text = f.read()
+    with open(delta_file, 'r') as f:
+        delta = json.load(f)
+
+    data = json.loads(text)
+    week = apply_week_delta(data, delta)
+    write_league_file(data, league_file, compact=not text.startswith('{\n'))
+    return week
+
+
+def _week_fingerprint(calc, week: int) -> str:
+    """
+    Hash of everything folded for one week
+
+    Covers every team's score, opponent score and result, and every roster
+    entry's player, slot, status, eligibility and points, so a correction to
+    any player (including a bench player, which leaves the team score alone)
+    changes it.
+    """
+    model = calc.model
+    digest = hashlib.sha1()
+    week_key = f'week_{week}'
+    for team_key in sorted(calc.weekly_data):
+        week_data = calc.weekly_data[team_key].get(week_key)
+        if week_data is None:
+            continue
+        digest.update(repr((team_key, week, week_data.get('actual_points'),
+                            week_data.get('opponent_points'), week_data.get('result'))).encode())
+        for row in model.roster_rows(team_key, week):
+            digest.update(repr((
+                model.player_ids[model.slot_player[row]],
+                model.positions[model.slot_position[row]],
+                model.statuses[model.slot_status[row]],
+                sorted(model.eligible_positions(model.slot_eligible[row])),
+                model.slot_points[row],
+                model.slot_starter[row],
+            )).encode())
+    return digest.hexdigest()
+
+
+class LeagueState:
+    """
+    Running season aggregates for one league, folded in a week at a time
+    """
+
+    def __init__(self, league_id: str, season):
+        self.league_id = str(league_id)
+        self.season = season
+        self.through_week = 0
+        # week (str) -> fingerprint of the league data folded for that week
+        self.week_fingerprints: Dict[str, str] = {}
+
+        # team_key -> running totals (see _new_team_totals)
+        self.teams: Dict[str, Dict] = {}
+        # player_id -> cumulative points (one value per week, as player_points_by_week keeps them)
+        self.player_points: Dict[str, float] = {}
+        # player_id -> weeks listed O/IR/D (first roster listing each week, as card 2 counts them)
+        self.injured_weeks: Dict[str, int] = {}
+        # team_key -> week (str) -> [optimal_points, actual_points, roster positions of the lineup]
+        self.lineups: Dict[str, Dict[str, List]] = {}
+        # 'team_key|player_id' -> [points started for the team, weeks started]
+        self.adds: Dict[str, List] = {}
+        # 'team_key|player_id|drop_week' -> [points after the drop while off the team, weeks off the team]
+        self.drops: Dict[str, List] = {}
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, path: str, league_id: str, season) -> Optional['LeagueState']:
+        """
+        Load a state sidecar if it exists and belongs to this league and season
+
+        Returns:
+            LeagueState, or None if it can't be used
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not read league state ({e}), rebuilding")
+            return None
+
+        if (saved.get('version') != STATE_VERSION or str(saved.get('league_id')) != str(league_id)
+                or saved.get('season') != season):
+            return None
+
+        state = cls(league_id, season)
+        for field in ('through_week', 'week_fingerprints', 'teams', 'player_points', 'injured_weeks', 'lineups',
+                      'adds', 'drops'):
+            setattr(state, field, saved[field])
+        return state
+
+    def save(self, path: str):
+        """Write the state sidecar"""
+        with open(path, 'w') as f:
+            json.dump({
+                'version': STATE_VERSION,
+                'league_id': self.league_id,
+                'season': self.season,
+                'through_week': self.through_week,
+                'week_fingerprints': self.week_fingerprints,
+                'teams': self.teams,
+                'player_points': self.player_points,
+                'injured_weeks': self.injured_weeks,
+                'lineups': self.lineups,
+                'adds': self.adds,
+                'drops': self.drops,
+            }, f, separators=(',', ':'))
+
+    # ------------------------------------------------------------------
+    # Folding in weeks
+    # ------------------------------------------------------------------
+
+    def is_current(self, calc) -> bool:
+        """True if the folded weeks still match the calculator's league data (stops at the first changed week)"""
+        last_week = max(calc.get_regular_season_weeks(), default=0)
+        return self.through_week <= last_week and all(
+            self.week_fingerprints.get(str(week)) == _week_fingerprint(calc, week)
+            for week in range(1, self.through_week + 1)
+        )
+
+    def update(self, calc) -> range:
+        """
+        Fold every regular season week after through_week into the aggregates
+
+        Only the new weeks are fingerprinted; earlier weeks keep the
+        fingerprints is_current() checked them against.
+
+        Args:
+            calc: FantasyWrappedCalculator for the league (including the new weeks)
+
+        Returns:
+            Weeks that were added
+        """
+        new_weeks = range(self.through_week + 1, max(calc.get_regular_season_weeks(), default=0) + 1)
+        folded = range(1, self.through_week + 1)
+
+        # Accumulators for transactions not seen before, caught up on the weeks already folded
+        new_adds = []
+        new_drops = []
+        for team_key, transactions in calc.transactions_by_team.items():
+            for transaction in transactions:
+                player_id = str(transaction.get('player_id', ''))
+                if transaction.get('type') in ['add', 'trade'] and player_id:
+                    key = f'{team_key}|{player_id}'
+                    if key not in self.adds:
+                        self.adds[key] = [0, 0]
+                        new_adds.append(key)
+                elif transaction.get('type') == 'drop':
+                    key = f"{team_key}|{player_id}|{transaction.get('week', 1)}"
+                    if key not in self.drops:
+                        self.drops[key] = [0, 0]
+                        new_drops.append(key)
+        for week in folded:
+            self._fold_adds(calc, week, new_adds)
+            self._fold_drops(calc, week, new_drops)
+
+        for week in new_weeks:
+            self._fold_results(calc, week)
+            self._fold_adds(calc, week, self.adds)
+            self._fold_drops(calc, week, self.drops)
+            self.week_fingerprints[str(week)] = _week_fingerprint(calc, week)
+
+        self.through_week = max(self.through_week, new_weeks.stop - 1)
+        return new_weeks
+
+    @staticmethod
+    def _new_team_totals() -> Dict:
+        return {
+            'points_for': 0.0, 'points_against': 0.0, 'wins': 0, 'losses': 0, 'ties': 0,
+            'actual_lineup_points': 0, 'optimal_lineup_points': 0, 'actual_wins': 0, 'optimal_wins': 0,
+            'all_play_wins': 0, 'all_play_losses': 0, 'all_play_ties': 0,
+        }
+
+    def _fold_results(self, calc, week: int):
+        """Team records, lineups, all-play and player points for one week"""
+        week_key = f'week_{week}'
+        played = []
+
+        for team_key in calc.teams:
+            week_data = calc.weekly_data.get(team_key, {}).get(week_key)
+            if week_data is None:
+                continue
+            totals = self.teams.setdefault(team_key, self._new_team_totals())
+
+            record = calc.model.team_season_totals(team_key, [week])
+            for field in ('points_for', 'points_against', 'wins', 'losses', 'ties'):
+                totals[field] += record[field]
+            played.append((record['points_for'], totals))
+
+            lineup = calc.get_optimal_lineup(team_key, week, filter_injured=False)
+            roster = week_data.get('roster', {})
+            positions = {id(p): i for i, p in enumerate(roster.get('starters', []) + roster.get('bench', []))}
+            self.lineups.setdefault(team_key, {})[str(week)] = [
+                lineup['optimal_points'], lineup['actual_points'], [positions[id(p)] for p in lineup['optimal_lineup']]
+            ]
+
+            totals['actual_lineup_points'] += week_data.get('actual_points', 0)
+            totals['optimal_lineup_points'] += lineup['optimal_points']
+            if week_data.get('result', '') == 'W':
+                totals['actual_wins'] += 1
+            if lineup['optimal_points'] > week_data.get('opponent_points', 0):
+                totals['optimal_wins'] += 1
+
+        # All-play: every score against every other team's score that week
+        scores = sorted(score for score, _ in played)
+        for score, totals in played:
+            wins, losses, ties = all_play_counts(scores, score)
+            totals['all_play_wins'] += wins
+            totals['all_play_losses'] += losses
+            totals['all_play_ties'] += ties
+
+        # Each rostered player's points once per week (as player_points_by_week keeps them),
+        # and injury status from their first roster listing this week
+        model = calc.model
+        for p in model.iter_bits(model.rostered_mask(week)):
+            player_id = model.player_ids[p]
+            self.player_points[player_id] = (self.player_points.get(player_id, 0)
+                                             + calc.player_points_by_week[player_id][week])
+            listing = model.occupant(player_id, week)
+            if listing.team_key in calc.teams and listing.status in INJURED_STATUSES:
+                self.injured_weeks[player_id] = self.injured_weeks.get(player_id, 0) + 1
+
+    def _fold_adds(self, calc, week: int, keys):
+        """Add one week's starts to add accumulators"""
+        for key in keys:
+            team_key, player_id = key.split('|')
+            listing = calc.model.occupant(player_id, week, team_key)
+            if listing is not None and listing.started:
+                acc = self.adds[key]
+                acc[0] += listing.points
+                acc[1] += 1
+
+    def _fold_drops(self, calc, week: int, keys):
+        """Add one week to drop accumulators (weeks after the drop, player off the team)"""
+        for key in keys:
+            team_key, player_id, drop_week = key.split('|')
+            if week <= int(drop_week):
+                continue
+            if calc.model.occupant(player_id, week, team_key) is None:
+                acc = self.drops[key]
+                acc[0] += calc.player_points_by_week.get(player_id, {}).get(week, 0)
+                acc[1] += 1
+
+    # ------------------------------------------------------------------
+    # Seeding the calculator
+    # ------------------------------------------------------------------
+
+    def seed(self, calc):
+        """
+        Load the aggregates into a calculator's caches
+
+        Fills the optimal lineup cache for every folded team-week and the
+        LeagueContext's lineup totals, waiver adds, drops and injured weeks,
+        so the cards don't recompute them.
+        """
+        for team_key, weeks in self.lineups.items():
+            team_weeks = calc.weekly_data.get(team_key, {})
+            for week, (optimal_points, actual_points, positions) in weeks.items():
+                week_data = team_weeks.get(f'week_{week}')
+                if week_data is None:
+                    continue
+                roster = week_data.get('roster', {})
+                players = roster.get('starters', []) + roster.get('bench', [])
+                calc._lineup_cache[(team_key, int(week), False)] = {
+                    'optimal_points': optimal_points,
+                    'actual_points': actual_points,
+                    'points_left_on_bench': optimal_points - actual_points,
+                    'efficiency_pct': (actual_points / optimal_points * 100) if optimal_points > 0 else 0,
+                    'optimal_lineup': [players[i] for i in positions],
+                }
+
+        context = calc.get_league_context()
+        empty = self._new_team_totals()
+        lineup_totals = {}
+        waiver_adds = {}
+        drops = {}
+        for team_key in context.team_keys:
+            totals = self.teams.get(team_key, empty)
+            lineup_totals[team_key] = {
+                'actual_points': totals['actual_lineup_points'],
+                'optimal_points': totals['optimal_lineup_points'],
+                'actual_wins': totals['actual_wins'],
+                'optimal_wins': totals['optimal_wins'],
+            }
+
+            team_adds = []
+            team_drops = []
+            for transaction in calc.transactions_by_team.get(team_key, []):
+                player_id = str(transaction.get('player_id', ''))
+                if transaction.get('type') in ['add', 'trade'] and player_id:
+                    points_started, weeks_started = self.adds[f'{team_key}|{player_id}']
+                    team_adds.append((transaction, points_started, weeks_started))
+                elif transaction.get('type') == 'drop':
+                    points_after, weeks_away = self.drops[f"{team_key}|{player_id}|{transaction.get('week', 1)}"]
+                    if player_id not in calc.player_points_by_week:
+                        points_after, weeks_away = 0, 0
+                    team_drops.append((transaction, points_after, weeks_away))
+            waiver_adds[team_key] = team_adds
+            drops[team_key] = team_drops
+
+        # Pre-fill the context's cached properties and injury counts
+        context.__dict__.update(lineup_totals=lineup_totals, waiver_adds=waiver_adds, drops=drops)
+        for player_id in calc.player_points_by_week:
+            context._injured_weeks[player_id] = self.injured_weeks.get(player_id, 0)
+
+    def standings(self) -> Dict[str, Dict]:
+        """Per team: record, PF/PA, all-play record and lineup efficiency from the running totals"""
+        return {
+            team_key: {
+                'wins': t['wins'], 'losses': t['losses'], 'ties': t['ties'],
+                'points_for': round(t['points_for'], 2), 'points_against': round(t['points_against'], 2),
+                'all_play_wins': t['all_play_wins'], 'all_play_losses': t['all_play_losses'],
+                'all_play_ties': t['all_play_ties'],
+                'lineup_efficiency_pct': round(t['actual_lineup_points'] / t['optimal_lineup_points'] * 100, 1)
+                if t['optimal_lineup_points'] > 0 else 0,
+            }
+            for team_key, t in self.teams.items()
+        }
@@ -0,0 +1,171 @@
+"""
+Lineup Engine
+Exact optimal lineups for a roster, one week or a whole season at a time
+
+The old solver filled slots in the order the starters were listed, giving
+each slot the best remaining eligible player. When a FLEX slot came before
+an RB slot it could take the best RB and leave the RB slot a worse player,
+understating the optimal score, and multi-eligible players (superflex, IDP,
+RB/WR) could be stranded the same way.
+
+Because a player's points don't depend on the slot they fill, the best
+lineup is found by taking players from highest to lowest score and keeping
+each one if the kept set can still be matched to the slots (the greedy
+algorithm over a transversal matroid, which is exact). A kept player goes
+straight into the most restrictive free slot they are eligible for; only
+when all their slots are taken does an augmenting-path search try to move
+earlier players into other slots to make room.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# Players in these slots can't be started
+INACTIVE_SLOTS = ('IR',)
+
+# Statuses excluded when filter_injured is set
+INJURED_STATUSES = ('Q', 'D', 'O', 'IR')
+
+
+def assign_slots(slots: Sequence[str], players: Sequence[Dict],
+                 slot_options: Optional[Dict] = None) -> List[Optional[int]]:
+    """
+    Assign players to lineup slots to maximize total points
+
+    Players with negative points are never started (an empty slot scores 0).
+
+    Args:
+        slots: Slot position names, e.g. ['QB', 'RB', 'RB', 'W/R/T']
+        players: Player dicts with 'actual_points' and 'eligible_positions'
+        slot_options: Memo of eligible_positions tuple -> eligible slot indices,
+            reusable across rosters with the same slots (optional)
+
+    Returns:
+        List with the index into players for each slot (None if left empty)
+    """
+    if slot_options is None:
+        slot_options = {}
+
+    num_slots = len(slots)
+    points = [player.get('actual_points', 0) or 0 for player in players]
+
+    # Slot indices each player can fill, and how many players could fill each slot
+    options = []
+    candidates = [0] * num_slots
+    for player in players:
+        eligible = player.get('eligible_positions') or ()
+        key = tuple(eligible)
+        player_slots = slot_options.get(key)
+        if player_slots is None:
+            player_slots = slot_options[key] = [s for s in range(num_slots) if slots[s] in eligible]
+        options.append(player_slots)
+        for s in player_slots:
+            candidates[s] += 1
+
+    owner: List[Optional[int]] = [None] * num_slots
+    used_ids = set()
+
+    def augment(i: int, visited: set) -> bool:
+        """Find room for player i by moving players along an alternating path"""
+        for s in options[i]:
+            if s in visited:
+                continue
+            visited.add(s)
+            if owner[s] is None or augment(owner[s], visited):
+                owner[s] = i
+                return True
+        return False
+
+    # Highest scorers first (ties keep roster order)
+    filled = 0
+    for i in sorted(range(len(players)), key=points.__getitem__, reverse=True):
+        if filled == num_slots or points[i] < 0:
+            break
+        player_slots = options[i]
+        if not player_slots:
+            continue
+        player_id = players[i].get('player_id')
+        if player_id in used_ids:
+            continue
+
+        # Most restrictive free slot the player can fill
+        best = None
+        for s in player_slots:
+            if owner[s] is None and (best is None or candidates[s] < candidates[best]):
+                best = s
+        if best is not None:
+            owner[best] = i
+        elif not augment(i, set()):
+            continue
+
+        used_ids.add(player_id)
+        filled += 1
+
+    return owner
+
+
+def optimal_lineup(roster: Dict, filter_injured: bool = True, slot_options: Optional[Dict] = None) -> Dict:
+    """
+    Calculate the optimal lineup for a roster
+
+    The lineup uses the same slots the manager started (IR excluded).
+
+    Args:
+        roster: Roster dict with starters and bench
+        filter_injured: If True, exclude Q/D/O/IR players
+        slot_options: Eligibility memo shared across rosters (see assign_slots)
+
+    Returns:
+        Dict with optimal_points, actual_points, points_left_on_bench,
+        efficiency_pct and optimal_lineup (players in slot order)
+    """
+    actual_starters = roster.get('starters', [])
+    all_players = actual_starters + roster.get('bench', [])
+
+    available_players = [
+        p for p in all_players
+        if p.get('selected_position') not in INACTIVE_SLOTS and
+        not (filter_injured and p.get('status') in INJURED_STATUSES)
+    ]
+
+    slots = [p['selected_position'] for p in actual_starters if p.get('selected_position') not in INACTIVE_SLOTS]
+
+    owner = assign_slots(slots, available_players, slot_options)
+    lineup = [available_players[i] for i in owner if i is not None]
+
+    optimal_points = sum(p.get('actual_points', 0) for p in lineup)
+    actual_points = sum(
+        p.get('actual_points', 0) for p in actual_starters
+        if p.get('selected_position') not in INACTIVE_SLOTS
+    )
+
+    return {
+        'optimal_points': optimal_points,
+        'actual_points': actual_points,
+        'points_left_on_bench': optimal_points - actual_points,
+        'efficiency_pct': (actual_points / optimal_points * 100) if optimal_points > 0 else 0,
+        'optimal_lineup': lineup
+    }
+
+
+def optimal_lineups(rosters: Iterable[Dict], filter_injured: bool = True) -> List[Dict]:
+    """
+    Calculate optimal lineups for many rosters (e.g. a team's whole season)
+
+    Rosters that start the same slots share the eligibility lookups.
+
+    Args:
+        rosters: Roster dicts
+        filter_injured: If True, exclude Q/D/O/IR players
+
+    Returns:
+        List of optimal_lineup() results, in roster order
+    """
+    memos = {}
+    results = []
+    for roster in rosters:
+        slots = tuple(
+            p['selected_position'] for p in roster.get('starters', [])
+            if p.get('selected_position') not in INACTIVE_SLOTS
+        )
+        results.append(optimal_lineup(roster, filter_injured, memos.setdefault(slots, {})))
+    return results
@@ -0,0 +1,84 @@
+"""
+Token Bucket Rate Limiter
+Shared request budget for API pullers that make calls from several threads
+
+Tokens refill continuously at `rate` per second up to `capacity`. Each API
+call takes one token; callers block until a token is available. Unlike a
+fixed sleep before every call, idle time is banked (up to the burst size)
+and concurrent callers share a single budget.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Initialize the bucket full
+
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum tokens banked (burst size). Defaults to rate (at least 1).
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1.0))
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add tokens for the time elapsed since the last refill (lock must be held)"""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, blocking until they are available
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            ValueError: More tokens than the bucket can ever hold (would wait forever)
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of capacity {self.capacity}")
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take tokens only if they are available right now
+
+        Returns:
+            True if the tokens were taken
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
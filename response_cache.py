@@ -0,0 +1,282 @@
+"""
+Response Cache
+Persistent on-disk cache for API responses shared by the Yahoo and Sleeper pullers
+
+Entries are content-addressed: the file name is a SHA-256 of the namespace,
+endpoint and parameters, so the same request from any session (or any user
+in the same league) lands on the same file. Each entry either expires after
+a per-endpoint TTL or is marked immutable (completed weeks never change).
+
+The cache lives on the persistent disk (/data on Render), which is only 1 GB,
+so total size is capped and the least recently used entries are evicted first.
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+
+# Persistent disk on Render; the cache is disabled when it isn't mounted
+PERSISTENT_DATA_DIR = '/data'
+DEFAULT_CACHE_DIR = os.path.join(PERSISTENT_DATA_DIR, 'response_cache')
+
+# Leave room on the 1 GB disk for sessions, league files and the usage log
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Evict down to this fraction of the cap so every write doesn't trigger a scan
+EVICTION_TARGET_RATIO = 0.9
+
+
+class ResponseCache:
+    """
+    Thread-safe, size-capped, on-disk cache of JSON-serializable API responses
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Directory for cache entries, or None to disable caching
+            max_bytes: Total size cap; least recently used entries are evicted past it
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._total_bytes = None  # Computed lazily on first write
+
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError as e:
+                print(f"Response cache disabled ({e})")
+                self.cache_dir = None
+
+    @classmethod
+    def default(cls):
+        """
+        Build the cache from the environment
+
+        RESPONSE_CACHE_DIR overrides the location (empty string disables it) and
+        RESPONSE_CACHE_MAX_MB the size cap. Without an override the cache is only
+        enabled when the persistent disk is mounted.
+
+        Returns:
+            ResponseCache
+        """
+        cache_dir = os.environ.get('RESPONSE_CACHE_DIR')
+        if cache_dir is None:
+            cache_dir = DEFAULT_CACHE_DIR if os.path.isdir(PERSISTENT_DATA_DIR) else None
+
+        max_mb = os.environ.get('RESPONSE_CACHE_MAX_MB')
+        max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+
+        return cls(cache_dir or None, max_bytes)
+
+    @property
+    def enabled(self):
+        return self.cache_dir is not None
+
+    @staticmethod
+    def make_key(namespace, endpoint, params=None):
+        """
+        Content address for a request
+
+        Args:
+            namespace: API the request belongs to ('yahoo', 'sleeper')
+            endpoint: Endpoint path or name
+            params: Request parameters (JSON-serializable)
+
+        Returns:
+            str: Hex digest used as the entry file name
+        """
+        raw = json.dumps([namespace, endpoint, params], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key):
+        # Two-character fan-out keeps directories small
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, namespace, endpoint, params=None):
+        """
+        Look up a cached response
+
+        Args:
+            namespace: API the request belongs to
+            endpoint: Endpoint path or name
+            params: Request parameters
+
+        Returns:
+            Cached response, or None on a miss or expired entry
+        """
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(self.make_key(namespace, endpoint, params))
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        expires_at = entry.get('expires_at')
+        if expires_at is not None and expires_at < time.time():
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Touch the entry so eviction sees it as recently used
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        with self._lock:
+            self.hits += 1
+        return entry.get('body')
+
+    def put(self, namespace, endpoint, body, params=None, ttl=None, immutable=False):
+        """
+        Store a response
+
+        Args:
+            namespace: API the request belongs to
+            endpoint: Endpoint path or name
+            body: JSON-serializable response
+            params: Request parameters
+            ttl: Seconds until the entry expires (ignored if immutable)
+            immutable: Never expire (evicted only by the size cap)
+        """
+        if not self.enabled or body is None:
+            return
+
+        entry = {
+            'namespace': namespace,
+            'endpoint': endpoint,
+            'params': params,
+            'stored_at': time.time(),
+            'expires_at': None if immutable or ttl is None else time.time() + ttl,
+            'body': body,
+        }
+
+        path = self._entry_path(self.make_key(namespace, endpoint, params))
+        try:
+            data = json.dumps(entry, separators=(',', ':'), default=str)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+
+            # Write to a temp file and rename so readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Response cache write failed: {e}")
+            return
+
+        with self._lock:
+            self.writes += 1
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            else:
+                self._total_bytes += len(data) - old_size
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def fetch(self, namespace, endpoint, func, *args, params=None, ttl=None, immutable=False, **kwargs):
+        """
+        Return the cached response or call func and cache its result
+
+        Failed calls (None results) are not cached so the next run retries them.
+        immutable may be a function of the response, so a caller can keep
+        incomplete responses from being stored forever.
+
+        Args:
+            namespace: API the request belongs to
+            endpoint: Endpoint path or name
+            func: Function that performs the request
+            *args, **kwargs: Arguments to pass to func
+            params: Request parameters used in the cache key
+            ttl: Seconds until the entry expires
+            immutable: Never expire (bool, or callable taking the response)
+
+        Returns:
+            Response from the cache or from func
+        """
+        body = self.get(namespace, endpoint, params)
+        if body is not None:
+            return body
+
+        body = func(*args, **kwargs)
+        if callable(immutable):
+            immutable = body is not None and immutable(body)
+        self.put(namespace, endpoint, body, params=params, ttl=ttl, immutable=immutable)
+        return body
+
+    def _iter_entries(self):
+        """Yield (path, size, mtime) for every entry on disk"""
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith('.json'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                yield path, st.st_size, st.st_mtime
+
+    def _scan_total_bytes(self):
+        return sum(size for _path, size, _mtime in self._iter_entries())
+
+    def _evict(self):
+        """Delete least recently used entries until under the target size (lock must be held)"""
+        # Other processes share the directory, so rescan for the true total
+        entries = sorted(self._iter_entries(), key=lambda e: e[2])
+        total = sum(size for _path, size, _mtime in entries)
+        target = self.max_bytes * EVICTION_TARGET_RATIO
+
+        for path, size, _mtime in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                self.evictions += 1
+            except OSError:
+                pass
+
+        self._total_bytes = total
+
+    def stats(self):
+        """
+        Get cache counters
+
+        Returns:
+            dict: hits, misses, writes, evictions and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'writes': self.writes,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def summary(self):
+        """One-line summary for puller logs"""
+        s = self.stats()
+        return (f"Response cache: {s['hits']} hits, {s['misses']} misses "
+                f"({s['hit_rate']:.0%} hit rate), {s['evictions']} evicted")
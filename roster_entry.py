@@ -0,0 +1,206 @@
+"""
+Roster Entry
+Compact, read-only roster entries for the calculator's weekly_data
+
+Every roster slot in weekly_data used to be its own dict: the same string
+keys and player names repeated per team-week, and an eligible_positions list
+per entry. The calculator now decodes each entry straight into a
+RosterEntry, so the per-entry dicts never exist alongside them:
+
+- fields live in __slots__ (no per-entry dict)
+- ids, names, positions and statuses are interned strings
+- eligible_positions is one shared tuple per distinct eligibility
+
+League JSON is decoded with roster_object_hook(), which converts each roster
+listing (a dict with player_id and selected_position) as soon as json builds
+it. The binary snapshot can't marshal RosterEntry objects, so pack_rosters()
+stores roster lists as field columns and unpack_rosters() builds the entries
+back from those columns.
+
+RosterEntry is a read-only Mapping, so card code keeps reading entries with
+entry['player_id'] / entry.get('status', ''). Fields a source file didn't
+include stay missing (get() returns the default); unknown fields such as
+stats_detail are kept in a small side dict. Use dict(entry) to serialize one.
+"""
+
+import sys
+from collections.abc import Mapping
+from itertools import count
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Fields stored in slots, in the order the pullers write them
+FIELDS = ('player_id', 'player_name', 'position', 'selected_position', 'eligible_positions', 'status',
+          'actual_points', 'projected_points')
+_FIELD_SET = frozenset(FIELDS)
+
+# Marks a field the entry didn't have in packed snapshot columns (marshal can encode Ellipsis)
+_MISSING = ...
+
+
+class RosterEntry(Mapping):
+    """
+    One player's roster slot for a team-week (read-only mapping view)
+    """
+
+    __slots__ = FIELDS + ('_extra',)
+
+    def __init__(self, entry: Dict, eligible_tuples: Optional[Dict] = None):
+        """
+        Args:
+            entry: Roster entry dict from the league file
+            eligible_tuples: Shared eligible_positions tuples, reused across entries (optional)
+        """
+        self._extra = None
+        for key, value in entry.items():
+            if key in _FIELD_SET:
+                if key == 'eligible_positions' and value is not None:
+                    value = tuple(sys.intern(p) if type(p) is str else p for p in value)
+                    if eligible_tuples is not None:
+                        value = eligible_tuples.setdefault(value, value)
+                elif type(value) is str:
+                    value = sys.intern(value)
+                setattr(self, key, value)
+            else:
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[key] = value
+
+    @classmethod
+    def from_values(cls, values: List, extra: Optional[Dict] = None) -> 'RosterEntry':
+        """
+        Build an entry from one row of packed columns (no intermediate dict)
+
+        Args:
+            values: One value per FIELDS entry (_MISSING if absent)
+            extra: Fields outside FIELDS (optional)
+        """
+        entry = cls.__new__(cls)
+        entry._extra = extra
+        for key, value in zip(FIELDS, values):
+            if value is not _MISSING:
+                setattr(entry, key, value)
+        return entry
+
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in _FIELD_SET:
+            return getattr(self, key, default)
+        return self._extra.get(key, default) if self._extra is not None else default
+
+    def __contains__(self, key) -> bool:
+        if key in _FIELD_SET:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for key in FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f'RosterEntry({dict(self)!r})'
+
+
+def roster_object_hook() -> Callable[[Dict], Any]:
+    """
+    json object_hook that turns roster listings into RosterEntry objects as they're decoded
+
+    Returns:
+        Hook for json.load(s) (one per file, so eligibility tuples are shared within it)
+    """
+    eligible_tuples = {}
+
+    def hook(obj: Dict):
+        if 'player_id' in obj and 'selected_position' in obj:
+            return RosterEntry(obj, eligible_tuples)
+        return obj
+
+    return hook
+
+
+def pack_rosters(data: Dict):
+    """
+    Copy of decoded league data with every list of RosterEntry objects moved into columns
+
+    Each such list becomes a ('rosters', count) tuple (decoded JSON has no
+    tuples, so the marker can't collide with data), and its entries are
+    appended row by row to the columns.
+
+    Args:
+        data: Decoded league data
+
+    Returns:
+        (packed data, columns) where columns is
+        {'fields': one list per FIELDS entry, 'extras': row -> extra fields}
+    """
+    fields = [[] for _ in FIELDS]
+    extras = {}
+
+    def pack(value):
+        if isinstance(value, dict):
+            return {key: pack(item) for key, item in value.items()}
+        if isinstance(value, list):
+            if value and all(type(item) is RosterEntry for item in value):
+                for entry in value:
+                    if entry._extra is not None:
+                        extras[len(fields[0])] = entry._extra
+                    for column, key in zip(fields, FIELDS):
+                        column.append(getattr(entry, key, _MISSING))
+                return ('rosters', len(value))
+            return [pack(item) for item in value]
+        if type(value) is RosterEntry:
+            return dict(value)  # stray entry in a mixed list: stored (and loaded) as a plain dict
+        return value
+
+    return pack(data), {'fields': fields, 'extras': extras}
+
+
+def unpack_rosters(value, columns: Dict):
+    """
+    Rebuild RosterEntry lists in data packed by pack_rosters (in place)
+
+    Containers are visited in the order pack_rosters wrote them, so each
+    ('rosters', count) marker takes the next count rows.
+
+    Args:
+        value: Packed league data (dicts and lists are updated in place)
+        columns: Columns from pack_rosters
+
+    Returns:
+        The unpacked value
+    """
+    rows = zip(*columns['fields'])
+    row_numbers = count()
+    extras = columns['extras']
+
+    def take(num_entries):
+        return [RosterEntry.from_values(next(rows), extras.get(next(row_numbers))) for _ in range(num_entries)]
+
+    def visit(item):
+        if type(item) is tuple:
+            return take(item[1])
+        if isinstance(item, dict):
+            for key, child in item.items():
+                if isinstance(child, (dict, list, tuple)):
+                    item[key] = visit(child)
+        elif isinstance(item, list):
+            for i, child in enumerate(item):
+                if isinstance(child, (dict, list, tuple)):
+                    item[i] = visit(child)
+        return item
+
+    return visit(value)
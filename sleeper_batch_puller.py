@@ -0,0 +1,191 @@
+"""
+Sleeper Batch Puller
+Pull every NFL league a Sleeper user belongs to in one run
+
+Running sleeper_data_puller.py once per league re-fetches the NFL state and
+re-checks the player database each time, and the leagues are pulled one after
+another. The batch resolves the user's leagues for the season, then pulls them
+concurrently. All the leagues share one NFL state, one player store, one
+response cache and one HTTP connection pool, so the total time is close to
+the slowest single league rather than the sum.
+
+Usage:
+    python sleeper_batch_puller.py --username some_user --work-dir output --compact
+    python sleeper_batch_puller.py --user-id 123456789012345678 --season 2024
+"""
+
+import os
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from response_cache import ResponseCache
+from sleeper_player_store import SleeperPlayerStore
+from sleeper_data_puller import (
+    SleeperDataPuller, SLEEPER_API_BASE, STAND_IN_PLAYER_STORE_FILE, DEFAULT_CONCURRENCY, make_session,
+)
+
+# Leagues pulled at the same time
+DEFAULT_LEAGUE_CONCURRENCY = 4
+
+
+class SleeperBatchPuller:
+    """Pulls all of a Sleeper user's NFL leagues for a season"""
+
+    def __init__(self, user: str, season: int = None, work_dir: str = None,
+                 league_concurrency: int = DEFAULT_LEAGUE_CONCURRENCY,
+                 concurrency: int = DEFAULT_CONCURRENCY, compact: bool = False, api_base: str = None,
+                 response_cache: ResponseCache = None, player_store: SleeperPlayerStore = None):
+        """
+        Initialize the batch puller.
+
+        Args:
+            user: Sleeper username or user_id
+            season: Season to pull leagues for (default: the current NFL season)
+            work_dir: Directory for the league files (default: current directory)
+            league_concurrency: Leagues pulled at the same time
+            concurrency: Worker threads for each league's weekly fetches
+            compact: Write compact league files
+            api_base: Alternate API base URL, e.g. a local stand-in server (optional)
+            response_cache: ResponseCache shared by every league (default: ResponseCache.default())
+            player_store: SleeperPlayerStore shared by every league (default: the persistent store)
+        """
+        self.user = str(user)
+        self.season = season
+        self.work_dir = work_dir or os.getcwd()
+        self.league_concurrency = max(1, int(league_concurrency))
+        self.concurrency = max(1, int(concurrency))
+        self.compact = compact
+        self.api_base = api_base or SLEEPER_API_BASE
+
+        # Every league thread (and its weekly workers) draws from one connection pool
+        self.session = make_session(self.league_concurrency * self.concurrency)
+
+        if response_cache is None:
+            response_cache = ResponseCache(None) if api_base else ResponseCache.default()
+        self.response_cache = response_cache
+
+        if player_store is None:
+            player_store = SleeperPlayerStore(
+                os.path.join(self.work_dir, STAND_IN_PLAYER_STORE_FILE) if api_base else None
+            )
+        self.player_store = player_store
+
+        self.nfl_state = None
+        self.user_info = None
+
+    def _fetch(self, endpoint: str) -> Optional[Dict]:
+        """Fetch an endpoint from the Sleeper API, returning None on failure"""
+        url = f"{self.api_base}{endpoint}"
+        try:
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            print(f"API Error: {e}")
+            return None
+
+    def resolve_user(self) -> Dict:
+        """Look up the user by username or user_id"""
+        self.user_info = self._fetch(f"/user/{self.user}")
+        if not self.user_info or not self.user_info.get('user_id'):
+            raise ValueError(f"Could not find Sleeper user {self.user}")
+
+        print(f"✓ User: {self.user_info.get('display_name', self.user)} ({self.user_info['user_id']})")
+        return self.user_info
+
+    def get_user_leagues(self) -> List[Dict]:
+        """Find the user's NFL leagues for the season"""
+        if self.user_info is None:
+            self.resolve_user()
+
+        self.nfl_state = self._fetch("/state/nfl") or {"week": 1, "season": 2025}
+        if self.season is None:
+            self.season = int(self.nfl_state.get('season', 2025))
+
+        leagues = self._fetch(f"/user/{self.user_info['user_id']}/leagues/nfl/{self.season}") or []
+        print(f"✓ Found {len(leagues)} leagues for {self.season}")
+        return leagues
+
+    def _make_puller(self, league_id: str) -> SleeperDataPuller:
+        """Build a league puller that shares this batch's state, store, cache and session"""
+        return SleeperDataPuller(
+            league_id, self.work_dir, response_cache=self.response_cache, compact=self.compact,
+            api_base=self.api_base, concurrency=self.concurrency, player_store=self.player_store,
+            session=self.session, nfl_state=self.nfl_state,
+        )
+
+    def _pull_league(self, puller: SleeperDataPuller, players_ready) -> Optional[str]:
+        """Pull and save one league, returning its file path (None on failure)"""
+        try:
+            players_ready.result()
+            data = puller.pull_complete_season_data()
+            return puller.save_to_json(data)
+        except Exception as e:
+            print(f"✗ League {puller.league_id} failed: {e}")
+            return None
+
+    def pull_all(self) -> Dict[str, Optional[str]]:
+        """
+        Pull every league the user is in
+
+        Returns:
+            dict: league_id -> saved league file path (None if that league failed)
+        """
+        print("\n" + "=" * 60)
+        print("SLEEPER BATCH PULLER")
+        print("=" * 60)
+
+        leagues = self.get_user_leagues()
+        pullers = [self._make_puller(str(league['league_id'])) for league in leagues if league.get('league_id')]
+        if not pullers:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=self.league_concurrency + 1) as executor:
+            # Refresh the shared player store once, not once per league
+            players_ready = executor.submit(pullers[0].fetch_players_database)
+            futures = [executor.submit(self._pull_league, puller, players_ready) for puller in pullers]
+            results = {puller.league_id: future.result() for puller, future in zip(pullers, futures)}
+
+        saved = sum(1 for path in results.values() if path)
+        print("\n" + "=" * 60)
+        print(f"BATCH COMPLETE: {saved}/{len(results)} leagues saved")
+        print("=" * 60)
+
+        if self.response_cache.enabled:
+            print(self.response_cache.summary())
+
+        return results
+
+
+def main():
+    """Command line entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pull all of a Sleeper user's NFL leagues")
+    user = parser.add_mutually_exclusive_group(required=True)
+    user.add_argument('--username', help='Sleeper username')
+    user.add_argument('--user-id', help='Sleeper user ID')
+    parser.add_argument('--season', type=int, help='Season to pull (default: current NFL season)')
+    parser.add_argument('--work-dir', default='.', help='Output directory for the league files')
+    parser.add_argument('--league-concurrency', type=int, default=DEFAULT_LEAGUE_CONCURRENCY,
+                        help=f'Leagues pulled at the same time (default: {DEFAULT_LEAGUE_CONCURRENCY})')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='Worker threads for each league\'s weekly fetches (default: 1, sequential)')
+    parser.add_argument('--compact', action='store_true',
+                        help='Write only the fields the calculator reads, without indentation')
+    parser.add_argument('--api-base', help='Alternate API base URL (e.g. api_replay.py stand-in server)')
+
+    args = parser.parse_args()
+
+    os.makedirs(args.work_dir, exist_ok=True)
+    batch = SleeperBatchPuller(args.username or args.user_id, season=args.season, work_dir=args.work_dir,
+                               league_concurrency=args.league_concurrency, concurrency=args.concurrency,
+                               compact=args.compact, api_base=args.api_base)
+    results = batch.pull_all()
+
+    for league_id, path in results.items():
+        print(f"  {league_id}: {path or 'FAILED'}")
+
+
+if __name__ == '__main__':
+    main()
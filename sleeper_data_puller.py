@@ -7,54 +7,186 @@ No authentication required - just need league_id
 """
 
 import os
-import json
-import time
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
+from response_cache import ResponseCache
+from sleeper_player_store import SleeperPlayerStore
+from league_file import write_league_file
+from delta_pull import load_existing_league, last_complete_week, existing_team_weeks
 
 
-# Sleeper API base URL
+# Sleeper API base URL (override with --api-base to use the api_replay.py stand-in)
 SLEEPER_API_BASE = "https://api.sleeper.app/v1"
 
-# Player cache file (Sleeper player database is ~5MB, cache it)
-PLAYER_CACHE_FILE = "sleeper_players_cache.json"
-PLAYER_CACHE_MAX_AGE_HOURS = 24
+# Stand-in pulls keep their own player store so fixture players never reach the shared one
+STAND_IN_PLAYER_STORE_FILE = "sleeper_players_stand_in.sqlite3"
+
+# Last week of the NFL season (weeks after this never exist)
+MAX_NFL_WEEK = 18
+
+# Default number of worker threads for weekly fetches (1 = sequential)
+DEFAULT_CONCURRENCY = 1
+
+# Keep-alive connections held open to the Sleeper API
+HTTP_POOL_SIZE = 10
+
+# Response cache TTLs (seconds) per endpoint kind. Week-scoped responses for
+# completed weeks are cached as immutable instead.
+SLEEPER_CACHE_TTLS = {
+    'league': 3600,
+    'users': 3600,
+    'rosters': 600,
+    'matchups': 600,
+    'transactions': 600,
+    'drafts': 24 * 3600,
+    'draft': 24 * 3600,
+    'draft_picks': 24 * 3600,
+}
+
+
+def fetch_players_dump(api_base: str = SLEEPER_API_BASE) -> Optional[Dict]:
+    """
+    Download the raw Sleeper NFL player dump (~5MB)
+
+    Used by the web app's background refresh of the shared player store.
+    """
+    try:
+        response = requests.get(f"{api_base}/players/nfl", timeout=60)
+        response.raise_for_status()
+        return response.json()
+    except requests.exceptions.RequestException as e:
+        print(f"API Error: {e}")
+        return None
+
+
+def make_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """
+    Build a keep-alive session for the Sleeper API
+
+    Args:
+        pool_size: Connections kept open (at least the number of threads sharing it)
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(HTTP_POOL_SIZE, pool_size))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
 
 class SleeperDataPuller:
     """Pulls fantasy football data from Sleeper API"""
 
-    def __init__(self, league_id: str, work_dir: str = None):
+    def __init__(self, league_id: str, work_dir: str = None, response_cache: ResponseCache = None,
+                 since_existing: str = None, compact: bool = False, api_base: str = None,
+                 concurrency: int = DEFAULT_CONCURRENCY, player_store: SleeperPlayerStore = None,
+                 session: requests.Session = None, nfl_state: Dict = None):
         """
         Initialize the Sleeper data puller.
 
         Args:
             league_id: Sleeper league ID
             work_dir: Directory for output files (default: current directory)
+            response_cache: ResponseCache for API responses (default: ResponseCache.default())
+            since_existing: Prior league JSON whose completed weeks are reused (optional)
+            compact: Keep only the fields the calculator reads (smaller file, no indentation)
+            api_base: Alternate API base URL, e.g. a local stand-in server (optional)
+            concurrency: Worker threads for weekly matchup/transaction fetches (1 = sequential)
+            player_store: Shared SleeperPlayerStore (default: the store on the persistent disk)
+            session: Shared requests.Session, e.g. for a multi-league batch (default: a new one)
+            nfl_state: Already-fetched /state/nfl response to reuse (optional)
         """
         self.league_id = league_id
+        self.api_base = api_base or SLEEPER_API_BASE
+        self.concurrency = max(1, int(concurrency))
+
+        # One keep-alive session for every request instead of a new connection per call
+        self.session = session or make_session(self.concurrency)
         self.work_dir = work_dir or os.getcwd()
+        self.since_existing = since_existing
+        self.compact = compact
+
+        # Persistent response cache shared across runs and sessions (never for stand-in responses)
+        if response_cache is None:
+            response_cache = ResponseCache(None) if api_base else ResponseCache.default()
+        self.response_cache = response_cache
+        self.completed_through_week = 0  # Set once NFL state is known
+        self.nfl_state = nfl_state  # Fetched once per pull
 
         # Data caches
         self.league_data = None
         self.users = {}  # user_id -> user info
         self.rosters = []  # List of roster objects
         self.roster_to_user = {}  # roster_id -> user_id
-        self.players_db = {}  # player_id -> player info
+        self._players_ready = False  # fetch_players_database() has run
+
+        # Shared player store (read on demand instead of loading the whole dump)
+        if player_store is None:
+            player_store = SleeperPlayerStore(
+                os.path.join(self.work_dir, STAND_IN_PLAYER_STORE_FILE) if api_base else None
+            )
+        self.player_store = player_store
         self.scoring_settings = {}  # League scoring settings
 
-    def _api_call(self, endpoint: str) -> Optional[Dict]:
-        """Make API call to Sleeper with error handling"""
-        url = f"{SLEEPER_API_BASE}{endpoint}"
+    def _api_call(self, endpoint: str, cache: str = None, week: int = None) -> Optional[Dict]:
+        """
+        Make API call to Sleeper with error handling
+
+        Args:
+            endpoint: API path (e.g. /league/{id}/matchups/3)
+            cache: Endpoint kind in SLEEPER_CACHE_TTLS to cache the response under (optional)
+            week: Week the response belongs to; non-empty responses for completed
+                  weeks are cached as immutable
+        """
+        if cache is None:
+            return self._fetch(endpoint)
+
+        # An empty [] / {} for a completed week may be a transient gap, so it stays on the TTL
+        completed_week = week is not None and week <= self.completed_through_week
+        return self.response_cache.fetch(
+            'sleeper', endpoint, self._fetch, endpoint,
+            ttl=SLEEPER_CACHE_TTLS.get(cache), immutable=bool if completed_week else False
+        )
+
+    def _fetch(self, endpoint: str) -> Optional[Dict]:
+        """Fetch an endpoint from the Sleeper API, returning None on failure"""
+        url = f"{self.api_base}{endpoint}"
         try:
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"API Error: {e}")
             return None
 
+    def _fetch_weeks(self, endpoint: str, cache: str, weeks: List[int]) -> Dict[int, Optional[Dict]]:
+        """
+        Fetch a week-scoped endpoint for several weeks
+
+        Weeks are fetched in parallel when concurrency > 1; results are keyed
+        by week so callers process them in week order either way.
+
+        Args:
+            endpoint: Endpoint with a {week} placeholder
+            cache: Endpoint kind in SLEEPER_CACHE_TTLS
+            weeks: Weeks to fetch
+
+        Returns:
+            dict: week -> response (None on failure)
+        """
+        def fetch(week):
+            return self._api_call(endpoint.format(week=week), cache=cache, week=week)
+
+        if self.concurrency > 1 and len(weeks) > 1:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                results = list(executor.map(fetch, weeks))
+        else:
+            results = [fetch(week) for week in weeks]
+
+        return dict(zip(weeks, results))
+
     def _get_team_key(self, roster_id: int) -> str:
         """Generate Yahoo-compatible team key from roster_id"""
         return f"sleeper.l.{self.league_id}.t.{roster_id}"
@@ -99,59 +231,44 @@ class SleeperDataPuller:
         }
         return status_map.get(status, "")
 
-    def _load_players_cache(self) -> bool:
-        """Load players from cache if fresh enough"""
-        cache_path = os.path.join(self.work_dir, PLAYER_CACHE_FILE)
-        if not os.path.exists(cache_path):
-            return False
+    def fetch_players_database(self):
+        """
+        Make sure the shared player store is populated
 
-        # Check cache age
-        cache_mtime = os.path.getmtime(cache_path)
-        age_hours = (time.time() - cache_mtime) / 3600
-        if age_hours > PLAYER_CACHE_MAX_AGE_HOURS:
-            return False
+        The store is refreshed from the ~5MB /players/nfl dump only when it is
+        empty or older than a day (the web app normally keeps it fresh in the
+        background). If another process is already refreshing, the current
+        contents are used.
+        """
+        self._players_ready = True
+        store = self.player_store
 
-        try:
-            with open(cache_path, 'r') as f:
-                self.players_db = json.load(f)
-            print(f"✓ Loaded {len(self.players_db)} players from cache")
-            return True
-        except Exception as e:
-            print(f"Cache load failed: {e}")
-            return False
-
-    def _save_players_cache(self):
-        """Save players database to cache"""
-        cache_path = os.path.join(self.work_dir, PLAYER_CACHE_FILE)
-        try:
-            with open(cache_path, 'w') as f:
-                json.dump(self.players_db, f)
-            print(f"✓ Saved {len(self.players_db)} players to cache")
-        except Exception as e:
-            print(f"Cache save failed: {e}")
+        if not store.is_stale():
+            print(f"✓ Using shared player store ({store.count()} players)")
+            return
 
-    def fetch_players_database(self):
-        """Fetch all NFL players (large request, ~5MB)"""
-        if self._load_players_cache():
+        if store.count() and not store.claim_refresh():
+            print("✓ Player store refresh in progress elsewhere, using current data")
             return
 
         print("Fetching Sleeper players database (this may take a moment)...")
         players = self._api_call("/players/nfl")
         if players:
-            self.players_db = players
-            self._save_players_cache()
-        else:
+            count = store.refresh(players)
+            print(f"✓ Stored {count} players in shared player store")
+        elif not store.count():
             print("Warning: Failed to fetch players database")
 
     def get_nfl_state(self) -> Dict:
         """Get current NFL state (week, season, etc.)"""
-        state = self._api_call("/state/nfl")
-        return state or {"week": 1, "season": 2025}
+        if self.nfl_state is None:
+            self.nfl_state = self._api_call("/state/nfl")
+        return self.nfl_state or {"week": 1, "season": 2025}
 
     def get_league_metadata(self) -> Dict:
         """Fetch league settings and metadata"""
         print(f"Fetching league {self.league_id}...")
-        self.league_data = self._api_call(f"/league/{self.league_id}")
+        self.league_data = self._api_call(f"/league/{self.league_id}", cache='league')
 
         if not self.league_data:
             raise ValueError(f"Could not fetch league {self.league_id}")
@@ -183,7 +300,7 @@ class SleeperDataPuller:
 
     def get_users(self) -> Dict:
         """Fetch league users (managers)"""
-        users_list = self._api_call(f"/league/{self.league_id}/users")
+        users_list = self._api_call(f"/league/{self.league_id}/users", cache='users')
         if users_list:
             for user in users_list:
                 user_id = user.get('user_id')
@@ -197,7 +314,7 @@ class SleeperDataPuller:
 
     def get_rosters(self) -> List[Dict]:
         """Fetch all rosters (teams) with standings"""
-        self.rosters = self._api_call(f"/league/{self.league_id}/rosters") or []
+        self.rosters = self._api_call(f"/league/{self.league_id}/rosters", cache='rosters') or []
 
         # Build roster_id -> user_id mapping
         for roster in self.rosters:
@@ -243,11 +360,11 @@ class SleeperDataPuller:
         return teams
 
     def get_player_info(self, player_id: str) -> Dict:
-        """Get player info from database"""
-        if not self.players_db:
+        """Get player info from the shared player store"""
+        if not self._players_ready:
             self.fetch_players_database()
 
-        player = self.players_db.get(str(player_id), {})
+        player = self.player_store.get(player_id) or {}
         return {
             "player_id": player_id,
             "player_name": f"{player.get('first_name', '')} {player.get('last_name', '')}".strip() or f"Player {player_id}",
@@ -259,19 +376,42 @@ class SleeperDataPuller:
 
     def get_weekly_matchups(self, week: int) -> List[Dict]:
         """Fetch matchups for a specific week"""
-        matchups = self._api_call(f"/league/{self.league_id}/matchups/{week}")
+        matchups = self._api_call(f"/league/{self.league_id}/matchups/{week}", cache='matchups', week=week)
         return matchups or []
 
-    def get_weekly_data(self, num_weeks: int) -> Dict:
+    def get_weekly_data(self, num_weeks: int, start_week: int = 1) -> Dict:
         """
         Fetch weekly data for all teams across all weeks.
 
+        Args:
+            num_weeks: Last week to fetch
+            start_week: First week to fetch (later than 1 for delta pulls)
+
         Returns Yahoo-compatible weekly_data structure.
         """
-        print(f"Fetching weekly data for {num_weeks} weeks...")
+        print(f"Fetching weekly data for weeks {start_week}-{num_weeks}...")
 
-        if not self.players_db:
-            self.fetch_players_database()
+        weeks = list(range(start_week, num_weeks + 1))
+        matchups_endpoint = f"/league/{self.league_id}/matchups/{{week}}"
+
+        if not self._players_ready and weeks and self.concurrency > 1:
+            # Download the players database while the matchups are fetched
+            with ThreadPoolExecutor(max_workers=1) as background:
+                players_future = background.submit(self.fetch_players_database)
+                matchups_by_week = self._fetch_weeks(matchups_endpoint, 'matchups', weeks)
+                players_future.result()
+        else:
+            if not self._players_ready and weeks:
+                self.fetch_players_database()
+            matchups_by_week = self._fetch_weeks(matchups_endpoint, 'matchups', weeks)
+
+        # Load every player these matchups mention in one query
+        self.player_store.get_many(
+            player_id
+            for matchups in matchups_by_week.values() if matchups
+            for m in matchups
+            for player_id in (m.get('players') or [])
+        )
 
         weekly_data = {}
 
@@ -280,9 +420,9 @@ class SleeperDataPuller:
             team_key = self._get_team_key(roster.get('roster_id'))
             weekly_data[team_key] = {}
 
-        for week in range(1, num_weeks + 1):
+        for week in weeks:
             print(f"  Week {week}...", end=" ")
-            matchups = self.get_weekly_matchups(week)
+            matchups = matchups_by_week[week] or []
 
             if not matchups:
                 print("no data")
@@ -398,14 +538,22 @@ class SleeperDataPuller:
 
         return weekly_data
 
-    def get_transactions(self) -> List[Dict]:
-        """Fetch all transactions for the season"""
+    def get_transactions(self, start_week: int = 1) -> List[Dict]:
+        """
+        Fetch all transactions for the season
+
+        Args:
+            start_week: First round (week) to fetch (later than 1 for delta pulls)
+        """
         print("Fetching transactions...")
         all_transactions = []
 
         # Sleeper transactions are fetched by round (week)
-        for week in range(1, 18):
-            txns = self._api_call(f"/league/{self.league_id}/transactions/{week}")
+        rounds = list(range(start_week, 18))
+        txns_by_round = self._fetch_weeks(f"/league/{self.league_id}/transactions/{{week}}",
+                                          'transactions', rounds)
+        for week in rounds:
+            txns = txns_by_round[week]
             if txns:
                 all_transactions.extend(txns)
 
@@ -500,6 +648,7 @@ class SleeperDataPuller:
                 "status": txn.get('status', 'complete'),
                 "faab_bid": waiver_budget,
                 "players": players,
+                "week": txn.get('leg'),  # Round, used to merge delta pulls
             })
 
         print(f"✓ Loaded {len(yahoo_transactions)} transactions")
@@ -510,7 +659,7 @@ class SleeperDataPuller:
         print("Fetching draft results...")
 
         # First get drafts for this league
-        drafts = self._api_call(f"/league/{self.league_id}/drafts")
+        drafts = self._api_call(f"/league/{self.league_id}/drafts", cache='drafts')
         if not drafts:
             print("No draft data found")
             return []
@@ -521,12 +670,12 @@ class SleeperDataPuller:
             return []
 
         # Fetch draft picks
-        picks = self._api_call(f"/draft/{draft_id}/picks")
+        picks = self._api_call(f"/draft/{draft_id}/picks", cache='draft_picks')
         if not picks:
             return []
 
         # Get draft settings for auction detection and league type
-        draft_info = self._api_call(f"/draft/{draft_id}")
+        draft_info = self._api_call(f"/draft/{draft_id}", cache='draft')
         is_auction = draft_info.get('type') == 'auction' if draft_info else False
 
         # Count keeper picks for league type detection
@@ -590,12 +739,43 @@ class SleeperDataPuller:
         if regular_season_complete:
             # Completed season - fetch all regular season weeks
             weeks_to_fetch = playoff_week - 1
+            self.completed_through_week = MAX_NFL_WEEK
         else:
             # Current season in progress - fetch up to current week
             weeks_to_fetch = min(nfl_week, playoff_week - 1)
-
-        weekly_data = self.get_weekly_data(weeks_to_fetch)
-        transactions = self.get_transactions()
+            self.completed_through_week = nfl_week - 1
+
+        # Delta pull: reuse weeks (and their transactions) that were already final in the existing file
+        reuse_through = 0
+        existing = None
+        if self.since_existing:
+            existing = load_existing_league(self.since_existing, self.league_id, league_season)
+            team_keys = [team['team_id'] for team in teams]
+            reuse_through = last_complete_week(existing, team_keys, weeks_to_fetch)
+
+            # Files from before transactions carried their round can't be split by week
+            existing_txns = existing.get('transactions', []) if existing else []
+            if any(t.get('week') is None for t in existing_txns):
+                reuse_through = 0
+
+            if reuse_through:
+                print(f"Reusing weeks 1-{reuse_through} from {self.since_existing}")
+
+        weekly_data = self.get_weekly_data(weeks_to_fetch, start_week=reuse_through + 1)
+        transactions = self.get_transactions(start_week=reuse_through + 1)
+
+        if reuse_through:
+            reused = existing_team_weeks(existing, list(weekly_data), reuse_through)
+            weekly_data = {
+                team_key: {
+                    **{f"week_{w}": reused[(team_key, w)] for w in range(1, reuse_through + 1)},
+                    **team_weeks,
+                }
+                for team_key, team_weeks in weekly_data.items()
+            }
+            transactions = [
+                t for t in existing['transactions'] if t['week'] <= reuse_through
+            ] + transactions
         draft = self.get_draft_results()
 
         # Update current_week to reflect actual weeks fetched (important for completed seasons)
@@ -627,6 +807,9 @@ class SleeperDataPuller:
         print("DATA PULL COMPLETE")
         print("=" * 60)
 
+        if self.response_cache.enabled:
+            print(self.response_cache.summary())
+
         return data
 
     def save_to_json(self, data: Dict, filename: str = None) -> str:
@@ -635,8 +818,7 @@ class SleeperDataPuller:
             filename = f"league_{self.league_id}_{data['league']['season']}.json"
 
         filepath = os.path.join(self.work_dir, filename)
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_league_file(data, filepath, compact=self.compact)
 
         print(f"✓ Saved to {filepath}")
         return filepath
@@ -650,6 +832,13 @@ def main():
     parser.add_argument('--league-id', required=True, help='Sleeper league ID')
     parser.add_argument('--output', help='Output file path (default: league_{id}_{season}.json)')
     parser.add_argument('--work-dir', default='.', help='Output directory (used if --output not specified)')
+    parser.add_argument('--since-existing', metavar='LEAGUE_JSON',
+                        help='Reuse completed weeks from an existing league file and only fetch newer weeks')
+    parser.add_argument('--compact', action='store_true',
+                        help='Write only the fields the calculator reads, without indentation')
+    parser.add_argument('--api-base', help='Alternate API base URL (e.g. api_replay.py stand-in server)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='Worker threads for weekly matchup/transaction fetches (default: 1, sequential)')
 
     args = parser.parse_args()
 
@@ -658,7 +847,9 @@ def main():
     if args.output:
         work_dir = os.path.dirname(args.output) or '.'
 
-    puller = SleeperDataPuller(args.league_id, work_dir)
+    puller = SleeperDataPuller(args.league_id, work_dir, since_existing=args.since_existing,
+                               compact=args.compact, api_base=args.api_base,
+                               concurrency=args.concurrency)
     data = puller.pull_complete_season_data()
 
     # Determine output filename
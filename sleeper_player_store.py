@@ -0,0 +1,246 @@
+"""
+Sleeper Player Store
+Shared SQLite index of the Sleeper NFL player database
+
+The raw /players/nfl dump is ~5MB of JSON. Instead of every pull downloading
+and parsing it into its own session directory, one store on the persistent
+disk holds just the fields the puller uses, keyed by player_id. Pulls read
+the few hundred players they need on demand; the web app refreshes the
+store in the background once a day.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+
+# Persistent disk on Render; fall back to the app directory for local development
+PERSISTENT_DATA_DIR = '/data'
+STORE_FILENAME = 'sleeper_players.sqlite3'
+
+# Refresh the store once it is older than this
+MAX_AGE_HOURS = 24
+
+# A refresh claimed by another process is trusted for this long before retrying
+REFRESH_CLAIM_SECONDS = 600
+
+# Player fields kept from the raw dump (everything get_player_info reads)
+PLAYER_FIELDS = ('first_name', 'last_name', 'position', 'team', 'injury_status', 'fantasy_positions')
+
+# The refresh thread started in this process (threads don't survive a fork, so it's keyed by pid)
+_refresh_thread = None
+_refresh_pid = None
+_refresh_lock = threading.Lock()
+
+
+def default_store_path():
+    """
+    Location of the shared store
+
+    SLEEPER_PLAYER_STORE overrides it; otherwise the persistent disk is used
+    when mounted, else the app directory.
+    """
+    override = os.environ.get('SLEEPER_PLAYER_STORE')
+    if override:
+        return override
+    if os.path.isdir(PERSISTENT_DATA_DIR):
+        return os.path.join(PERSISTENT_DATA_DIR, STORE_FILENAME)
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), STORE_FILENAME)
+
+
+class SleeperPlayerStore:
+    """
+    Thread-safe SQLite store of compact player records
+    """
+
+    def __init__(self, db_path=None, max_age_hours=MAX_AGE_HOURS):
+        """
+        Open (and create if needed) the store
+
+        Args:
+            db_path: SQLite file path (default: default_store_path())
+            max_age_hours: Age after which is_stale() reports True
+        """
+        self.db_path = db_path or default_store_path()
+        self.max_age_hours = max_age_hours
+        self._lock = threading.Lock()
+        self._memo = {}  # player_id -> record (or None), for this process
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False,
+                                     isolation_level=None)
+        with self._lock:
+            # WAL lets pulls keep reading while a refresh writes
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS players (player_id TEXT PRIMARY KEY, data TEXT NOT NULL)')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+
+    def _get_meta(self, key):
+        row = self._conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self._conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, str(value)))
+
+    def count(self):
+        """Number of players in the store"""
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM players').fetchone()[0]
+
+    def refreshed_at(self):
+        """Unix time of the last refresh (0 if never)"""
+        with self._lock:
+            return float(self._get_meta('refreshed_at') or 0)
+
+    def is_stale(self):
+        """True if the store is empty or older than max_age_hours"""
+        return (time.time() - self.refreshed_at()) > self.max_age_hours * 3600 or self.count() == 0
+
+    def claim_refresh(self):
+        """
+        Claim the next refresh so concurrent processes don't all download the dump
+
+        Returns:
+            True if this process should refresh
+        """
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                now = time.time()
+                refreshed_at = float(self._get_meta('refreshed_at') or 0)
+                claimed_at = float(self._get_meta('refresh_claimed_at') or 0)
+
+                fresh = (now - refreshed_at) <= self.max_age_hours * 3600
+                claimed = (now - claimed_at) <= REFRESH_CLAIM_SECONDS
+                if fresh or claimed:
+                    self._conn.execute('COMMIT')
+                    return False
+
+                self._set_meta('refresh_claimed_at', now)
+                self._conn.execute('COMMIT')
+                return True
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def refresh(self, players):
+        """
+        Replace the store contents from a raw /players/nfl dump
+
+        Args:
+            players: dict of player_id -> raw Sleeper player object
+
+        Returns:
+            int: Players stored
+        """
+        rows = [
+            (str(player_id), json.dumps({f: p.get(f) for f in PLAYER_FIELDS if p.get(f) is not None},
+                                        separators=(',', ':')))
+            for player_id, p in players.items()
+            if isinstance(p, dict)
+        ]
+
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.execute('DELETE FROM players')
+                self._conn.executemany('INSERT INTO players (player_id, data) VALUES (?, ?)', rows)
+                self._set_meta('refreshed_at', time.time())
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._memo.clear()
+
+        return len(rows)
+
+    def get_many(self, player_ids):
+        """
+        Look up several players in one query
+
+        Args:
+            player_ids: Iterable of player IDs
+
+        Returns:
+            dict: player_id -> compact record (missing players are omitted)
+        """
+        wanted = {str(pid) for pid in player_ids if pid}
+        found = {}
+
+        with self._lock:
+            missing = [pid for pid in wanted if pid not in self._memo]
+
+            # SQLite caps bound parameters per statement, so query in chunks
+            for i in range(0, len(missing), 500):
+                chunk = missing[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f'SELECT player_id, data FROM players WHERE player_id IN ({placeholders})', chunk
+                ).fetchall()
+                loaded = {pid: json.loads(data) for pid, data in rows}
+                for pid in chunk:
+                    self._memo[pid] = loaded.get(pid)
+
+            for pid in wanted:
+                if self._memo.get(pid) is not None:
+                    found[pid] = self._memo[pid]
+
+        return found
+
+    def get(self, player_id):
+        """
+        Look up one player
+
+        Returns:
+            dict: Compact record, or None if unknown
+        """
+        return self.get_many([player_id]).get(str(player_id))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def start_background_refresh(fetch_players, db_path=None, check_interval_seconds=3600):
+    """
+    Keep the shared store fresh from a daemon thread
+
+    Checks hourly and refreshes once the store is older than a day. Only one
+    process refreshes at a time (see claim_refresh). Safe to call repeatedly:
+    each process starts at most one thread and later calls return it.
+
+    Args:
+        fetch_players: Function returning the raw /players/nfl dump (or None)
+        db_path: Store path (default: default_store_path())
+        check_interval_seconds: Seconds between staleness checks
+
+    Returns:
+        threading.Thread: This process's refresh thread
+    """
+    global _refresh_thread, _refresh_pid
+
+    def run():
+        store = SleeperPlayerStore(db_path)
+        while True:
+            try:
+                if store.is_stale() and store.claim_refresh():
+                    players = fetch_players()
+                    if players:
+                        count = store.refresh(players)
+                        print(f"✓ Refreshed Sleeper player store ({count} players)")
+            except Exception as e:
+                print(f"Sleeper player store refresh failed: {e}")
+            time.sleep(check_interval_seconds)
+
+    with _refresh_lock:
+        if _refresh_thread is not None and _refresh_pid == os.getpid() and _refresh_thread.is_alive():
+            return _refresh_thread
+
+        thread = threading.Thread(target=run, name='sleeper-player-refresh', daemon=True)
+        thread.start()
+        _refresh_thread, _refresh_pid = thread, os.getpid()
+        return thread
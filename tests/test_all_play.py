@@ -0,0 +1,69 @@
+"""
+Tests for the all-play table
+
+Ensures sorting each week once gives the same records as comparing every
+team against every other team.
+"""
+
+import pytest
+import sys
+import os
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from all_play import AllPlay, all_play_counts
+from league_model import LeagueModel
+
+
+class TestAllPlay:
+    """Test all-play records against a pairwise comparison"""
+
+    def test_matches_pairwise_comparison(self, calculator):
+        all_play = calculator.get_all_play()
+        weeks = calculator.get_regular_season_weeks()
+        num_teams = len(calculator.teams)
+
+        for team_key in calculator.teams:
+            wins = losses = ties = 0
+            expected_wins = 0
+            median_differential = 0.0
+            for week in weeks:
+                score = calculator.weekly_data[team_key][f'week_{week}']['actual_points']
+                others = [calculator.weekly_data[tk][f'week_{week}']['actual_points']
+                          for tk in calculator.teams if tk != team_key]
+                beaten = sum(1 for other in others if score > other)
+                wins += beaten
+                losses += sum(1 for other in others if score < other)
+                ties += sum(1 for other in others if score == other)
+                expected_wins += beaten / (num_teams - 1)
+                median_differential += score - statistics.median(others)
+
+            record = all_play.record(team_key)
+            assert (record['wins'], record['losses'], record['ties']) == (wins, losses, ties)
+            assert all_play.expected_wins(team_key) == pytest.approx(expected_wins)
+            assert record['median_differential'] == pytest.approx(median_differential)
+
+    def test_ties_and_missing_weeks(self):
+        weekly_data = {
+            't.1': {'week_1': {'actual_points': 100.0}, 'week_2': {'actual_points': 90.0}},
+            't.2': {'week_1': {'actual_points': 100.0}, 'week_2': {'actual_points': 120.0}},
+            't.3': {'week_1': {'actual_points': 80.0}},
+        }
+        all_play = AllPlay(LeagueModel(weekly_data), ['t.1', 't.2', 't.3'], range(1, 3))
+
+        assert all_play_counts([80.0, 100.0, 100.0], 100.0) == (1, 0, 1)
+        assert all_play.record('t.1') == {
+            'wins': 1, 'losses': 1, 'ties': 1, 'expected_wins': 0.5, 'median_differential': -20.0
+        }
+        assert all_play.record('t.3')['losses'] == 2
+        assert all_play.teams_below(1, 100.0) == 1
+        assert all_play.median_opponent(1, 80.0) == 100.0
+        assert all_play.median_opponent(2, 120.0) == 90.0
+
+        standings = all_play.standings()
+        assert [row['team_key'] for row in standings] == ['t.2', 't.1', 't.3']
+        assert standings[0] == {
+            'team_key': 't.2', 'wins': 2, 'losses': 0, 'ties': 1, 'win_pct': 83.3,
+            'expected_wins': 1.0, 'median_differential': 40.0, 'rank': 1,
+        }
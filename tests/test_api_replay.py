@@ -0,0 +1,98 @@
+"""
+Tests for the API record/replay harness
+
+Ensures the stand-in server replays recorded responses and applies the
+configured throttling and error injection.
+"""
+
+import pytest
+import sys
+import os
+import json
+import urllib.request
+import urllib.error
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_replay import FixtureBundle, StandInServer
+
+
+def get(url):
+    """Return (status, body) for a GET request"""
+    try:
+        with urllib.request.urlopen(url) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+@pytest.fixture
+def bundle(tmp_path):
+    """Bundle with one Yahoo and one Sleeper recording"""
+    bundle = FixtureBundle(str(tmp_path / 'bundle'))
+    bundle.save('yahoo', 'league/461.l.1/scoreboard;week=3', {'fantasy_content': {'week': 3}})
+    bundle.save('sleeper', '/league/99/matchups/3', [{'roster_id': 1, 'points': 101.5}])
+    return bundle
+
+
+@pytest.fixture
+def make_server(bundle):
+    """Start stand-in servers and stop them after the test"""
+    servers = []
+
+    def make(**kwargs):
+        server = StandInServer(bundle, **kwargs).start()
+        servers.append(server)
+        return server
+
+    yield make
+    for server in servers:
+        server.stop()
+
+
+class TestStandInServer:
+    """Test stand-in server behavior"""
+
+    def test_replays_recorded_responses(self, make_server):
+        """Both APIs should be served under their own prefixes"""
+        server = make_server()
+
+        status, body = get(server.yahoo_base + '/league/461.l.1/scoreboard;week=3?format=json')
+        assert status == 200
+        assert json.loads(body) == {'fantasy_content': {'week': 3}}
+
+        status, body = get(server.sleeper_base + '/league/99/matchups/3')
+        assert status == 200
+        assert json.loads(body) == [{'roster_id': 1, 'points': 101.5}]
+
+    def test_missing_recording_is_404(self, make_server):
+        server = make_server()
+        status, _ = get(server.sleeper_base + '/league/99/matchups/4')
+        assert status == 404
+        assert server.counters['not_found'] == 1
+
+    def test_rate_limit_throttles_like_yahoo(self, make_server):
+        """Requests past the burst should get Yahoo's 999 Request denied"""
+        server = make_server(rate_limit=0.01, burst=2)
+        url = server.yahoo_base + '/league/461.l.1/scoreboard;week=3'
+        statuses = [get(url)[0] for _ in range(4)]
+
+        assert statuses[:2] == [200, 200]
+        assert statuses[2:] == [999, 999]
+        assert server.counters['throttled'] == 2
+
+    def test_error_injection(self, make_server):
+        """An error rate of 1 should fail every request with a 503"""
+        server = make_server(error_rate=1.0)
+        status, body = get(server.sleeper_base + '/league/99/matchups/3')
+        assert status == 503
+        assert b'Service Unavailable' in body
+
+
+class TestFixtureBundle:
+    """Test fixture bundle storage"""
+
+    def test_round_trip(self, bundle):
+        assert bundle.load('sleeper', '/league/99/matchups/3') == (True, [{'roster_id': 1, 'points': 101.5}])
+        assert bundle.load('sleeper', '/league/99/matchups/9') == (False, None)
+        assert bundle.paths('yahoo') == ['league/461.l.1/scoreboard;week=3']
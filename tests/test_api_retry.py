@@ -0,0 +1,95 @@
+"""
+Tests for the API retry layer
+
+Ensures Yahoo failures are classified correctly, retryable failures are
+retried with backoff, and the per-pull retry budget stops runaway retries.
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import api_retry
+from api_retry import (
+    classify_yahoo_error, call_with_retry, RetryBudget,
+    ThrottledError, AuthExpiredError, TransientError, RetryBudgetExhausted,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Don't actually wait between retries"""
+    monkeypatch.setattr(api_retry.time, 'sleep', lambda seconds: None)
+
+
+def flaky(failures, result='ok'):
+    """Function that raises each exception in failures once, then returns result"""
+    remaining = list(failures)
+
+    def func():
+        if remaining:
+            raise remaining.pop(0)
+        return result
+    func.remaining = remaining
+    return func
+
+
+class TestClassification:
+    """Test Yahoo error classification"""
+
+    def test_throttle(self):
+        assert classify_yahoo_error(RuntimeError(b'Request denied\n')) is ThrottledError
+
+    def test_auth_expired(self):
+        err = RuntimeError(b'{"error":{"description":"Please provide valid credentials. OAuth oauth_problem=\\"token_expired\\""}}')
+        assert classify_yahoo_error(err) is AuthExpiredError
+
+    def test_network_errors_are_transient(self):
+        assert classify_yahoo_error(ConnectionResetError('reset by peer')) is TransientError
+        assert classify_yahoo_error(TimeoutError('timed out')) is TransientError
+
+    def test_other_errors_are_not_retried(self):
+        assert classify_yahoo_error(RuntimeError(b'League not found')) is None
+        assert classify_yahoo_error(KeyError('fantasy_content')) is None
+
+
+class TestCallWithRetry:
+    """Test retry behavior"""
+
+    def test_retries_until_success(self):
+        func = flaky([RuntimeError('Request denied'), ConnectionResetError('reset')])
+        assert call_with_retry(func) == 'ok'
+
+    def test_unclassified_error_raises_immediately(self):
+        func = flaky([ValueError('bad data')])
+        with pytest.raises(ValueError):
+            call_with_retry(func)
+
+    def test_gives_up_after_max_attempts(self):
+        func = flaky([RuntimeError('Request denied')] * 3)
+        with pytest.raises(ThrottledError):
+            call_with_retry(func, max_attempts=3)
+
+    def test_auth_expired_triggers_refresh(self):
+        refreshed = []
+        func = flaky([RuntimeError('oauth_problem="token_expired"')])
+        assert call_with_retry(func, on_auth_expired=lambda: refreshed.append(1)) == 'ok'
+        assert refreshed == [1]
+
+    def test_auth_retry_waits(self, monkeypatch):
+        delays = []
+        monkeypatch.setattr(api_retry.time, 'sleep', delays.append)
+        monkeypatch.setattr(api_retry.random, 'uniform', lambda low, high: high)
+        func = flaky([RuntimeError('oauth_problem="token_expired"')])
+        assert call_with_retry(func, on_auth_expired=lambda: None) == 'ok'
+        assert delays == [1.0]
+
+    def test_budget_is_shared_across_calls(self):
+        budget = RetryBudget(total=2)
+        assert call_with_retry(flaky([TimeoutError('t')]), budget=budget) == 'ok'
+        assert call_with_retry(flaky([TimeoutError('t')]), budget=budget) == 'ok'
+        with pytest.raises(RetryBudgetExhausted):
+            call_with_retry(flaky([TimeoutError('t')]), budget=budget)
+        assert budget.remaining == 0
@@ -7,6 +7,7 @@ Tests each card's calculation logic with sample data to ensure:
 - Percentiles and rankings are calculated correctly
 """
 
+import multiprocessing
 import pytest
 import sys
 import os
@@ -281,6 +282,40 @@ class TestOptimalLineupCalculation:
                 assert abs(result['efficiency_pct'] - expected_eff) < 0.1
 
 
+class TestOptimalLineupCache:
+    """Test the (team, week, filter_injured) optimal lineup cache"""
+
+    def test_roster_calls_hit_cache(self, calculator):
+        team_key = list(calculator.teams.keys())[0]
+        roster = calculator.weekly_data[team_key]['week_3']['roster']
+
+        first = calculator.calculate_optimal_lineup(roster, filter_injured=False)
+        assert calculator.calculate_optimal_lineup(roster, filter_injured=False) is first
+        assert calculator.get_optimal_lineup(team_key, 3, filter_injured=False) is first
+        assert calculator.calculate_optimal_lineup(roster, filter_injured=True) is not first
+
+        stats = calculator.get_lineup_cache_stats()
+        assert stats['misses'] == 2
+        assert stats['hits'] == 2
+        assert stats['size'] == 2
+
+    def test_precompute_and_uncached_rosters(self, calculator):
+        team_weeks = len(calculator.teams) * len(calculator.get_regular_season_weeks())
+        assert calculator.precompute_optimal_lineups() == team_weeks
+        assert calculator.precompute_optimal_lineups() == 0
+
+        team_key = list(calculator.teams.keys())[0]
+        roster = calculator.weekly_data[team_key]['week_1']['roster']
+        copied = {'starters': list(roster['starters']), 'bench': list(roster['bench'])}
+        assert calculator.calculate_optimal_lineup(copied, filter_injured=False)['optimal_points'] == \
+            calculator.calculate_optimal_lineup(roster, filter_injured=False)['optimal_points']
+
+        stats = calculator.get_lineup_cache_stats()
+        assert stats['uncached'] == 1
+        assert stats['misses'] == team_weeks
+        assert stats['hits'] == 1
+
+
 class TestAllTeamsCalculations:
     """Test that calculations work for all teams"""
 
@@ -311,6 +346,69 @@ class TestAllTeamsCalculations:
             assert 'error' not in result
 
 
+class TestParallelGeneration:
+    """Test that the process-pool card generation matches the serial run"""
+
+    @pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(),
+                        reason="parallel generation needs the fork start method")
+    def test_parallel_matches_serial(self, calculator, sample_league_file, capsys):
+        from fantasy_wrapped_calculator import FantasyWrappedCalculator
+
+        serial = calculator.generate_all_cards()
+        serial_log = capsys.readouterr().out
+        parallel = FantasyWrappedCalculator(data_file=sample_league_file).generate_all_cards(workers=3)
+        parallel_log = capsys.readouterr().out
+
+        for cards in list(serial.values()) + list(parallel.values()):
+            cards.pop('generated_at')
+        assert list(parallel) == list(serial)
+        assert parallel == serial
+
+        # Same per-team progress output, in the same order (cache hits in workers aren't counted)
+        def progress(log):
+            return log.split('=== PASS 1')[1].split('Optimal lineup cache')[0]
+        assert progress(parallel_log) == progress(serial_log)
+
+
+class TestSelectiveCards:
+    """Test computing only the requested cards"""
+
+    def test_single_card_computes_only_its_inputs(self, calculator):
+        team_key = list(calculator.teams.keys())[0]
+        result = calculator.get_cards([team_key], ['card_4_story'])
+
+        assert list(result) == [team_key]
+        assert list(result[team_key]) == ['card_4_story']
+        assert 'error' not in result[team_key]['card_4_story']
+        computed = {card_id: list(teams) for card_id, teams in calculator._card_cache.items()}
+        assert computed == {'card_1_overview': [], 'card_2_ledger': [team_key],
+                            'card_3_lineups': [team_key], 'card_4_story': [team_key]}
+        assert calculator._archetype_assignments is None
+
+    def test_matches_and_feeds_full_generation(self, calculator, sample_league_file):
+        from fantasy_wrapped_calculator import FantasyWrappedCalculator
+
+        team_key = list(calculator.teams.keys())[2]
+        selected = calculator.get_cards([team_key], ['card_1_overview', 'card_3_lineups'])[team_key]
+        full = FantasyWrappedCalculator(data_file=sample_league_file).generate_all_cards()
+        expected = next(m['cards'] for m in full.values() if m['manager_id'] == team_key)
+        assert selected['card_1_overview'] == expected['card_1_overview']
+        assert selected['card_3_lineups'] == expected['card_3_lineups']
+
+        # Later calls reuse the cached cards
+        results = calculator.generate_all_cards()
+        cards = next(m['cards'] for m in results.values() if m['manager_id'] == team_key)
+        assert cards['card_3_lineups'] is selected['card_3_lineups']
+        assert calculator.get_cards([team_key], ['card_1_overview'])[team_key]['card_1_overview'] is \
+            cards['card_1_overview']
+
+    def test_unknown_ids_rejected(self, calculator):
+        with pytest.raises(ValueError):
+            calculator.get_cards(card_ids=['card_5_accounting'])
+        with pytest.raises(ValueError):
+            calculator.get_cards(team_keys=['not.a.team'])
+
+
 class TestSnakeDraftVsRdAvg:
     """Test vs Rd Avg (Points Above Round Average) calculation for snake drafts"""
 
@@ -0,0 +1,60 @@
+"""
+Tests for the append-only checkpoint journal
+
+Ensures completed team-weeks survive a crash, replay skips a torn final
+line, and compaction keeps one record per team-week.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from checkpoint_journal import CheckpointJournal
+
+
+class TestCheckpointJournal:
+    """Test checkpoint journal behavior"""
+
+    def test_append_and_replay(self, tmp_path):
+        """Appended team-weeks should replay from a fresh journal object"""
+        path = str(tmp_path / 'league_PARTIAL.jsonl')
+        journal = CheckpointJournal(path, {'league_id': '1', 'season': 2025})
+        journal.append('t.1', 1, {'actual_points': 100.0})
+        journal.append('t.1', 2, {'actual_points': 90.0})
+        journal.close()
+
+        records = CheckpointJournal(path, {'league_id': '1', 'season': 2025}).replay()
+        assert records == {('t.1', 1): {'actual_points': 100.0}, ('t.1', 2): {'actual_points': 90.0}}
+
+    def test_torn_final_line_is_skipped(self, tmp_path):
+        """A crash mid-write should only lose the record being written"""
+        path = str(tmp_path / 'league_PARTIAL.jsonl')
+        journal = CheckpointJournal(path)
+        journal.append('t.1', 1, {'actual_points': 100.0})
+        journal.close()
+        with open(path, 'a') as f:
+            f.write('{"team_id": "t.1", "week": 2, "da')
+
+        assert list(CheckpointJournal(path).replay()) == [('t.1', 1)]
+
+    def test_compact_keeps_latest_record(self, tmp_path):
+        """Compaction should leave one line per team-week plus the header"""
+        path = str(tmp_path / 'league_PARTIAL.jsonl')
+        journal = CheckpointJournal(path)
+        journal.append('t.1', 1, {'actual_points': 0.0})
+        journal.append('t.1', 1, {'actual_points': 100.0})
+
+        records = journal.compact()
+        assert records == {('t.1', 1): {'actual_points': 100.0}}
+        with open(path) as f:
+            assert len(f.readlines()) == 2
+
+    def test_mismatched_header_is_ignored(self, tmp_path):
+        """A journal from another league should not be replayed"""
+        path = str(tmp_path / 'league_PARTIAL.jsonl')
+        journal = CheckpointJournal(path, {'league_id': '1'})
+        journal.append('t.1', 1, {'actual_points': 100.0})
+        journal.close()
+
+        assert CheckpointJournal(path, {'league_id': '2'}).replay() == {}
@@ -0,0 +1,55 @@
+"""
+Tests for delta pull helpers
+
+Ensures only weeks that were final in the existing league file are reused.
+"""
+
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from delta_pull import load_existing_league, last_complete_week, existing_team_weeks
+
+
+def make_existing(current_week, weeks_with_results, teams=('t.1', 't.2')):
+    return {
+        'league': {'league_id': '123', 'season': 2025, 'current_week': current_week},
+        'weekly_data': {
+            team: {f'week_{w}': {'week': w, 'result': 'W'} for w in weeks_with_results}
+            for team in teams
+        },
+    }
+
+
+class TestDeltaPull:
+    """Test delta pull week selection"""
+
+    def test_current_week_of_existing_pull_is_not_reused(self):
+        """The week in progress when the file was pulled may have changed since"""
+        existing = make_existing(current_week=5, weeks_with_results=range(1, 6))
+        assert last_complete_week(existing, ['t.1', 't.2'], max_week=14) == 4
+
+    def test_stops_at_first_incomplete_week(self):
+        """A week missing for any team ends the reusable range"""
+        existing = make_existing(current_week=8, weeks_with_results=[1, 2, 4, 5])
+        assert last_complete_week(existing, ['t.1', 't.2'], max_week=14) == 2
+
+    def test_new_team_disables_reuse(self):
+        """A team absent from the existing file has nothing to reuse"""
+        existing = make_existing(current_week=8, weeks_with_results=range(1, 8))
+        assert last_complete_week(existing, ['t.1', 't.3'], max_week=14) == 0
+
+    def test_existing_team_weeks(self):
+        """Reused team-weeks should be keyed by (team, week)"""
+        existing = make_existing(current_week=4, weeks_with_results=range(1, 4))
+        reused = existing_team_weeks(existing, ['t.1'], 2)
+        assert set(reused) == {('t.1', 1), ('t.1', 2)}
+
+    def test_other_league_file_is_rejected(self, tmp_path):
+        """A file for a different league must not be merged"""
+        path = tmp_path / 'league.json'
+        path.write_text(json.dumps(make_existing(4, [1, 2, 3])))
+        assert load_existing_league(str(path), '123', 2025) is not None
+        assert load_existing_league(str(path), '456', 2025) is None
@@ -0,0 +1,62 @@
+"""
+Tests for the league-wide context shared by the cards
+
+Ensures each league vector is built once per calculator and that the ranks
+and percentiles the cards read from it agree with the cards' own numbers.
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestLeagueContext:
+    """Test league vectors and ranking helpers"""
+
+    def test_context_is_cached(self, calculator):
+        context = calculator.get_league_context()
+        assert calculator.get_league_context() is context
+        assert context.draft_points is context.draft_points
+        assert set(context.lineup_efficiency) == set(calculator.teams)
+
+    def test_rank_helpers(self, calculator):
+        context = calculator.get_league_context()
+        context.test_values = {'a': 3, 'b': 5, 'c': 5, 'd': 1}
+
+        assert [context.rank('test_values', tk) for tk in 'abcd'] == [3, 1, 2, 4]
+        assert [context.rank('test_values', tk, reverse=False) for tk in 'abcd'] == [2, 3, 4, 1]
+        assert context.tied_rank('test_values', 'c') == (1, True)
+        assert context.tied_rank('test_values', 'a') == (3, False)
+        assert context.percentile('test_values', 'b') == pytest.approx(200 / 3)
+        assert context.average('test_values') == 3.5
+
+    def test_league_lineups_solved_once(self, calculator):
+        """Card 3's league ranking should not re-solve every team's lineups for each team"""
+        solves = []
+        original = calculator._solve_optimal_lineup
+
+        def counting(roster, filter_injured):
+            solves.append(id(roster))
+            return original(roster, filter_injured)
+
+        calculator._solve_optimal_lineup = counting
+        for team_key in calculator.teams:
+            calculator.calculate_card_3(team_key)
+
+        assert len(solves) == len(set(solves)) == len(calculator.teams) * len(calculator.get_regular_season_weeks())
+
+    def test_vectors_match_cards(self, calculator):
+        context = calculator.get_league_context()
+        for team_key in calculator.teams:
+            card_2 = calculator.calculate_card_2(team_key)
+            card_3 = calculator.calculate_card_3(team_key)
+
+            assert card_2['draft']['total_points'] == round(context.draft_points[team_key], 1)
+            assert card_2['waivers']['total_points_started'] == round(context.waiver_points_started[team_key], 1)
+            assert context.waiver_scores[team_key] == pytest.approx(
+                card_2['waivers']['total_points_started'] - card_2['costly_drops']['total_value_given_away']
+            )
+            assert card_3['efficiency']['lineup_efficiency_pct'] == round(context.lineup_efficiency[team_key], 1)
+            assert card_3['timelines']['optimal_lineup']['rank'] == context.rank('optimal_wins', team_key)
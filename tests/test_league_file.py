@@ -0,0 +1,70 @@
+"""
+Tests for league file output
+
+Ensures the compact schema drops only fields the calculator never reads,
+so cards computed from a compact file match the full file.
+"""
+
+import pytest
+import sys
+import os
+import copy
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from league_file import compact_league_data, write_league_file
+
+
+@pytest.fixture
+def full_league_data(sample_league_data):
+    """Sample league data with the raw fields the pullers write in full mode"""
+    data = copy.deepcopy(sample_league_data)
+    for team_weeks in data['weekly_data'].values():
+        for week_data in team_weeks.values():
+            week_data['optimal_lineup'] = {'optimal_points': 0.0, 'optimal_lineup': []}
+            roster = week_data.get('roster', {})
+            for player in roster.get('starters', []) + roster.get('bench', []):
+                player['stats_detail'] = {'player_id': player.get('player_id'), 'total_points': 1.0}
+    return data
+
+
+class TestLeagueFile:
+    """Test compact league file output"""
+
+    def test_compact_drops_unused_fields(self, full_league_data):
+        """stats_detail and optimal_lineup should be removed everywhere"""
+        compact = compact_league_data(full_league_data)
+        text = json.dumps(compact)
+        assert 'stats_detail' not in text
+        assert 'optimal_lineup' not in text
+
+    def test_compact_does_not_modify_input(self, full_league_data):
+        """Compaction should leave the in-memory data intact"""
+        before = json.dumps(full_league_data, sort_keys=True)
+        compact_league_data(full_league_data)
+        assert json.dumps(full_league_data, sort_keys=True) == before
+
+    def test_compact_file_is_smaller_and_unindented(self, full_league_data, tmp_path):
+        """Compact output should be a single line and smaller than full output"""
+        full_path = tmp_path / 'full.json'
+        compact_path = tmp_path / 'compact.json'
+        write_league_file(full_league_data, str(full_path))
+        write_league_file(full_league_data, str(compact_path), compact=True)
+
+        assert compact_path.stat().st_size < full_path.stat().st_size / 2
+        assert compact_path.read_text().count('\n') == 0
+
+    def test_calculator_results_match(self, full_league_data, tmp_path):
+        """Cards computed from the compact file should match the full file"""
+        from fantasy_wrapped_calculator import FantasyWrappedCalculator
+
+        full_path = tmp_path / 'full.json'
+        compact_path = tmp_path / 'compact.json'
+        write_league_file(full_league_data, str(full_path))
+        write_league_file(full_league_data, str(compact_path), compact=True)
+
+        team_key = full_league_data['teams'][0]['team_key']
+        full_card = FantasyWrappedCalculator(data_file=str(full_path)).calculate_card_3(team_key)
+        compact_card = FantasyWrappedCalculator(data_file=str(compact_path)).calculate_card_3(team_key)
+        assert json.dumps(full_card, sort_keys=True, default=str) == json.dumps(compact_card, sort_keys=True, default=str)
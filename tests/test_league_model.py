@@ -0,0 +1,189 @@
+"""
+Tests for the columnar league model
+
+Ensures the interned arrays agree with the nested weekly_data they are built
+from, and that the calculator accessors backed by them still match.
+"""
+
+import pytest
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from league_model import LeagueModel, WIN, LOSS
+from fantasy_wrapped_calculator import FantasyWrappedCalculator
+
+
+class TestLeagueModel:
+    """Test model construction"""
+
+    def test_team_week_matrices(self, sample_weekly_data):
+        model = LeagueModel(sample_weekly_data)
+        team_key = '461.l.123456.t.3'
+        week_data = sample_weekly_data[team_key]['week_5']
+        t = model.team_index[team_key]
+
+        assert model.num_weeks == 14
+        assert model.scores[t][5] == week_data['actual_points']
+        assert model.opponent_scores[t][5] == week_data['opponent_points']
+        assert model.team_keys[model.opponents[t][5]] == week_data['opponent_id']
+        assert model.results[t][5] == (WIN if week_data['result'] == 'W' else LOSS)
+        assert not model.team_played(team_key, 15)
+
+    def test_roster_slot_table(self, sample_weekly_data):
+        model = LeagueModel(sample_weekly_data)
+        team_key = '461.l.123456.t.1'
+        roster = sample_weekly_data[team_key]['week_2']['roster']
+
+        starter_rows = model.roster_rows(team_key, 2, bench=False)
+        bench_rows = model.roster_rows(team_key, 2, starters=False)
+        assert len(starter_rows) == len(roster['starters'])
+        assert len(bench_rows) == len(roster['bench'])
+
+        flex = roster['starters'][6]
+        row = starter_rows[6]
+        assert model.player_ids[model.slot_player[row]] == flex['player_id']
+        assert model.positions[model.slot_position[row]] == 'FLEX'
+        assert model.eligible_positions(model.slot_eligible[row]) == ['RB', 'WR', 'TE']
+        assert model.slot_points[row] == flex['actual_points']
+        assert all(model.slot_starter[r] for r in starter_rows)
+        assert not any(model.slot_starter[r] for r in bench_rows)
+
+    def test_player_points_match_nested_data(self, sample_weekly_data):
+        model = LeagueModel(sample_weekly_data)
+        player = sample_weekly_data['461.l.123456.t.4']['week_9']['roster']['bench'][2]
+        player_id = player['player_id']
+
+        assert model.player_points_by_week[player_id][9] == player['actual_points']
+        expected = sum(model.player_points_by_week[player_id][w] for w in range(3, 8))
+        assert model.player_points_between(player_id, 3, 7) == pytest.approx(expected)
+
+    def test_occupancy_index(self, sample_weekly_data):
+        model = LeagueModel(sample_weekly_data)
+        team_key = '461.l.123456.t.5'
+        starter = sample_weekly_data[team_key]['week_4']['roster']['starters'][1]
+        benched = sample_weekly_data[team_key]['week_4']['roster']['bench'][0]
+
+        listing = model.occupant(starter['player_id'], 4)
+        assert listing.team_key == team_key
+        assert listing.slot == starter['selected_position']
+        assert listing.started and listing.points == starter['actual_points']
+        assert not model.occupant(benched['player_id'], 4).started
+        assert model.occupant(starter['player_id'], 4, '461.l.123456.t.6') is None
+        assert model.occupant('no_such_player', 4) is None
+
+        expected = [
+            (week, p['actual_points'], True)
+            for week in range(2, 9)
+            for p in sample_weekly_data[team_key][f'week_{week}']['roster']['starters']
+            if p['player_id'] == starter['player_id']
+        ]
+        assert model.weeks_with_team(starter['player_id'], team_key, 2, 8, started_only=True) == expected
+
+    def test_occupancy_player_on_two_rosters(self, sample_weekly_data):
+        """A player listed by two teams in one week can be looked up on either"""
+        player = dict(sample_weekly_data['461.l.123456.t.7']['week_6']['roster']['bench'][0])
+        sample_weekly_data['461.l.123456.t.2']['week_6']['roster']['bench'].append(player)
+        model = LeagueModel(sample_weekly_data, sorted(sample_weekly_data))
+
+        assert model.occupant(player['player_id'], 6).team_key == '461.l.123456.t.2'
+        assert model.occupant(player['player_id'], 6, '461.l.123456.t.7').team_key == '461.l.123456.t.7'
+        assert [week for week, _, _ in model.weeks_with_team(player['player_id'], '461.l.123456.t.2', 1, 14)] == [6]
+
+
+class TestModelBackedAccessors:
+    """Calculator accessors should give the same answers as a dict traversal"""
+
+    def test_team_stats(self, calculator):
+        team_key = '461.l.123456.t.6'
+        stats = calculator.calculate_team_stats_from_weekly_data(team_key)
+
+        weeks = calculator.weekly_data[team_key].values()
+        assert stats['points_for'] == round(sum(w['actual_points'] for w in weeks), 2)
+        assert stats['wins'] + stats['losses'] + stats['ties'] == 14
+
+    def test_rostered_players(self, calculator):
+        expected = {
+            str(p['player_id'])
+            for weeks in calculator.weekly_data.values()
+            for p in weeks['week_3']['roster']['starters'] + weeks['week_3']['roster']['bench']
+        }
+        assert calculator.get_rostered_players(3) == expected
+
+    def test_available_fas_excludes_rostered(self, calculator):
+        rostered = calculator.get_rostered_players(4)
+        available = calculator.get_available_fas(4)
+        assert all(player_id not in rostered for player_id, _ in available)
+        assert [pts for _, pts in available] == sorted((pts for _, pts in available), reverse=True)
+
+    def test_primary_position_matches_roster_scan(self, calculator):
+        """The position index should agree with a scan of every roster appearance"""
+        counts = {}
+        for weeks in calculator.weekly_data.values():
+            for week_data in weeks.values():
+                roster = week_data['roster']
+                for p in roster['starters'] + roster['bench']:
+                    if p.get('eligible_positions'):
+                        player_counts = counts.setdefault(str(p['player_id']), {})
+                        primary = p['eligible_positions'][0]
+                        player_counts[primary] = player_counts.get(primary, 0) + 1
+
+        for player_id, player_counts in counts.items():
+            assert calculator._get_player_primary_position(player_id) == max(player_counts, key=player_counts.get)
+        assert calculator._get_player_primary_position('no_such_player') == 'FLEX'
+
+    def test_position_index_weeks_and_eligibility(self, calculator):
+        player = calculator.weekly_data['461.l.123456.t.1']['week_2']['roster']['starters'][6]
+        position = calculator.player_positions[player['player_id']]
+
+        assert set(player['eligible_positions']) <= position.eligible
+        assert position.first_week <= 2 <= position.last_week
+
+    def test_available_fas_position_filter(self, sample_league_data, tmp_path):
+        """Players off every roster for a few weeks are available then, filtered by position"""
+        for week in range(3, 7):
+            bench = sample_league_data['weekly_data']['461.l.123456.t.3'][f'week_{week}']['roster']['bench']
+            bench[:] = [p for p in bench if p['player_id'] not in ('2300', '2301')]  # an RB and a WR
+        league_file = tmp_path / 'league.json'
+        league_file.write_text(json.dumps(sample_league_data))
+        calculator = FantasyWrappedCalculator(data_file=str(league_file))
+
+        assert [player_id for player_id, _ in calculator.get_available_fas(4)] == ['2301', '2300']
+        available_rbs = calculator.get_available_fas(4, 'RB')
+        assert [player_id for player_id, _ in available_rbs] == ['2300']
+        assert available_rbs[0][1] == pytest.approx(calculator.get_ros_points('2300', 4))
+        assert calculator.get_best_available_fa(4, 'WR')[0] == '2301'
+        assert calculator.get_available_fas(4, 'NOT_A_POSITION') == []
+        assert calculator.get_available_fas(8) == []
+
+    def test_injured_weeks_match_roster_scan(self, sample_league_data, tmp_path):
+        for week, status in ((2, 'O'), (3, 'IR'), (4, 'Q'), (5, 'D')):
+            sample_league_data['weekly_data']['461.l.123456.t.8'][f'week_{week}']['roster']['bench'][1]['status'] = status
+        league_file = tmp_path / 'league.json'
+        league_file.write_text(json.dumps(sample_league_data))
+        calculator = FantasyWrappedCalculator(data_file=str(league_file))
+
+        injured = {}
+        for week in calculator.get_regular_season_weeks():
+            listed = set()
+            for tk in calculator.teams:
+                roster = calculator.weekly_data[tk][f'week_{week}']['roster']
+                for p in roster['starters'] + roster['bench']:
+                    if p['player_id'] not in listed:
+                        listed.add(p['player_id'])
+                        if p.get('status') in ('O', 'IR', 'D'):
+                            injured[p['player_id']] = injured.get(p['player_id'], 0) + 1
+
+        context = calculator.get_league_context()
+        assert injured
+        for player_id in calculator.player_points_by_week:
+            assert context.injured_weeks(player_id) == injured.get(player_id, 0)
+
+    def test_ros_points_from_running_totals(self, calculator):
+        player_id = calculator.weekly_data['461.l.123456.t.2']['week_1']['roster']['starters'][0]['player_id']
+        weeks = calculator.player_points_by_week[player_id]
+        expected = sum(pts for week, pts in weeks.items() if week > 6)
+        assert calculator.get_ros_points(player_id, 6) == pytest.approx(expected)
+        assert calculator.get_ros_points(player_id, calculator.league['current_week']) == 0
@@ -0,0 +1,129 @@
+"""
+Tests for the league-wide roster batch
+
+Parses a raw Yahoo league roster collection and checks that a team missing
+from the response is fetched on its own rather than given an empty roster.
+"""
+
+import pytest
+import sys
+import os
+import json
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip('dotenv')
+pytest.importorskip('yahoo_oauth')
+pytest.importorskip('yahoo_fantasy_api')
+
+from data_puller import FantasyWrappedDataPuller
+from response_cache import ResponseCache
+
+
+def raw_player(player_id, name, eligible, selected, status=None):
+    """One player as Yahoo nests it in a roster collection"""
+    metadata = [
+        {'player_key': f'449.p.{player_id}'},
+        {'player_id': str(player_id)},
+        {'name': {'full': name}},
+        {'position_type': 'O'},
+        {'eligible_positions': [{'position': p} for p in eligible]},
+    ]
+    if status:
+        metadata.append({'status': status})
+    return {'player': [metadata, {'selected_position': [{'coverage_type': 'week', 'week': '1'},
+                                                        {'position': selected}]}]}
+
+
+def raw_rosters(teams):
+    """A league/{key}/teams/roster response for {team_key: [raw players]}"""
+    teams_dict = {
+        str(i): {'team': [
+            [{'team_key': team_key}, {'team_id': str(i + 1)}],
+            {'roster': {'coverage_type': 'week', 'week': '1', '0': {
+                'players': dict({str(j): p for j, p in enumerate(players)}, count=len(players))
+            }}},
+        ]}
+        for i, (team_key, players) in enumerate(teams.items())
+    }
+    teams_dict['count'] = len(teams)
+    return {'fantasy_content': {'league': [{'league_key': '449.l.1'}, {'teams': teams_dict}]}}
+
+
+ROSTERS = raw_rosters({
+    '449.l.1.t.1': [
+        raw_player(30123, 'Starter Back', ['RB', 'W/R/T'], 'RB'),
+        raw_player(30124, 'Bench Receiver', ['WR', 'W/R/T'], 'BN', status='Q'),
+    ],
+    '449.l.1.t.2': [raw_player(30125, 'Only Quarterback', ['QB'], 'QB')],
+})
+
+
+@pytest.fixture
+def puller():
+    """A puller whose roster and stats calls are served from ROSTERS"""
+    puller = FantasyWrappedDataPuller('1', 2024, api_base='http://127.0.0.1:0', compact=True)
+    puller.lg = SimpleNamespace(league_id='449.l.1', yhandler=SimpleNamespace(get=None))
+    puller._cached_api_call = lambda endpoint, *args, **kwargs: ROSTERS
+    puller.get_player_stats_for_week = lambda player_ids, week: {
+        pid: {'points': float(pid % 100), 'stats': {}} for pid in player_ids
+    }
+    return puller
+
+
+class TestLeagueRosters:
+    """Test parsing and the per-team fallback of the roster batch"""
+
+    def test_parse_league_rosters(self, puller):
+        rosters = puller._parse_league_rosters(ROSTERS)
+
+        assert set(rosters) == {'449.l.1.t.1', '449.l.1.t.2'}
+        starter, bench = rosters['449.l.1.t.1']
+        assert starter == {
+            'player_id': 30123, 'name': 'Starter Back', 'position_type': 'O',
+            'eligible_positions': ['RB', 'W/R/T'], 'selected_position': 'RB', 'status': '',
+        }
+        assert bench['selected_position'] == 'BN'
+        assert bench['status'] == 'Q'
+        assert [p['player_id'] for p in rosters['449.l.1.t.2']] == [30125]
+
+    def test_parse_without_teams(self, puller):
+        assert puller._parse_league_rosters({'fantasy_content': {'league': [{}]}}) is None
+
+    def test_missing_team_fetched_individually(self, puller):
+        team_ids = ['449.l.1.t.1', '449.l.1.t.2', '449.l.1.t.3']
+        rosters = puller.get_league_rosters_with_stats(1, team_ids)
+
+        assert set(rosters) == {'449.l.1.t.1', '449.l.1.t.2'}
+        assert rosters['449.l.1.t.1']['total_starter_points'] == 23.0
+        assert rosters['449.l.1.t.1']['total_bench_points'] == 24.0
+
+        fetched = []
+        fallback = {'starters': [], 'bench': [], 'total_starter_points': 0.0, 'total_bench_points': 0.0}
+        puller.get_weekly_scores = lambda team_id, week: {'actual_points': 0.0}
+        puller.get_weekly_roster_with_stats = lambda team_id, week: fetched.append(team_id) or fallback
+
+        puller._fetch_week_batched(team_ids, 1)
+        assert fetched == ['449.l.1.t.3']
+
+    def test_only_complete_past_weeks_are_immutable(self, tmp_path):
+        puller = FantasyWrappedDataPuller('1', 2024, api_base='http://127.0.0.1:0',
+                                          response_cache=ResponseCache(str(tmp_path)))
+        puller.lg = SimpleNamespace(league_id='449.l.1')
+        puller.current_week = 5
+        no_players = raw_rosters({'449.l.1.t.1': [], '449.l.1.t.2': []})
+        validate = lambda body: any((puller._parse_league_rosters(body) or {}).values())
+
+        for week, response in ((1, no_players), (2, ROSTERS), (3, [])):
+            puller._cached_api_call('league_rosters', lambda: response, cache_week=week, validate=validate)
+
+        def expires_at(week):
+            cache = puller.response_cache
+            path = cache._entry_path(cache.make_key('yahoo', 'league_rosters', {'league': '449.l.1', 'week': week}))
+            with open(path) as f:
+                return json.load(f)['expires_at']
+
+        assert expires_at(1) is not None
+        assert expires_at(2) is None
+        assert expires_at(3) is not None
@@ -0,0 +1,76 @@
+"""
+Tests for the binary league snapshot
+
+Ensures a snapshot-loaded calculator matches a JSON-loaded one and that a
+stale or damaged snapshot is never used.
+"""
+
+import pytest
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fantasy_wrapped_calculator import FantasyWrappedCalculator
+from league_snapshot import snapshot_path
+
+
+@pytest.fixture
+def league_file(sample_league_data, tmp_path):
+    path = str(tmp_path / 'league.json')
+    with open(path, 'w') as f:
+        json.dump(sample_league_data, f)
+    return path
+
+
+class TestLeagueSnapshot:
+    """Test snapshot round trips and staleness checks"""
+
+    def test_snapshot_matches_json(self, league_file, capsys):
+        parsed = FantasyWrappedCalculator(data_file=league_file, use_snapshot=True)
+        assert os.path.exists(snapshot_path(league_file))
+        capsys.readouterr()
+
+        loaded = FantasyWrappedCalculator(data_file=league_file, use_snapshot=True)
+        assert 'Loaded snapshot' in capsys.readouterr().out
+        with open(league_file) as f:
+            assert json.loads(json.dumps(loaded.data, default=dict)) == json.load(f)
+        assert loaded.model.snapshot_fields() == parsed.model.snapshot_fields()
+        assert loaded.player_positions == parsed.player_positions
+
+        team_key = list(parsed.teams.keys())[0]
+        assert loaded.calculate_card_3(team_key) == parsed.calculate_card_3(team_key)
+        assert loaded.get_available_fas(5) == parsed.get_available_fas(5)
+
+    def test_stale_snapshot_not_used(self, league_file, sample_league_data, capsys):
+        FantasyWrappedCalculator(data_file=league_file, use_snapshot=True)
+
+        sample_league_data['weekly_data']['461.l.123456.t.1']['week_3']['actual_points'] += 1.5
+        with open(league_file, 'w') as f:
+            json.dump(sample_league_data, f)
+        capsys.readouterr()
+
+        calc = FantasyWrappedCalculator(data_file=league_file, use_snapshot=True)
+        assert 'Loaded snapshot' not in capsys.readouterr().out
+        assert calc.weekly_data['461.l.123456.t.1']['week_3']['actual_points'] == \
+            sample_league_data['weekly_data']['461.l.123456.t.1']['week_3']['actual_points']
+
+        # Rewritten for the new contents
+        FantasyWrappedCalculator(data_file=league_file, use_snapshot=True)
+        assert 'Loaded snapshot' in capsys.readouterr().out
+
+    def test_damaged_snapshot_ignored(self, league_file, capsys):
+        FantasyWrappedCalculator(data_file=league_file, use_snapshot=True)
+        path = snapshot_path(league_file)
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) // 2)
+        capsys.readouterr()
+
+        calc = FantasyWrappedCalculator(data_file=league_file, use_snapshot=True)
+        assert 'Loaded snapshot' not in capsys.readouterr().out
+        assert len(calc.teams) == 12
+
+    def test_snapshot_is_opt_in(self, league_file):
+        FantasyWrappedCalculator(data_file=league_file)
+        assert not os.path.exists(snapshot_path(league_file))
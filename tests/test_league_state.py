@@ -0,0 +1,133 @@
+"""
+Tests for the incremental league state
+
+Ensures folding in one week at a time gives the same cards as a full run,
+that only the new week is solved, and that a stale state is rebuilt.
+"""
+
+import sys
+import os
+import copy
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fantasy_wrapped_calculator import FantasyWrappedCalculator
+from league_model import transaction_week
+import league_state
+from league_state import LeagueState, apply_delta_file, extract_week_delta, state_path
+
+
+def truncate(data, week):
+    """League data as it looked after a given week"""
+    data = copy.deepcopy(data)
+    data['league']['current_week'] = week
+    data['weekly_data'] = {
+        team_key: {key: entry for key, entry in weeks.items() if int(key.split('_')[1]) <= week}
+        for team_key, weeks in data['weekly_data'].items()
+    }
+    data['transactions'] = [
+        t for t in data['transactions']
+        if transaction_week(t['timestamp'], data['league']['season']) <= week
+    ]
+    return data
+
+
+def generate(calc):
+    results = calc.generate_all_cards()
+    for cards in results.values():
+        cards.pop('generated_at')
+    return results
+
+
+class TestLeagueState:
+    """Test folding weekly deltas into persisted aggregates"""
+
+    def test_weekly_deltas_match_full_run(self, sample_league_data, tmp_path, capsys):
+        league_file = str(tmp_path / 'league.json')
+        delta_file = str(tmp_path / 'delta.json')
+        with open(league_file, 'w') as f:
+            json.dump(truncate(sample_league_data, 8), f)
+        FantasyWrappedCalculator(data_file=league_file).use_league_state()
+        assert os.path.exists(state_path(league_file))
+
+        for week in range(9, 15):
+            with open(delta_file, 'w') as f:
+                json.dump(extract_week_delta(truncate(sample_league_data, week), week), f)
+            assert apply_delta_file(league_file, delta_file) == week
+
+            calc = FantasyWrappedCalculator(data_file=league_file)
+            state = calc.use_league_state()
+            assert state.through_week == week
+            assert 'reused weeks 1-' + str(week - 1) in capsys.readouterr().out
+
+        incremental = generate(calc)
+        assert calc.get_lineup_cache_stats()['misses'] == len(calc.teams)
+
+        with open(str(tmp_path / 'full.json'), 'w') as f:
+            json.dump(sample_league_data, f)
+        full_calc = FantasyWrappedCalculator(data_file=str(tmp_path / 'full.json'))
+        assert incremental == generate(full_calc)
+
+        standings = state.standings()
+        for team_key in calc.teams:
+            totals = full_calc.calculate_team_stats_from_weekly_data(team_key)
+            assert standings[team_key]['points_for'] == totals['points_for']
+            assert standings[team_key]['wins'] == totals['wins']
+            assert standings[team_key]['all_play_wins'] + standings[team_key]['all_play_losses'] + \
+                standings[team_key]['all_play_ties'] == 14 * (len(calc.teams) - 1)
+
+    def test_stale_state_rebuilt(self, sample_league_data, tmp_path, capsys):
+        league_file = str(tmp_path / 'league.json')
+        with open(league_file, 'w') as f:
+            json.dump(sample_league_data, f)
+        FantasyWrappedCalculator(data_file=league_file).use_league_state()
+
+        # Stat correction to an already folded week
+        sample_league_data['weekly_data']['461.l.123456.t.1']['week_3']['actual_points'] += 1.5
+        with open(league_file, 'w') as f:
+            json.dump(sample_league_data, f)
+        calc = FantasyWrappedCalculator(data_file=league_file)
+        assert not LeagueState.load(state_path(league_file), None, 2025).is_current(calc)
+
+        capsys.readouterr()
+        calc.use_league_state()
+        assert 'rebuilding' in capsys.readouterr().out
+        assert LeagueState.load(state_path(league_file), None, 2025).is_current(calc)
+
+    def test_bench_correction_rebuilds_state(self, sample_league_data, tmp_path, capsys):
+        """A bench player's correction leaves the team score alone but must still invalidate the state"""
+        league_file = str(tmp_path / 'league.json')
+        with open(league_file, 'w') as f:
+            json.dump(sample_league_data, f)
+        FantasyWrappedCalculator(data_file=league_file).use_league_state()
+
+        sample_league_data['weekly_data']['461.l.123456.t.1']['week_3']['roster']['bench'][0]['actual_points'] += 40
+        with open(league_file, 'w') as f:
+            json.dump(sample_league_data, f)
+        calc = FantasyWrappedCalculator(data_file=league_file)
+        assert not LeagueState.load(state_path(league_file), None, 2025).is_current(calc)
+
+        capsys.readouterr()
+        calc.use_league_state()
+        assert 'rebuilding' in capsys.readouterr().out
+
+        with open(str(tmp_path / 'full.json'), 'w') as f:
+            json.dump(sample_league_data, f)
+        assert generate(calc) == generate(FantasyWrappedCalculator(data_file=str(tmp_path / 'full.json')))
+
+    def test_refresh_hashes_each_week_once(self, sample_league_data, tmp_path, monkeypatch):
+        """Earlier weeks are hashed once to check them; only the new week is hashed when folding"""
+        league_file = str(tmp_path / 'league.json')
+        with open(league_file, 'w') as f:
+            json.dump(truncate(sample_league_data, 9), f)
+        FantasyWrappedCalculator(data_file=league_file).use_league_state()
+
+        with open(league_file, 'w') as f:
+            json.dump(truncate(sample_league_data, 10), f)
+        hashed = []
+        week_fingerprint = league_state._week_fingerprint
+        monkeypatch.setattr(league_state, '_week_fingerprint',
+                            lambda calc, week: hashed.append(week) or week_fingerprint(calc, week))
+        FantasyWrappedCalculator(data_file=league_file).use_league_state()
+        assert hashed == list(range(1, 11))
@@ -0,0 +1,69 @@
+"""
+Tests for the exact optimal lineup engine
+
+Covers the slot orders and multi-eligibility cases the old greedy solver got
+wrong, plus injury filtering and the batch entry point.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lineup_engine import assign_slots, optimal_lineup, optimal_lineups
+
+
+def player(player_id, points, eligible, selected='BN', status=''):
+    return {'player_id': player_id, 'actual_points': points, 'eligible_positions': eligible,
+            'selected_position': selected, 'status': status}
+
+
+class TestLineupEngine:
+    """Test optimal slot assignment"""
+
+    def test_flex_listed_before_rb(self):
+        """A FLEX slot listed first must not take the RB the RB slot needs"""
+        roster = {
+            'starters': [
+                player('1', 10, ['RB', 'W/R/T'], 'W/R/T'),
+                player('2', 5, ['RB', 'W/R/T'], 'RB'),
+            ],
+            'bench': [player('3', 20, ['RB', 'W/R/T']), player('4', 15, ['WR', 'W/R/T'])],
+        }
+        result = optimal_lineup(roster)
+
+        assert result['optimal_points'] == 35
+        assert [p['player_id'] for p in result['optimal_lineup']] == ['4', '3']
+        assert result['actual_points'] == 15
+        assert result['points_left_on_bench'] == 20
+
+    def test_superflex_reassigns_multi_eligible_player(self):
+        """A later player can claim a slot by moving an earlier pick to another slot it fits"""
+        slots = ['Q/W/R/T', 'WR']
+        players = [
+            player('qb', 30, ['QB', 'Q/W/R/T']),
+            player('rbwr', 25, ['RB', 'WR', 'Q/W/R/T']),
+            player('wr', 20, ['WR', 'Q/W/R/T']),
+        ]
+        owner = assign_slots(slots, players)
+        assert sorted(players[i]['player_id'] for i in owner) == ['qb', 'rbwr']
+        assert players[owner[0]]['player_id'] == 'qb'
+
+    def test_negative_and_injured_players_sit(self):
+        roster = {
+            'starters': [
+                player('def', -4, ['DEF'], 'DEF'),
+                player('wr1', 12, ['WR'], 'WR', status='O'),
+                player('ir', 30, ['WR'], 'IR'),
+            ],
+            'bench': [player('wr2', 8, ['WR'])],
+        }
+        assert optimal_lineup(roster, filter_injured=False)['optimal_points'] == 12
+        assert optimal_lineup(roster, filter_injured=True)['optimal_points'] == 8
+
+    def test_batch_matches_single(self, sample_weekly_data):
+        rosters = [week['roster'] for week in sample_weekly_data['461.l.123456.t.5'].values()]
+        batch = optimal_lineups(rosters, filter_injured=False)
+        assert [r['optimal_points'] for r in batch] == [
+            optimal_lineup(roster, filter_injured=False)['optimal_points'] for roster in rosters
+        ]
@@ -0,0 +1,73 @@
+"""
+Tests for the token bucket rate limiter
+
+Ensures the shared request budget allows bursts up to capacity and
+throttles sustained calls to the configured rate.
+"""
+
+import pytest
+import sys
+import os
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Test token bucket behavior"""
+
+    def test_burst_up_to_capacity_does_not_wait(self):
+        """A full bucket should hand out `capacity` tokens immediately"""
+        bucket = TokenBucket(rate=10, capacity=5)
+        waits = [bucket.acquire() for _ in range(5)]
+        assert all(w == 0 for w in waits)
+
+    def test_try_acquire_fails_when_empty(self):
+        """try_acquire should not block on an empty bucket"""
+        bucket = TokenBucket(rate=1, capacity=1)
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+    def test_sustained_rate_is_enforced(self):
+        """Calls beyond the burst should be paced at the configured rate"""
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+        # 1 token up front, 5 more at 50/s = ~0.1s
+        assert elapsed >= 0.08
+
+    def test_shared_across_threads(self):
+        """Concurrent callers should share one budget"""
+        bucket = TokenBucket(rate=100, capacity=2)
+        start = time.monotonic()
+
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(12)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 2 burst tokens + 10 at 100/s = ~0.1s regardless of thread count
+        assert time.monotonic() - start >= 0.08
+
+    def test_rejects_non_positive_rate(self):
+        """Rate must be positive"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_default_capacity(self):
+        """Capacity defaults to the rate, but always holds at least one token"""
+        assert TokenBucket(rate=4).capacity == 4
+        assert TokenBucket(rate=0.5).capacity == 1
+
+    def test_rejects_more_than_capacity(self):
+        """Asking for more tokens than the bucket holds should fail instead of blocking forever"""
+        bucket = TokenBucket(rate=10, capacity=2)
+        with pytest.raises(ValueError):
+            bucket.acquire(3)
+        assert bucket.acquire(2) == 0
@@ -0,0 +1,98 @@
+"""
+Tests for the persistent API response cache
+
+Ensures responses round-trip through disk, expire after their TTL unless
+immutable, and that the size cap evicts least recently used entries.
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test response cache behavior"""
+
+    def test_round_trip_and_counters(self, tmp_path):
+        """A stored response should be served back and counted as a hit"""
+        cache = ResponseCache(str(tmp_path))
+        assert cache.get('yahoo', 'scoreboard', {'week': 1}) is None
+
+        cache.put('yahoo', 'scoreboard', {'teams': [1, 2]}, params={'week': 1}, ttl=60)
+        assert cache.get('yahoo', 'scoreboard', {'week': 1}) == {'teams': [1, 2]}
+
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['writes'] == 1
+
+    def test_params_are_part_of_the_key(self, tmp_path):
+        """Different weeks of the same endpoint should not collide"""
+        cache = ResponseCache(str(tmp_path))
+        cache.put('sleeper', '/matchups', ['w1'], params={'week': 1}, ttl=60)
+        assert cache.get('sleeper', '/matchups', {'week': 2}) is None
+
+    def test_expired_entries_miss(self, tmp_path):
+        """Entries past their TTL should be treated as misses"""
+        cache = ResponseCache(str(tmp_path))
+        cache.put('yahoo', 'roster', ['p1'], ttl=-1)
+        assert cache.get('yahoo', 'roster') is None
+
+    def test_immutable_entries_never_expire(self, tmp_path):
+        """Completed weeks should be served regardless of TTL"""
+        cache = ResponseCache(str(tmp_path))
+        cache.put('yahoo', 'roster', ['p1'], ttl=-1, immutable=True)
+        assert cache.get('yahoo', 'roster') == ['p1']
+
+    def test_fetch_does_not_cache_failures(self, tmp_path):
+        """A None result should be retried on the next fetch"""
+        cache = ResponseCache(str(tmp_path))
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            return None if len(calls) == 1 else {'ok': True}
+
+        assert cache.fetch('sleeper', '/league/1', flaky, ttl=60) is None
+        assert cache.fetch('sleeper', '/league/1', flaky, ttl=60) == {'ok': True}
+        assert cache.fetch('sleeper', '/league/1', flaky, ttl=60) == {'ok': True}
+        assert len(calls) == 2
+
+    def test_fetch_decides_immutability_from_response(self, tmp_path):
+        """An immutable callable should keep incomplete responses on the TTL"""
+        cache = ResponseCache(str(tmp_path))
+        cache.fetch('yahoo', 'roster', lambda: [], params={'week': 1}, ttl=-1, immutable=bool)
+        cache.fetch('yahoo', 'roster', lambda: ['p1'], params={'week': 2}, ttl=-1, immutable=bool)
+        assert cache.get('yahoo', 'roster', {'week': 1}) is None
+        assert cache.get('yahoo', 'roster', {'week': 2}) == ['p1']
+
+    def test_lru_eviction_respects_size_cap(self, tmp_path):
+        """Least recently used entries should be evicted past the size cap"""
+        cache = ResponseCache(str(tmp_path), max_bytes=1200)
+        payload = 'x' * 300
+
+        cache.put('yahoo', 'a', payload, immutable=True)
+        cache.put('yahoo', 'b', payload, immutable=True)
+        # Make 'a' older than 'b', then touch it so 'b' becomes least recently used
+        past = time.time() - 100
+        os.utime(cache._entry_path(cache.make_key('yahoo', 'a')), (past, past))
+        os.utime(cache._entry_path(cache.make_key('yahoo', 'b')), (past - 50, past - 50))
+        assert cache.get('yahoo', 'a') == payload
+
+        cache.put('yahoo', 'c', payload, immutable=True)
+        cache.put('yahoo', 'd', payload, immutable=True)
+
+        assert cache.stats()['evictions'] >= 1
+        assert cache.get('yahoo', 'b') is None
+        assert cache.get('yahoo', 'd') == payload
+
+    def test_disabled_cache_always_misses(self):
+        """No cache directory means every lookup goes to the API"""
+        cache = ResponseCache(None)
+        cache.put('yahoo', 'settings', {'name': 'League'}, ttl=60)
+        assert not cache.enabled
+        assert cache.get('yahoo', 'settings') is None
@@ -0,0 +1,83 @@
+"""
+Tests for compact roster entries
+
+Ensures a RosterEntry reads like the dict it replaces, that league JSON and
+snapshots decode straight into entries, and that the calculator's rosters
+are RosterEntry objects.
+"""
+
+import pytest
+import sys
+import os
+import json
+import marshal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from roster_entry import RosterEntry, pack_rosters, roster_object_hook, unpack_rosters
+
+
+ENTRY = {
+    'player_id': '123', 'player_name': 'Test Player', 'position': 'RB',
+    'selected_position': 'RB', 'eligible_positions': ['RB', 'W/R/T'],
+    'actual_points': 12.5, 'stats_detail': {'rush_yds': 80},
+}
+
+
+def decode(data):
+    return json.loads(json.dumps(data), object_hook=roster_object_hook())
+
+
+class TestRosterEntry:
+    """Test the read-only mapping view and decoding"""
+
+    def test_reads_like_dict(self):
+        player = decode({'roster': {'starters': [ENTRY], 'bench': []}})['roster']['starters'][0]
+        assert isinstance(player, RosterEntry)
+        assert player['player_id'] == '123'
+        assert player.get('actual_points', 0) == 12.5
+        assert player['stats_detail'] == {'rush_yds': 80}
+        assert player['eligible_positions'] == ('RB', 'W/R/T')
+
+        # Missing fields behave like a dict without the key
+        assert 'status' not in player
+        assert player.get('status', '') == ''
+        assert player.get('projected_points') is None
+        with pytest.raises(KeyError):
+            player['status']
+
+        assert dict(player) == dict(ENTRY, eligible_positions=('RB', 'W/R/T'))
+        assert len(player) == len(ENTRY)
+        with pytest.raises(AttributeError):
+            player.unknown_field = 1
+
+    def test_decode_shares_eligibility_and_skips_other_dicts(self):
+        data = decode({
+            'weekly_data': {tk: {'week_1': {'roster': {'starters': [dict(ENTRY, player_id=str(i)) for i in range(3)]}}}
+                            for tk in ('t.1', 't.2')},
+            'transactions': [{'player_id': '123', 'type': 'add'}],
+        })
+        players = [p for weeks in data['weekly_data'].values() for p in weeks['week_1']['roster']['starters']]
+        assert all(p['eligible_positions'] is players[0]['eligible_positions'] for p in players)
+        assert type(data['transactions'][0]) is dict
+
+    def test_pack_round_trip(self):
+        bare = {'player_id': '9', 'selected_position': 'BN'}
+        data = decode({
+            'weekly_data': {'t.1': {'week_1': {'roster': {'starters': [ENTRY], 'bench': [bare]}}}},
+            'draft': [{'player_id': '9', 'round': 1}],
+        })
+        packed, rosters = pack_rosters(data)
+        packed, rosters = marshal.loads(marshal.dumps((packed, rosters)))  # as the snapshot stores them
+
+        unpacked = unpack_rosters(packed, rosters)
+        roster = unpacked['weekly_data']['t.1']['week_1']['roster']
+        assert all(isinstance(p, RosterEntry) for p in roster['starters'] + roster['bench'])
+        assert dict(roster['starters'][0]) == dict(data['weekly_data']['t.1']['week_1']['roster']['starters'][0])
+        assert dict(roster['bench'][0]) == bare
+        assert unpacked['draft'] == data['draft']
+
+    def test_calculator_rosters_are_entries(self, calculator):
+        team_key = list(calculator.teams.keys())[0]
+        roster = calculator.weekly_data[team_key]['week_1']['roster']
+        assert all(isinstance(p, RosterEntry) for p in roster['starters'] + roster['bench'])
@@ -0,0 +1,137 @@
+"""
+Tests for the multi-league Sleeper batch puller
+
+Replays two small leagues from the stand-in server and checks that the
+batch finds the user's leagues, shares one NFL state lookup, and writes
+one league file per league.
+"""
+
+import pytest
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip('requests')
+
+from api_replay import FixtureBundle, StandInServer
+from response_cache import ResponseCache
+from sleeper_player_store import SleeperPlayerStore
+from sleeper_batch_puller import SleeperBatchPuller
+from sleeper_data_puller import SleeperDataPuller
+
+
+LEAGUE_IDS = ['1001', '1002']
+
+
+def record_league(bundle, league_id):
+    """Record a two-team league with two played weeks"""
+    bundle.save('sleeper', f'/league/{league_id}', {
+        'name': f'League {league_id}', 'season': '2025', 'total_rosters': 2,
+        'settings': {'playoff_week_start': 3}, 'roster_positions': ['QB', 'WR', 'BN'],
+    })
+    bundle.save('sleeper', f'/league/{league_id}/users', [
+        {'user_id': f'u{i}', 'display_name': f'User {i}', 'metadata': {}} for i in (1, 2)
+    ])
+    bundle.save('sleeper', f'/league/{league_id}/rosters', [
+        {'roster_id': i, 'owner_id': f'u{i}', 'settings': {'wins': 1}} for i in (1, 2)
+    ])
+    for week in range(1, 18):
+        matchups = [
+            {'roster_id': i, 'matchup_id': 1, 'points': 100 + i * week,
+             'starters': [str(10 + i)], 'players': [str(10 + i), str(20 + i)],
+             'players_points': {str(10 + i): 10.0 * week, str(20 + i): 5.0}}
+            for i in (1, 2)
+        ] if week <= 2 else []
+        bundle.save('sleeper', f'/league/{league_id}/matchups/{week}', matchups)
+        bundle.save('sleeper', f'/league/{league_id}/transactions/{week}', [])
+    bundle.save('sleeper', f'/league/{league_id}/drafts', [])
+
+
+@pytest.fixture
+def server(tmp_path):
+    bundle = FixtureBundle(str(tmp_path / 'bundle'))
+    bundle.save('sleeper', '/state/nfl', {'week': 18, 'season': 2025, 'season_type': 'post'})
+    bundle.save('sleeper', '/user/some_user', {'user_id': '42', 'display_name': 'Some User'})
+    bundle.save('sleeper', '/user/42/leagues/nfl/2025', [{'league_id': lid} for lid in LEAGUE_IDS])
+    bundle.save('sleeper', '/players/nfl', {
+        str(pid): {'first_name': 'Player', 'last_name': str(pid), 'position': 'WR', 'team': 'KC'}
+        for pid in (11, 12, 21, 22)
+    })
+    for league_id in LEAGUE_IDS:
+        record_league(bundle, league_id)
+
+    server = StandInServer(bundle).start()
+    yield server
+    server.stop()
+
+
+class TestSleeperBatchPuller:
+    """Test batch pull behavior"""
+
+    def test_pulls_every_league(self, server, tmp_path):
+        store = SleeperPlayerStore(str(tmp_path / 'players.sqlite3'))
+        batch = SleeperBatchPuller('some_user', work_dir=str(tmp_path), api_base=server.sleeper_base,
+                                   response_cache=ResponseCache(None), player_store=store,
+                                   league_concurrency=2)
+        results = batch.pull_all()
+
+        assert sorted(results) == LEAGUE_IDS
+        for league_id, path in results.items():
+            with open(path) as f:
+                data = json.load(f)
+            assert data['league']['league_id'] == league_id
+            assert data['league']['current_week'] == 2
+            week_1 = data['weekly_data'][f'sleeper.l.{league_id}.t.1']['week_1']
+            assert week_1['roster']['starters'][0]['player_name'] == 'Player 11'
+        store.close()
+
+    def test_shares_state_and_player_dump(self, server, tmp_path):
+        """NFL state and the player dump should be fetched once for the whole batch"""
+        store = SleeperPlayerStore(str(tmp_path / 'players.sqlite3'))
+        batch = SleeperBatchPuller('some_user', work_dir=str(tmp_path), api_base=server.sleeper_base,
+                                   response_cache=ResponseCache(None), player_store=store)
+        fetched = []
+        original_get = batch.session.get
+
+        def counting_get(url, **kwargs):
+            fetched.append(url[len(server.sleeper_base):])
+            return original_get(url, **kwargs)
+
+        batch.session.get = counting_get
+        batch.pull_all()
+
+        assert fetched.count('/state/nfl') == 1
+        assert fetched.count('/players/nfl') == 1
+        store.close()
+
+    def test_unknown_user(self, server, tmp_path):
+        batch = SleeperBatchPuller('nobody', work_dir=str(tmp_path), api_base=server.sleeper_base,
+                                   response_cache=ResponseCache(None),
+                                   player_store=SleeperPlayerStore(str(tmp_path / 'players.sqlite3')))
+        with pytest.raises(ValueError):
+            batch.pull_all()
+
+
+class TestSleeperResponseCache:
+    """Test which Sleeper responses are cached for good"""
+
+    def test_empty_completed_week_is_retried(self, tmp_path):
+        cache = ResponseCache(str(tmp_path / 'cache'))
+        puller = SleeperDataPuller('1001', work_dir=str(tmp_path), response_cache=cache,
+                                   api_base='http://127.0.0.1:0')
+        puller.completed_through_week = 4
+        responses = {'/league/1001/matchups/2': [], '/league/1001/matchups/3': [{'roster_id': 1}]}
+        puller._fetch = responses.get
+
+        for week in (2, 3):
+            puller._api_call(f'/league/1001/matchups/{week}', cache='matchups', week=week)
+
+        def expires_at(week):
+            path = cache._entry_path(cache.make_key('sleeper', f'/league/1001/matchups/{week}', None))
+            with open(path) as f:
+                return json.load(f)['expires_at']
+
+        assert expires_at(2) is not None
+        assert expires_at(3) is None
@@ -0,0 +1,102 @@
+"""
+Tests for the shared Sleeper player store
+
+Ensures the raw player dump is stored compactly, read back on demand,
+and that only one process claims each daily refresh.
+"""
+
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sleeper_player_store
+from sleeper_player_store import SleeperPlayerStore
+
+
+RAW_PLAYERS = {
+    '4046': {'first_name': 'Patrick', 'last_name': 'Mahomes', 'position': 'QB', 'team': 'KC',
+             'injury_status': None, 'fantasy_positions': ['QB'], 'college': 'Texas Tech',
+             'height': '74', 'search_rank': 12},
+    '6794': {'first_name': 'Justin', 'last_name': 'Jefferson', 'position': 'WR', 'team': 'MIN',
+             'injury_status': 'Questionable', 'fantasy_positions': ['WR']},
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SleeperPlayerStore(str(tmp_path / 'players.sqlite3'))
+    yield store
+    store.close()
+
+
+class TestSleeperPlayerStore:
+    """Test player store behavior"""
+
+    def test_empty_store_is_stale(self, store):
+        assert store.count() == 0
+        assert store.is_stale()
+
+    def test_refresh_keeps_only_used_fields(self, store):
+        """Fields the puller never reads should not be stored"""
+        assert store.refresh(RAW_PLAYERS) == 2
+        assert not store.is_stale()
+
+        mahomes = store.get('4046')
+        assert mahomes == {'first_name': 'Patrick', 'last_name': 'Mahomes', 'position': 'QB',
+                           'team': 'KC', 'fantasy_positions': ['QB']}
+
+    def test_get_many_and_unknown_players(self, store):
+        store.refresh(RAW_PLAYERS)
+        found = store.get_many(['4046', 6794, '9999', None])
+        assert set(found) == {'4046', '6794'}
+        assert store.get('9999') is None
+
+    def test_refresh_replaces_contents(self, store):
+        store.refresh(RAW_PLAYERS)
+        store.get('6794')
+        store.refresh({'6794': {'first_name': 'Justin', 'last_name': 'Jefferson', 'team': 'MIN'}})
+
+        assert store.count() == 1
+        assert store.get('4046') is None
+        assert store.get('6794')['team'] == 'MIN'
+
+    def test_only_one_process_claims_a_refresh(self, tmp_path):
+        """A second store on the same file should see the first claim"""
+        path = str(tmp_path / 'players.sqlite3')
+        first = SleeperPlayerStore(path)
+        second = SleeperPlayerStore(path)
+
+        assert first.claim_refresh()
+        assert not second.claim_refresh()
+
+        first.refresh(RAW_PLAYERS)
+        assert not second.is_stale()
+        assert not second.claim_refresh()
+        first.close()
+        second.close()
+
+    def test_stale_after_max_age(self, store, monkeypatch):
+        store.refresh(RAW_PLAYERS)
+        later = time.time() + 25 * 3600
+        monkeypatch.setattr(sleeper_player_store.time, 'time', lambda: later)
+        assert store.is_stale()
+
+    def test_background_refresh_starts_once_per_process(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sleeper_player_store, '_refresh_thread', None)
+        path = str(tmp_path / 'players.sqlite3')
+        fetches = []
+
+        def fetch_players():
+            fetches.append(1)
+            return RAW_PLAYERS
+
+        thread = sleeper_player_store.start_background_refresh(fetch_players, path, check_interval_seconds=60)
+        assert sleeper_player_store.start_background_refresh(fetch_players, path) is thread
+
+        deadline = time.time() + 5
+        while not fetches and time.time() < deadline:
+            time.sleep(0.01)
+        assert fetches == [1]
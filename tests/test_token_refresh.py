@@ -0,0 +1,64 @@
+"""
+Tests for OAuth token refresh
+
+Ensures an expiry reported by Yahoo forces a refresh even when the local
+token still looks valid, and that workers failing on the same token share
+one refresh.
+"""
+
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip('dotenv')
+pytest.importorskip('yahoo_oauth')
+pytest.importorskip('yahoo_fantasy_api')
+
+import api_retry
+from data_puller import FantasyWrappedDataPuller
+
+
+@pytest.fixture
+def puller(monkeypatch):
+    """A puller whose session counts refreshes and always claims a valid token"""
+    monkeypatch.setattr(api_retry.time, 'sleep', lambda seconds: None)
+    puller = FantasyWrappedDataPuller('1', 2024, api_base='http://127.0.0.1:0')
+    puller.refreshes = []
+    puller.sc = SimpleNamespace(token_is_valid=lambda: True, session=None,
+                                refresh_access_token=lambda: puller.refreshes.append(1))
+    puller._new_http_session = object
+    return puller
+
+
+def expires_once():
+    """API call that fails with an expired token once, then succeeds"""
+    failures = [RuntimeError('oauth_problem="token_expired"')]
+
+    def call():
+        if failures:
+            raise failures.pop()
+        return 'ok'
+    return call
+
+
+class TestTokenRefresh:
+    """Test forced, deduplicated token refreshes"""
+
+    def test_server_expiry_forces_refresh(self, puller):
+        session = puller.sc.session
+        assert puller._call_with_retry(expires_once()) == 'ok'
+        assert puller.refreshes == [1]
+        assert puller.sc.session is not session  # rebuilt to carry the new token
+
+    def test_one_refresh_per_generation(self, puller):
+        # Two workers whose calls failed on the same token
+        puller._refresh_token(0)
+        puller._refresh_token(0)
+        assert puller.refreshes == [1]
+
+        # A later expiry on the refreshed token refreshes again
+        assert puller._call_with_retry(expires_once()) == 'ok'
+        assert puller.refreshes == [1, 1]
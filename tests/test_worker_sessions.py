@@ -0,0 +1,90 @@
+"""
+Tests for per-worker Yahoo sessions
+
+Ensures concurrent team-week fetches each run on their own League object
+and HTTP session, and that a token refresh gives workers new sessions.
+"""
+
+import pytest
+import sys
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip('dotenv')
+pytest.importorskip('yahoo_oauth')
+pytest.importorskip('yahoo_fantasy_api')
+
+import data_puller
+from data_puller import FantasyWrappedDataPuller
+
+
+class FakeLeague:
+    """Stands in for yfa.League: keeps the session object it was built with"""
+
+    def __init__(self, sc, league_id):
+        self.sc = sc
+        self.league_id = league_id
+
+
+@pytest.fixture
+def puller(monkeypatch):
+    monkeypatch.setattr(data_puller.yfa, 'League', FakeLeague, raising=False)
+    puller = FantasyWrappedDataPuller('1', 2024, api_base='http://127.0.0.1:0', concurrency=3)
+    puller.sc = SimpleNamespace(token_is_valid=lambda: True, access_token='token-1', session=None)
+    puller.sc.refresh_access_token = lambda: setattr(puller.sc, 'access_token', 'token-2')
+    puller._new_http_session = lambda: object()
+    puller.lg = FakeLeague(puller.sc, '449.l.1')
+    return puller
+
+
+class TestWorkerSessions:
+    """Test that concurrent workers don't share League objects or HTTP sessions"""
+
+    def test_each_worker_has_its_own_session(self, puller):
+        seen = []
+
+        def fetch(team_id, week):
+            time.sleep(0.01)  # keep every worker busy so the pool starts all of them
+            seen.append((threading.get_ident(), puller.lg, puller.lg.sc.session))
+            return {}
+
+        puller._fetch_team_week = fetch
+        pending = [(f't.{t}', week) for t in range(3) for week in range(1, 5)]
+        fetched = puller._pull_weekly_data_concurrent(pending, journal=None)
+
+        assert len(fetched) == len(pending)
+        by_thread = {}
+        for thread, league, session in seen:
+            by_thread.setdefault(thread, set()).add((id(league), id(session)))
+        assert len(by_thread) > 1
+        assert all(len(objects) == 1 for objects in by_thread.values())
+        assert len(set.union(*by_thread.values())) == len(by_thread)
+        assert all(league is not puller.lg for _, league, _ in seen)
+        assert all(league.league_id == '449.l.1' for _, league, _ in seen)
+
+    def test_refresh_replaces_worker_session(self, puller):
+        worker = data_puller.WorkerSession(puller)
+        session = worker.session
+        assert worker.session is session
+        assert worker.token_is_valid()
+
+        puller._refresh_token(puller._token_generation)
+        assert worker.session is not session
+
+    def test_library_refresh_goes_through_puller(self, puller):
+        """yahoo-fantasy-api's own refresh: refresh, assign the token, assign a new session"""
+        first, second = data_puller.WorkerSession(puller), data_puller.WorkerSession(puller)
+        first.session, second.session
+
+        for worker in (first, second):
+            credentials = worker.refresh_access_token()
+            worker.access_token = credentials['access_token']
+            worker.session = new_session = object()
+            assert worker.session is new_session
+
+        assert puller._token_generation == 1  # the second worker's refresh was deduplicated
+        assert first.access_token == second.access_token == 'token-2'
@@ -6,6 +6,8 @@ Calculates ROS points for traded players with STARTED vs BENCH distinction
 import json
 from datetime import datetime
 
+from league_model import LeagueModel
+
 
 def get_week_from_timestamp(timestamp):
     """Convert timestamp to NFL week number"""
@@ -16,10 +18,14 @@ def get_week_from_timestamp(timestamp):
     return week
 
 
-def calculate_trade_impact(team_key, transactions, weekly_data, teams_data, last_regular_season_week=14):
+def calculate_trade_impact(team_key, transactions, weekly_data, teams_data, last_regular_season_week=14,
+                           model=None):
     """
     Calculate trade impact for a team
 
+    Args:
+        model: LeagueModel for weekly_data (e.g. calc.model); built here if not given
+
     Returns:
         - Total trades count
         - Net impact (total ROS)
@@ -45,6 +51,9 @@ def calculate_trade_impact(team_key, transactions, weekly_data, teams_data, last
             'trades': []
         }
 
+    if model is None:
+        model = LeagueModel(weekly_data)
+
     trade_details = []
     total_net_impact = 0
     total_started_impact = 0
@@ -69,31 +78,15 @@ def calculate_trade_impact(team_key, transactions, weekly_data, teams_data, last
             weeks_as_starter = 0
             weeks_on_bench = 0
 
-            for week in range(trade_week, last_regular_season_week + 1):  # Through end of regular season
-                week_key = f'week_{week}'
-
-                if week_key not in weekly_data.get(team_key, {}):
-                    continue
-
-                week_data = weekly_data[team_key][week_key]
-                roster = week_data.get('roster', {})
-
-                # Check if in starters (convert IDs to strings for comparison)
-                for p in roster.get('starters', []):
-                    if str(p.get('player_id')) == str(player_id):
-                        pts = float(p.get('actual_points', 0))
-                        total_pts += pts
-                        started_pts += pts
-                        weeks_as_starter += 1
-                        break
-
-                # Check if on bench (convert IDs to strings for comparison)
-                for p in roster.get('bench', []):
-                    if str(p.get('player_id')) == str(player_id):
-                        pts = float(p.get('actual_points', 0))
-                        total_pts += pts
-                        weeks_on_bench += 1
-                        break
+            # Weeks on the roster through end of regular season (occupancy index, no roster scans)
+            for _, pts, started in model.weeks_with_team(str(player_id), team_key, trade_week,
+                                                         last_regular_season_week):
+                total_pts += pts
+                if started:
+                    started_pts += pts
+                    weeks_as_starter += 1
+                else:
+                    weeks_on_bench += 1
 
             acquired_total += total_pts
             acquired_started += started_pts
@@ -122,31 +115,15 @@ def calculate_trade_impact(team_key, transactions, weekly_data, teams_data, last
             weeks_as_starter = 0
             weeks_on_bench = 0
 
-            for week in range(trade_week, last_regular_season_week + 1):
-                week_key = f'week_{week}'
-
-                if week_key not in weekly_data.get(dest_team, {}):
-                    continue
-
-                week_data = weekly_data[dest_team][week_key]
-                roster = week_data.get('roster', {})
-
-                # Check starters (convert IDs to strings for comparison)
-                for p in roster.get('starters', []):
-                    if str(p.get('player_id')) == str(player_id):
-                        pts = float(p.get('actual_points', 0))
-                        total_pts += pts
-                        started_pts += pts
-                        weeks_as_starter += 1
-                        break
-
-                # Check bench (convert IDs to strings for comparison)
-                for p in roster.get('bench', []):
-                    if str(p.get('player_id')) == str(player_id):
-                        pts = float(p.get('actual_points', 0))
-                        total_pts += pts
-                        weeks_on_bench += 1
-                        break
+            # Weeks on the roster through end of regular season (occupancy index, no roster scans)
+            for _, pts, started in model.weeks_with_team(str(player_id), dest_team, trade_week,
+                                                         last_regular_season_week):
+                total_pts += pts
+                if started:
+                    started_pts += pts
+                    weeks_as_starter += 1
+                else:
+                    weeks_on_bench += 1
 
             gave_away_total += total_pts
             gave_away_started += started_pts
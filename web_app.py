@@ -13,6 +13,8 @@ from datetime import datetime
 from urllib.parse import urlencode
 from flask import Flask, render_template_string, request, redirect, session, url_for
 import requests
+from sleeper_data_puller import fetch_players_dump
+from sleeper_player_store import start_background_refresh
 
 app = Flask(__name__)
 app.secret_key = secrets.token_hex(32)
@@ -88,6 +90,27 @@ os.makedirs(SESSIONS_DIR, exist_ok=True)
 # Session expiry time (24 hours)
 SESSION_MAX_AGE_HOURS = 24
 
+# Worker threads for the Yahoo data puller (requests still share one rate limit)
+YAHOO_PULL_CONCURRENCY = int(os.environ.get('YAHOO_PULL_CONCURRENCY', 4))
+
+# Worker threads for the Sleeper data puller (fetches all weeks in parallel waves)
+SLEEPER_PULL_CONCURRENCY = int(os.environ.get('SLEEPER_PULL_CONCURRENCY', 8))
+
+# Processes for per-team card generation in the calculator (1 = serial, 0 = one per CPU)
+CALC_WORKERS = int(os.environ.get('CALC_WORKERS', 1))
+
+
+@app.before_request
+def ensure_player_store_refresh():
+    """
+    Keep the shared Sleeper player store fresh so pulls don't download the ~5MB dump themselves
+
+    Started on a worker's first request rather than at import, so importing
+    the module (tests, CLI tools, gunicorn's master before forking) doesn't
+    start a refresh thread. Later calls return the running thread.
+    """
+    start_background_refresh(fetch_players_dump)
+
 
 def get_session_dir(session_id):
     """Get or create a session directory for a user"""
@@ -964,7 +987,8 @@ def run_sleeper_generation(job_id, league_id, session_id):
 
         # Run Sleeper data puller
         result = subprocess.run(
-            ['python3', 'sleeper_data_puller.py', '--league-id', league_id, '--output', league_file],
+            ['python3', 'sleeper_data_puller.py', '--league-id', league_id, '--output', league_file, '--compact',
+             '--concurrency', str(SLEEPER_PULL_CONCURRENCY)],
             capture_output=True, text=True, timeout=300
         )
         if result.returncode != 0:
@@ -977,8 +1001,10 @@ def run_sleeper_generation(job_id, league_id, session_id):
         generation_jobs[job_id]['message'] = 'Calculating metrics...'
         generation_jobs[job_id]['status'] = 'calculating'
 
+        # Each job's league file is new and loaded once, so no --snapshot (it would never be read back)
         result = subprocess.run(
-            ['python3', 'fantasy_wrapped_calculator.py', '--data', league_file, '--work-dir', session_dir],
+            ['python3', 'fantasy_wrapped_calculator.py', '--data', league_file, '--work-dir', session_dir,
+             '--workers', str(CALC_WORKERS)],
             capture_output=True, text=True, timeout=120
         )
         if result.returncode != 0:
@@ -1061,8 +1087,9 @@ SEASON_YEAR=2025
         with open(env_file, 'w') as f:
             f.write(env_content)
 
-        # Run data puller with --work-dir argument (can take 5-7 minutes for large leagues)
-        result = subprocess.run(['python3', 'data_puller.py', '--work-dir', session_dir],
+        # Run data puller with --work-dir argument (concurrent fetches keep large leagues under the timeout)
+        result = subprocess.run(['python3', 'data_puller.py', '--work-dir', session_dir,
+                               '--concurrency', str(YAHOO_PULL_CONCURRENCY), '--batched', '--compact'],
                               capture_output=True, text=True, timeout=600)
         if result.returncode != 0:
             generation_jobs[job_id] = {'status': 'error', 'error': result.stderr[:200]}
@@ -1072,7 +1099,9 @@ SEASON_YEAR=2025
         generation_jobs[job_id]['message'] = 'Calculating metrics...'
         generation_jobs[job_id]['status'] = 'calculating'
 
-        result = subprocess.run(['python3', 'fantasy_wrapped_calculator.py', '--data', league_file, '--work-dir', session_dir],
+        # Each job's league file is new and loaded once, so no --snapshot (it would never be read back)
+        result = subprocess.run(['python3', 'fantasy_wrapped_calculator.py', '--data', league_file, '--work-dir', session_dir,
+                               '--workers', str(CALC_WORKERS)],
                               capture_output=True, text=True, timeout=120)
         if result.returncode != 0:
             generation_jobs[job_id] = {'status': 'error', 'error': result.stderr[:200]}